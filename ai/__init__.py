@@ -10,15 +10,15 @@
 
 from .providers import get_llm_provider, get_embedding_provider, get_available_providers
 from .chains import get_chat_chain
-# from .tools import get_available_tools  # TODO: tools 모듈 구현 필요
+from .tools import get_available_tools
 from .prompts import PromptManager
 
 __all__ = [
     "get_llm_provider",
     "get_embedding_provider", 
     "get_chat_chain",
-    "get_available_providers"
+    "get_available_providers",
     # "get_rag_chain",
-    # "get_available_tools",  # TODO: tools 모듈 구현 후 주석 해제
+    "get_available_tools",
     "PromptManager",
 ] 
\ No newline at end of file
@@ -1,5 +1,11 @@
+from .agent_chain import AgentChain, get_agent_chain
 from .chat_chain import get_chat_chain
+from .summarize_chain import SummarizeChain, get_summarize_chain
 
 __all__ = [
+    "AgentChain",
+    "SummarizeChain",
+    "get_agent_chain",
     "get_chat_chain",
+    "get_summarize_chain",
 ]
\ No newline at end of file
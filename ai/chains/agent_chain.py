@@ -0,0 +1,240 @@
+"""도구 호출 에이전트 체인"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.runnables import Runnable
+
+from ai.prompts import get_prompt_manager
+from ai.providers import get_llm_provider
+from ai.tools import Tool, get_tool_registry
+from core.settings import settings
+
+# 단계 한도에 도달했을 때 최종 답변 요청
+_FINAL_ANSWER_REQUEST = "단계 한도에 도달했습니다. 더 이상 도구를 호출하지 말고 지금까지의 결과로 답변하세요."
+
+
+class AgentChain:
+    """한 턴에 여러 도구 호출을 받아 동시에 실행하는 에이전트 체인
+
+    LLM이 한 응답에서 요청한 도구 호출은 모두 동시에 실행하고, 단계별 제한 시간이
+    지나면 끝나지 않은 호출을 취소해 시간 초과 결과로 돌려줍니다. 결과가 모두
+    모이면 다음 LLM 호출을 진행하므로 LLM 왕복 수는 단계 수와 같습니다.
+
+    Args:
+        provider_name: LLM 프로바이더 이름
+        model_name: 모델 이름
+        system_message: 시스템 메시지 (기본값: tool_agent 프롬프트)
+        tools: 사용할 도구 (기본값: 로컬 도구와 이미 시작된 MCP 서버의 도구)
+        max_steps: 도구를 호출하는 최대 단계 수
+        step_timeout: 단계별 도구 실행 제한 시간(초)
+        concurrency: 단계별 동시 도구 실행 수
+        **kwargs: 추가 설정
+    """
+
+    def __init__(
+        self,
+        provider_name: Optional[str] = None,
+        model_name: Optional[str] = None,
+        system_message: Optional[str] = None,
+        tools: Optional[Sequence[Tool]] = None,
+        max_steps: Optional[int] = None,
+        step_timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ):
+        self.provider = get_llm_provider(
+            provider_name=provider_name,
+            model_name=model_name,
+            **kwargs
+        )
+        self.llm = self.provider.get_chat_model()
+        self.prompt_manager = get_prompt_manager()
+        self.system_message = system_message or self.prompt_manager.get_system_prompt("tool_agent")
+        self.tools = list(tools) if tools is not None else None
+
+        self.max_steps = max_steps or settings.AGENT_MAX_STEPS
+        self.step_timeout = step_timeout or settings.AGENT_STEP_TIMEOUT
+        self.concurrency = concurrency or settings.AGENT_TOOL_CONCURRENCY
+
+    async def ainvoke(self, messages: List[Dict[str, str]]) -> str:
+        """최종 답변 반환"""
+        answer = ""
+        async for event in self.astream(messages):
+            if event["type"] == "final":
+                answer = event["content"]
+        return answer
+
+    async def astream(self, messages: List[Dict[str, str]]) -> AsyncIterator[Dict[str, Any]]:
+        """중간 단계를 이벤트로 스트리밍
+
+        Args:
+            messages: ``role``, ``content`` 키를 가진 대화 메시지
+
+        Yields:
+            Dict[str, Any]: 단계별 ``tool_calls`` 이벤트(step, calls), 호출이 끝나는
+                순서대로 ``tool_result`` 이벤트(step, id, name, success, content,
+                execution_time), 마지막 ``final`` 이벤트(content, steps, tool_calls)
+
+        Raises:
+            ValueError: 모델이 도구 호출을 지원하지 않는 경우
+        """
+        # 도구를 지정하지 않으면 MCP 서버를 새로 시작하지 않음
+        tools = self.tools if self.tools is not None else get_tool_registry().cached_tools()
+        by_name = {item.name: item for item in tools}
+        llm: Runnable[LanguageModelInput, BaseMessage] = self.llm
+        if tools:
+            try:
+                llm = self.llm.bind_tools([item.schema() for item in tools])
+            except NotImplementedError:
+                raise ValueError(f"{type(self.llm).__name__} 모델은 도구 호출을 지원하지 않습니다")
+
+        history: List[BaseMessage] = [SystemMessage(content=self.system_message)]
+        history.extend(self._convert_messages(messages))
+
+        total_calls = 0
+        for step in range(1, self.max_steps + 1):
+            response = await llm.ainvoke(history)
+            history.append(response)
+            tool_calls = response.tool_calls if isinstance(response, AIMessage) else []
+            if not tool_calls:
+                yield {"type": "final", "content": response.text(), "steps": step, "tool_calls": total_calls}
+                return
+
+            calls: List[Dict[str, Any]] = [
+                {**call, "id": call.get("id") or f"call_{step}_{index}"}
+                for index, call in enumerate(tool_calls)
+            ]
+            total_calls += len(calls)
+            yield {
+                "type": "tool_calls",
+                "step": step,
+                "calls": [{"id": call["id"], "name": call["name"], "arguments": call["args"]} for call in calls],
+            }
+
+            results: Dict[str, Dict[str, Any]] = {}
+            async for event in self._run_tools(step, calls, by_name):
+                results[event["id"]] = event
+                yield event
+
+            # 도구 메시지는 요청 순서대로 (프로바이더가 호출 ID 순서를 요구할 수 있음)
+            history.extend(
+                ToolMessage(content=results[call["id"]]["content"], tool_call_id=call["id"])
+                for call in calls
+            )
+
+        history.append(HumanMessage(content=_FINAL_ANSWER_REQUEST))
+        response = await llm.ainvoke(history)
+        yield {"type": "final", "content": response.text(), "steps": self.max_steps + 1, "tool_calls": total_calls}
+
+    async def _run_tools(
+        self,
+        step: int,
+        calls: List[Dict[str, Any]],
+        by_name: Dict[str, Tool],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """한 단계의 도구 호출을 동시에 실행하고 끝나는 순서대로 결과 반환"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(call: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                started = time.perf_counter()
+                item = by_name.get(call["name"])
+                try:
+                    if item is None:
+                        raise LookupError(f"알 수 없는 도구: {call['name']}")
+                    content, success = await item.invoke(call["args"]), True
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    content, success = f"도구 실행 오류: {e}", False
+                return {
+                    "type": "tool_result",
+                    "step": step,
+                    "id": call["id"],
+                    "name": call["name"],
+                    "success": success,
+                    "content": content,
+                    "execution_time": time.perf_counter() - started,
+                }
+
+        tasks = {asyncio.create_task(run(call)): call for call in calls}
+        started = time.perf_counter()
+        deadline = asyncio.get_running_loop().time() + self.step_timeout
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        for task in pending:
+            call = tasks[task]
+            yield {
+                "type": "tool_result",
+                "step": step,
+                "id": call["id"],
+                "name": call["name"],
+                "success": False,
+                "content": f"도구 실행 시간이 초과되었습니다 ({self.step_timeout:g}초)",
+                "execution_time": time.perf_counter() - started,
+            }
+
+    def _convert_messages(self, messages: List[Dict[str, str]]) -> List[BaseMessage]:
+        """메시지 형식 변환"""
+        converted: List[BaseMessage] = []
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            if role == "user":
+                converted.append(HumanMessage(content=content))
+            elif role == "assistant":
+                converted.append(AIMessage(content=content))
+            elif role == "system":
+                converted.append(SystemMessage(content=content))
+        return converted
+
+
+def get_agent_chain(
+    provider_name: Optional[str] = None,
+    model_name: Optional[str] = None,
+    system_message: Optional[str] = None,
+    tools: Optional[Sequence[Tool]] = None,
+    **kwargs
+) -> AgentChain:
+    """에이전트 체인 인스턴스 생성
+
+    Args:
+        provider_name: LLM 프로바이더 이름
+        model_name: 모델 이름
+        system_message: 시스템 메시지
+        tools: 사용할 도구 (기본값: 로컬 도구와 이미 시작된 MCP 서버의 도구)
+        **kwargs: 추가 설정
+
+    Returns:
+        AgentChain: 에이전트 체인 인스턴스
+    """
+    return AgentChain(
+        provider_name=provider_name,
+        model_name=model_name,
+        system_message=system_message,
+        tools=tools,
+        **kwargs
+    )
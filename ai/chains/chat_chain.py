@@ -6,7 +6,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import RunnablePassthrough
 
 from ai.providers import get_llm_provider
-from ai.prompts import PromptManager
+from ai.prompts import get_prompt_manager
 
 
 class ChatChain:
@@ -25,7 +25,7 @@ class ChatChain:
             **kwargs
         )
         self.llm = self.provider.get_chat_model()
-        self.prompt_manager = PromptManager()
+        self.prompt_manager = get_prompt_manager()
         
         # 시스템 메시지 설정
         if system_message is None:
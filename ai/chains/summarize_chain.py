@@ -0,0 +1,222 @@
+"""맵-리듀스 문서 요약 체인"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from ai.documents import TextChunker
+from ai.prompts import get_prompt_manager
+from ai.providers import get_llm_provider
+from core.settings import settings
+
+# 맵 스테이지 종료 신호
+_DONE = None
+
+
+class SummarizeChain:
+    """대용량 문서를 위한 맵-리듀스 요약 체인
+
+    문서를 청크로 나눠 동시에 요약(map)한 뒤, 부분 요약을 ``fan_in``개씩 묶어
+    다시 요약(reduce)하는 과정을 하나가 남을 때까지 반복합니다.
+    같은 단계의 요약은 모두 병렬로 실행되므로 처리 시간은 문서 길이가 아니라
+    트리 깊이(log_fan_in(청크 수))에 비례합니다.
+
+    Args:
+        provider_name: LLM 프로바이더 이름
+        model_name: 모델 이름
+        chunk_size: 맵 단계 청크 최대 문자 수 (리듀스 입력 크기 상한이기도 함)
+        concurrency: 동시에 진행할 LLM 요청 수
+        fan_in: 리듀스 단계에서 한 번에 합칠 최대 요약 수
+        **kwargs: 추가 설정
+    """
+
+    def __init__(
+        self,
+        provider_name: Optional[str] = None,
+        model_name: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        fan_in: Optional[int] = None,
+        **kwargs
+    ):
+        self.provider = get_llm_provider(
+            provider_name=provider_name,
+            model_name=model_name,
+            **kwargs
+        )
+        self.llm = self.provider.get_chat_model()
+        self.prompt_manager = get_prompt_manager()
+        self.system_message = self.prompt_manager.get_system_prompt("document_analyzer")
+
+        self.chunk_size = chunk_size or settings.SUMMARY_CHUNK_SIZE
+        self.concurrency = concurrency or settings.SUMMARY_CONCURRENCY
+        self.fan_in = max(fan_in or settings.SUMMARY_FAN_IN, 2)
+
+    async def ainvoke(self, source: Union[str, AsyncIterator[str]]) -> str:
+        """문서 전체 요약"""
+        summary = ""
+        async for event in self.astream(source):
+            if event["type"] == "final":
+                summary = event["summary"]
+        return summary
+
+    async def astream(
+        self, source: Union[str, AsyncIterator[str]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """부분 요약이 끝나는 대로 이벤트를 스트리밍
+
+        Args:
+            source: 전체 텍스트 또는 텍스트 조각 스트림
+
+        Yields:
+            Dict[str, Any]: ``partial`` 이벤트(level, index, summary)와
+                마지막 ``final`` 이벤트(summary, levels)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        events: asyncio.Queue = asyncio.Queue()
+        producer = asyncio.create_task(self._map_stage(source, semaphore, events))
+
+        summaries: Dict[int, str] = {}
+        try:
+            while True:
+                item = await events.get()
+                if item is _DONE:
+                    break
+                index, summary = item
+                summaries[index] = summary
+                yield {"type": "partial", "level": 0, "index": index, "summary": summary}
+
+            # 맵 단계 실패 시 예외 전달
+            await producer
+        finally:
+            producer.cancel()
+
+        current = [summaries[index] for index in sorted(summaries)]
+        level = 0
+
+        while len(current) > 1:
+            level += 1
+            groups = self._group(current)
+            # 혼자 남은 요약은 다시 요약하지 않고 다음 단계로 넘김
+            reduced: List[str] = [group[0] if len(group) == 1 else "" for group in groups]
+
+            tasks = [
+                asyncio.create_task(
+                    self._summarize_indexed(index, "\n\n".join(group), semaphore)
+                )
+                for index, group in enumerate(groups)
+                if len(group) > 1
+            ]
+            try:
+                for completed in asyncio.as_completed(tasks):
+                    index, summary = await completed
+                    reduced[index] = summary
+                    yield {"type": "partial", "level": level, "index": index, "summary": summary}
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            current = reduced
+
+        yield {"type": "final", "summary": current[0] if current else "", "levels": level}
+
+    async def _map_stage(
+        self,
+        source: Union[str, AsyncIterator[str]],
+        semaphore: asyncio.Semaphore,
+        events: asyncio.Queue,
+    ):
+        """청크가 완성되는 대로 요약 태스크 시작
+
+        태스크를 만들기 전에 슬롯을 먼저 확보하므로 진행 중인 청크 수가
+        ``concurrency``로 제한되고, 입력 스트림도 그 속도에 맞춰 소비됩니다.
+        """
+        chunker = TextChunker(self.chunk_size, 0)
+
+        async def run(index: int, text: str):
+            try:
+                await events.put((index, await self._summarize(text)))
+            finally:
+                semaphore.release()
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                async for chunk in chunker.stream(_as_stream(source)):
+                    if not chunk.text:
+                        continue
+                    await semaphore.acquire()
+                    group.create_task(run(chunk.number, chunk.text))
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+        finally:
+            await events.put(_DONE)
+
+    def _group(self, summaries: List[str]) -> List[List[str]]:
+        """연속된 요약을 fan_in개 이하, chunk_size 문자 이하로 묶기
+
+        마지막 그룹을 제외하면 그룹당 최소 2개를 묶어 단계마다 요약 수가 줄어들게 합니다.
+        """
+        groups: List[List[str]] = []
+        current: List[str] = []
+        length = 0
+
+        for summary in summaries:
+            if len(current) >= 2 and (
+                len(current) >= self.fan_in or length + len(summary) > self.chunk_size
+            ):
+                groups.append(current)
+                current, length = [], 0
+            current.append(summary)
+            length += len(summary)
+
+        if current:
+            groups.append(current)
+
+        return groups
+
+    async def _summarize_indexed(
+        self, index: int, text: str, semaphore: asyncio.Semaphore
+    ) -> Tuple[int, str]:
+        async with semaphore:
+            return index, await self._summarize(text)
+
+    async def _summarize(self, text: str) -> str:
+        """텍스트 한 덩어리 요약"""
+        response = await self.llm.ainvoke([
+            SystemMessage(content=self.system_message),
+            HumanMessage(content=self.prompt_manager.get_user_prompt("summarize", text=text)),
+        ])
+        return response.text()
+
+
+async def _as_stream(source: Union[str, AsyncIterator[str]]) -> AsyncIterator[str]:
+    """문자열 또는 텍스트 스트림을 텍스트 스트림으로 통일"""
+    if isinstance(source, str):
+        yield source
+        return
+
+    async for piece in source:
+        yield piece
+
+
+def get_summarize_chain(
+    provider_name: Optional[str] = None,
+    model_name: Optional[str] = None,
+    **kwargs
+) -> SummarizeChain:
+    """요약 체인 인스턴스 생성
+
+    Args:
+        provider_name: LLM 프로바이더 이름
+        model_name: 모델 이름
+        **kwargs: 추가 설정
+
+    Returns:
+        SummarizeChain: 요약 체인 인스턴스
+    """
+    return SummarizeChain(
+        provider_name=provider_name,
+        model_name=model_name,
+        **kwargs
+    )
@@ -0,0 +1,50 @@
+"""문서 처리 모듈 (텍스트 추출, 파싱, 청킹, 중복 제거, 수집 파이프라인)"""
+
+from .chunker import Chunk, TextChunker, split_text
+from .analysis_cache import AnalysisCache, get_analysis_cache
+from .dedup import ChunkDeduplicator, MinHasher, get_deduplicator
+from .extractors import (
+    get_document_type,
+    is_text_document,
+    iter_file,
+    iter_queue,
+    iter_upload,
+    SpooledUpload,
+    spool_upload,
+    stream_text,
+    tee_stream,
+)
+from .parsing import (
+    DocumentParseTimeoutError,
+    DocumentParsingService,
+    DocumentTooLargeError,
+    get_parsing_service,
+    is_parseable_document,
+)
+from .pipeline import IngestionPipeline
+
+__all__ = [
+    "AnalysisCache",
+    "Chunk",
+    "ChunkDeduplicator",
+    "DocumentParseTimeoutError",
+    "DocumentParsingService",
+    "DocumentTooLargeError",
+    "IngestionPipeline",
+    "MinHasher",
+    "SpooledUpload",
+    "TextChunker",
+    "get_analysis_cache",
+    "get_deduplicator",
+    "get_document_type",
+    "get_parsing_service",
+    "is_parseable_document",
+    "is_text_document",
+    "iter_file",
+    "iter_queue",
+    "iter_upload",
+    "spool_upload",
+    "split_text",
+    "stream_text",
+    "tee_stream",
+]
@@ -0,0 +1,171 @@
+"""문서 분석 결과 캐시 (파일 내용 해시 기반)"""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from core.settings import settings
+
+
+class AnalysisCache:
+    """데이터베이스에 저장되는 문서 분석 결과 캐시
+
+    키는 (내용 sha256, 분석 유형, 언어, 프로바이더, 모델, 테넌트)이며,
+    TTL이 지난 항목과 최대 항목 수를 넘는 가장 오래 사용되지 않은 항목을 제거합니다.
+    데이터베이스를 사용할 수 없으면 경고만 남기고 캐시 미스로 동작합니다.
+
+    Args:
+        ttl: 항목 유지 시간(초)
+        max_entries: 최대 항목 수
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_entries: Optional[int] = None):
+        self.ttl = ttl or settings.ANALYSIS_CACHE_TTL
+        self.max_entries = max_entries or settings.ANALYSIS_CACHE_MAX_ENTRIES
+
+    @staticmethod
+    def make_key(
+        content_hash: str,
+        analysis_type: str,
+        language: str,
+        provider: Optional[str],
+        model: Optional[str],
+        tenant: Optional[str] = None,
+    ) -> str:
+        """캐시 키 생성 (지정하지 않은 프로바이더/모델/테넌트는 빈 문자열)
+
+        응답에 색인된 문서 ID가 들어 있으므로 테넌트마다 따로 캐시합니다.
+        """
+        raw = "|".join(
+            [content_hash, analysis_type, language, provider or "", model or "", tenant or ""]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 분석 응답 반환 (없거나 만료되었으면 None)"""
+        try:
+            from sqlalchemy import delete, func, select, update
+            from core.database import get_async_session
+            from models.analysis_cache import AnalysisCacheEntry
+
+            async with get_async_session() as db:
+                row = (
+                    await db.execute(
+                        select(
+                            AnalysisCacheEntry.id,
+                            AnalysisCacheEntry.expires_at,
+                            AnalysisCacheEntry.response,
+                        ).where(AnalysisCacheEntry.cache_key == cache_key)
+                    )
+                ).one_or_none()
+                if row is None:
+                    return None
+
+                entry_id, expires_at, response = row
+                now = _now()
+                if _as_utc(expires_at) <= now:
+                    await db.execute(
+                        delete(AnalysisCacheEntry).where(AnalysisCacheEntry.id == entry_id)
+                    )
+                    await db.commit()
+                    return None
+
+                await db.execute(
+                    update(AnalysisCacheEntry)
+                    .where(AnalysisCacheEntry.id == entry_id)
+                    .values(
+                        hit_count=func.coalesce(AnalysisCacheEntry.hit_count, 0) + 1,
+                        last_accessed_at=now,
+                    )
+                )
+                await db.commit()
+                return dict(response)
+        except Exception as e:
+            logger.warning(f"분석 캐시 조회 실패: {e}")
+            return None
+
+    async def set(
+        self,
+        cache_key: str,
+        response: Dict[str, Any],
+        content_hash: str,
+        analysis_type: str,
+        language: str,
+        provider: Optional[str],
+        model: Optional[str],
+    ):
+        """분석 응답 저장 후 만료/초과 항목 제거"""
+        try:
+            from sqlalchemy import delete, func, select
+            from core.database import get_async_session
+            from models.analysis_cache import AnalysisCacheEntry
+
+            now = _now()
+            async with get_async_session() as db:
+                await db.execute(
+                    delete(AnalysisCacheEntry).where(
+                        (AnalysisCacheEntry.cache_key == cache_key)
+                        | (AnalysisCacheEntry.expires_at <= now)
+                    )
+                )
+                db.add(
+                    AnalysisCacheEntry(
+                        cache_key=cache_key,
+                        content_hash=content_hash,
+                        analysis_type=analysis_type,
+                        language=language,
+                        provider=provider or "",
+                        model=model or "",
+                        response=response,
+                        hit_count=0,
+                        last_accessed_at=now,
+                        expires_at=now + timedelta(seconds=self.ttl),
+                    )
+                )
+                await db.flush()
+
+                # 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+                count = (
+                    await db.execute(select(func.count()).select_from(AnalysisCacheEntry))
+                ).scalar_one()
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    stale_ids = (
+                        await db.execute(
+                            select(AnalysisCacheEntry.id)
+                            .order_by(AnalysisCacheEntry.last_accessed_at.asc())
+                            .limit(overflow)
+                        )
+                    ).scalars().all()
+                    await db.execute(
+                        delete(AnalysisCacheEntry).where(AnalysisCacheEntry.id.in_(stale_ids))
+                    )
+
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"분석 캐시 저장 실패: {e}")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite 등 타임존을 저장하지 않는 데이터베이스 대응
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+# 전역 분석 캐시 인스턴스
+_analysis_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """문서 분석 캐시 인스턴스 반환"""
+    global _analysis_cache
+
+    if _analysis_cache is None:
+        _analysis_cache = AnalysisCache()
+
+    return _analysis_cache
@@ -0,0 +1,99 @@
+"""스트리밍 텍스트 청커"""
+
+from typing import AsyncIterator, List, NamedTuple, Optional
+
+from core.settings import settings
+
+# 청크 경계로 선호하는 구분자 (앞쪽일수록 우선)
+BREAK_SEPARATORS = ("\n\n", "\n", ". ", "다. ", "? ", "! ", " ")
+
+
+class Chunk(NamedTuple):
+    """문서 청크"""
+
+    number: int  # 문서 내 청크 순번 (0부터)
+    text: str
+    offset: int  # 문서 내 시작 문자 위치
+
+
+class TextChunker:
+    """텍스트 조각을 받는 대로 겹치는 윈도우 청크로 잘라내는 청커
+
+    버퍼에는 최대 ``chunk_size`` + 입력 조각 하나 분량만 남기므로
+    문서 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        chunk_size: 청크 최대 문자 수
+        chunk_overlap: 인접 청크 간 겹치는 문자 수
+    """
+
+    def __init__(self, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None):
+        self.chunk_size = chunk_size or settings.INGEST_CHUNK_SIZE
+        self.chunk_overlap = min(
+            chunk_overlap if chunk_overlap is not None else settings.INGEST_CHUNK_OVERLAP,
+            self.chunk_size // 4,
+        )
+        self._buffer = ""
+        self._offset = 0
+        self._index = 0
+        self._emitted_until = 0
+
+    def feed(self, text: str) -> List[Chunk]:
+        """텍스트 조각 추가 후 완성된 청크 반환"""
+        self._buffer += text
+        chunks = []
+        while len(self._buffer) >= self.chunk_size:
+            chunks.append(self._cut(self._find_break()))
+        return chunks
+
+    def flush(self) -> List[Chunk]:
+        """남은 버퍼를 마지막 청크로 반환"""
+        end = self._offset + len(self._buffer)
+        if not self._buffer.strip() or end <= self._emitted_until:
+            self._buffer = ""
+            return []
+        return [self._cut(len(self._buffer), final=True)]
+
+    async def stream(self, pieces: AsyncIterator[str]) -> AsyncIterator[Chunk]:
+        """텍스트 조각 스트림을 청크 스트림으로 변환"""
+        async for piece in pieces:
+            for chunk in self.feed(piece):
+                yield chunk
+        for chunk in self.flush():
+            yield chunk
+
+    def _find_break(self) -> int:
+        """chunk_size 이내에서 가장 자연스러운 자르기 위치"""
+        window = self._buffer[: self.chunk_size]
+        floor = self.chunk_size // 2
+        for separator in BREAK_SEPARATORS:
+            position = window.rfind(separator, floor)
+            if position != -1:
+                return position + len(separator)
+        return self.chunk_size
+
+    def _cut(self, cut: int, final: bool = False) -> Chunk:
+        chunk = Chunk(self._index, self._buffer[:cut].strip(), self._offset)
+        self._index += 1
+        self._emitted_until = self._offset + cut
+
+        if final:
+            self._offset += len(self._buffer)
+            self._buffer = ""
+        else:
+            advance = max(cut - self.chunk_overlap, 1)
+            self._buffer = self._buffer[advance:]
+            self._offset += advance
+
+        return chunk
+
+
+def split_text(
+    text: str,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: Optional[int] = None,
+) -> List[str]:
+    """전체 텍스트를 청크 문자열 목록으로 분할"""
+    chunker = TextChunker(chunk_size, chunk_overlap)
+    chunks = chunker.feed(text) + chunker.flush()
+    return [chunk.text for chunk in chunks if chunk.text]
@@ -0,0 +1,342 @@
+"""MinHash/LSH 기반 중복 청크 탐지"""
+
+import asyncio
+import re
+import weakref
+import zlib
+from typing import Any, Callable, Collection, Dict, List, NamedTuple, Optional, Set
+
+import numpy as np
+from loguru import logger
+
+from core.settings import settings
+
+# MinHash 해시 함수 계수 (a * x + b) mod p, p = 2^61 - 1
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 저장 실패 시 재시도를 위해 보관할 최대 시그니처 수
+MAX_PENDING = 100_000
+
+
+class ChunkRef(NamedTuple):
+    """시그니처 색인에 등록된 청크 참조"""
+
+    document_id: str
+    chunk_index: int
+
+
+class Duplicate(NamedTuple):
+    """중복 판정 결과"""
+
+    original: ChunkRef
+    similarity: float
+
+
+class MinHasher:
+    """문자 shingle 집합의 MinHash 시그니처 계산기
+
+    한국어는 공백 단위 토큰이 불안정하므로 정규화한 텍스트의 문자 k-gram을 사용합니다.
+    해시 계수는 시드로 고정되므로 저장된 시그니처를 프로세스 간에 비교할 수 있습니다.
+
+    Args:
+        num_perm: 해시 함수 수 (시그니처 길이)
+        shingle_size: shingle 문자 수
+        seed: 해시 계수 시드
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """정규화한 텍스트의 shingle 해시 (uint64, 32비트 값)"""
+        text = _WHITESPACE.sub(" ", text.lower()).strip()
+        k = self.shingle_size
+        if len(text) <= k:
+            grams = {text}
+        else:
+            grams = {text[i:i + k] for i in range(len(text) - k + 1)}
+        return np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+            dtype=np.uint64,
+            count=len(grams),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 시그니처 (uint32[num_perm])"""
+        hashes = self.shingles(text)
+        # a < 2^32, x < 2^32 이므로 uint64 곱셈이 넘치지 않음
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+class LSHIndex:
+    """시그니처를 band 단위로 버킷팅하는 LSH 색인
+
+    유사도가 약 (1 / bands) ** (1 / rows) 이상인 쌍이 후보로 잡히며,
+    후보만 전체 시그니처로 유사도를 추정하므로 색인 크기와 관계없이 조회가 빠릅니다.
+
+    Args:
+        num_perm: 시그니처 길이
+        bands: band 수 (num_perm의 약수)
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._signatures: List[np.ndarray] = []
+        self._refs: List[ChunkRef] = []
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def add(self, ref: ChunkRef, signature: np.ndarray):
+        """시그니처 등록"""
+        entry = len(self._refs)
+        self._refs.append(ref)
+        self._signatures.append(signature)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(entry)
+
+    def query(self, signature: np.ndarray, threshold: float) -> Optional[Duplicate]:
+        """추정 Jaccard 유사도가 threshold 이상인 가장 비슷한 청크"""
+        candidates: Set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best: Optional[Duplicate] = None
+        for entry in candidates:
+            similarity = float(np.mean(self._signatures[entry] == signature))
+            if similarity >= threshold and (best is None or similarity > best.similarity):
+                best = Duplicate(self._refs[entry], similarity)
+
+        return best
+
+    def _band_keys(self, signature: np.ndarray) -> List[int]:
+        # 버킷은 로드 시 다시 만들어지므로 프로세스별 hash()를 써도 무방
+        return [
+            hash(signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+
+class _Staged(NamedTuple):
+    """색인이 끝나기 전인 문서의 시그니처 기록"""
+
+    tenant: Optional[str]
+    signatures: LSHIndex
+    records: List[Dict[str, Any]]
+
+
+class ChunkDeduplicator:
+    """수집 파이프라인용 중복 청크 탐지기
+
+    원본 청크의 시그니처만 테넌트별 LSH 색인에 등록하고, 중복 청크는 원본 참조와 함께
+    기록합니다. 수집 중인 문서의 시그니처는 따로 모아 두었다가 문서 색인이 끝난 뒤
+    ``commit``으로 등록하므로, 색인에 실패한 청크가 원본으로 남지 않습니다.
+    등록된 시그니처는 ``flush``로 데이터베이스에 저장되며, ``load``는 지식 베이스에
+    남아 있는 문서의 시그니처만 다시 읽습니다.
+
+    Args:
+        threshold: 중복으로 판정할 추정 Jaccard 유사도
+        num_perm: 시그니처 길이
+        bands: LSH band 수
+        shingle_size: shingle 문자 수
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        num_perm: Optional[int] = None,
+        bands: Optional[int] = None,
+        shingle_size: Optional[int] = None,
+    ):
+        self.threshold = threshold if threshold is not None else settings.DEDUP_THRESHOLD
+        self.num_perm = num_perm or settings.DEDUP_NUM_PERM
+        self.bands = bands or settings.DEDUP_BANDS
+        self.hasher = MinHasher(self.num_perm, shingle_size or settings.DEDUP_SHINGLE_SIZE)
+        self.indexes: Dict[Optional[str], LSHIndex] = {}
+        self._staged: Dict[str, _Staged] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def _index(self, tenant: Optional[str]) -> LSHIndex:
+        index = self.indexes.get(tenant)
+        if index is None:
+            index = self.indexes[tenant] = LSHIndex(self.num_perm, self.bands)
+        return index
+
+    def check(
+        self,
+        ref: ChunkRef,
+        text: str,
+        source: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> Optional[Duplicate]:
+        """같은 테넌트의 청크와 비교해 중복 여부 확인 후 시그니처 기록
+
+        원본이면 None, 중복이면 원본 참조를 반환합니다. 기록은 ``commit`` 전까지
+        같은 문서 안의 비교에만 쓰입니다.
+        """
+        staged = self._staged.get(ref.document_id)
+        if staged is None:
+            staged = self._staged[ref.document_id] = _Staged(
+                tenant, LSHIndex(self.num_perm, self.bands), []
+            )
+
+        signature = self.hasher.signature(text)
+        duplicate = staged.signatures.query(signature, self.threshold)
+        if duplicate is None and tenant in self.indexes:
+            duplicate = self.indexes[tenant].query(signature, self.threshold)
+
+        if duplicate is None:
+            staged.signatures.add(ref, signature)
+
+        staged.records.append({
+            "ref": ref,
+            "tenant": tenant,
+            "source": source,
+            "signature": signature,
+            "duplicate": duplicate,
+        })
+        return duplicate
+
+    def commit(self, document_id: str):
+        """색인이 끝난 문서의 원본 시그니처를 등록하고 저장 대기열에 추가"""
+        staged = self._staged.pop(document_id, None)
+        if staged is None:
+            return
+
+        index = self._index(staged.tenant)
+        for record in staged.records:
+            if record["duplicate"] is None:
+                index.add(record["ref"], record["signature"])
+        self._pending.extend(staged.records)
+
+    def discard(self, document_id: str):
+        """색인하지 못한 문서의 시그니처 기록 삭제"""
+        self._staged.pop(document_id, None)
+
+    async def load(self, document_ids: Callable[[], Collection[str]]):
+        """지식 베이스에 남아 있는 문서의 원본 시그니처를 색인으로 로드 (최초 1회)
+
+        지식 베이스에 없는 청크를 원본으로 판정하지 않도록, 저장된 시그니처 중
+        ``document_ids``가 반환한 문서의 것만 등록합니다.
+        데이터베이스를 사용할 수 없으면 경고만 남기고 메모리 색인으로 동작합니다.
+
+        Args:
+            document_ids: 지식 베이스의 문서 ID 목록을 반환하는 함수
+        """
+        if self._loaded:
+            return
+
+        async with self._lock:
+            if self._loaded:
+                return
+
+            live = document_ids()
+            if not live:
+                self._loaded = True
+                return
+
+            try:
+                from sqlalchemy import select
+                from models.chunk_signature import ChunkSignature
+
+                async with _session() as db:
+                    result = await db.execute(
+                        select(
+                            ChunkSignature.document_id,
+                            ChunkSignature.chunk_index,
+                            ChunkSignature.tenant,
+                            ChunkSignature.signature,
+                        ).where(ChunkSignature.duplicate_of_document_id.is_(None))
+                    )
+                    rows = result.all()
+            except Exception as e:
+                logger.warning(f"청크 시그니처 로드 실패: {e}")
+                return
+
+            loaded = 0
+            for document_id, chunk_index, tenant, signature in rows:
+                if document_id not in live:
+                    continue
+                self._index(tenant).add(
+                    ChunkRef(document_id, chunk_index),
+                    np.frombuffer(signature, dtype=np.uint32),
+                )
+                loaded += 1
+
+            self._loaded = True
+            logger.info(f"청크 시그니처 {loaded}개 로드")
+
+    async def flush(self) -> int:
+        """등록된 시그니처와 중복 링크를 데이터베이스에 저장
+
+        실패하면 기록을 유지해 다음 flush에서 다시 시도합니다.
+        """
+        async with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+
+            try:
+                from models.chunk_signature import ChunkSignature
+
+                async with _session() as db:
+                    db.add_all([_to_model(ChunkSignature, record) for record in pending])
+                    await db.commit()
+            except Exception as e:
+                logger.warning(f"청크 시그니처 저장 실패: {e}")
+                self._pending = (pending + self._pending)[-MAX_PENDING:]
+                return 0
+
+            return len(pending)
+
+
+def _session():
+    """비동기 데이터베이스 세션 (워커 프로세스에서 엔진이 생성되지 않도록 지연 임포트)"""
+    from core.database import get_async_session
+
+    return get_async_session()
+
+
+def _to_model(model: Any, record: Dict[str, Any]) -> Any:
+    duplicate: Optional[Duplicate] = record["duplicate"]
+    return model(
+        document_id=record["ref"].document_id,
+        chunk_index=record["ref"].chunk_index,
+        tenant=record["tenant"],
+        source=record["source"],
+        signature=record["signature"].tobytes(),
+        duplicate_of_document_id=duplicate.original.document_id if duplicate else None,
+        duplicate_of_chunk_index=duplicate.original.chunk_index if duplicate else None,
+        similarity=duplicate.similarity if duplicate else None,
+    )
+
+
+# 지식 베이스별 중복 탐지기 (지식 베이스와 수명을 같이함)
+_deduplicators: "weakref.WeakKeyDictionary[Any, ChunkDeduplicator]" = weakref.WeakKeyDictionary()
+
+
+def get_deduplicator(knowledge_base: Any) -> ChunkDeduplicator:
+    """지식 베이스에 딸린 중복 청크 탐지기 반환
+
+    시그니처 색인은 지식 베이스의 내용과 맞아야 하므로 지식 베이스마다 따로 두며,
+    지식 베이스가 사라지면 함께 정리됩니다.
+    """
+    deduplicator = _deduplicators.get(knowledge_base)
+    if deduplicator is None:
+        deduplicator = _deduplicators[knowledge_base] = ChunkDeduplicator()
+    return deduplicator
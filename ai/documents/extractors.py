@@ -0,0 +1,140 @@
+"""스트리밍 텍스트 추출기"""
+
+import asyncio
+import codecs
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, NamedTuple, Optional, Union
+
+# 바이트 스트림을 그대로 디코딩할 수 있는 텍스트 형식
+TEXT_EXTENSIONS = {".txt", ".md", ".markdown", ".csv", ".tsv", ".json", ".log", ".html", ".xml"}
+
+# 업로드 파일을 읽는 단위 (64KB)
+READ_CHUNK_SIZE = 65536
+
+
+def get_document_type(filename: Optional[str]) -> str:
+    """파일명에서 문서 유형(확장자) 추출"""
+    return Path(filename or "").suffix.lower().lstrip(".") or "unknown"
+
+
+def is_text_document(filename: Optional[str], content_type: Optional[str] = None) -> bool:
+    """스트리밍 디코딩이 가능한 텍스트 문서인지 확인"""
+    if content_type and content_type.startswith("text/"):
+        return True
+    return Path(filename or "").suffix.lower() in TEXT_EXTENSIONS
+
+
+async def iter_upload(file: Any, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """업로드 파일을 고정 크기 블록으로 읽기 (전체를 메모리에 올리지 않음)
+
+    Args:
+        file: ``await read(size)``를 지원하는 파일 객체 (UploadFile)
+        chunk_size: 블록 크기
+    """
+    while True:
+        block = await file.read(chunk_size)
+        if not block:
+            break
+        yield block
+
+
+async def stream_text(
+    blocks: AsyncIterator[bytes], encoding: str = "utf-8"
+) -> AsyncIterator[str]:
+    """바이트 블록 스트림을 텍스트 조각 스트림으로 디코딩
+
+    증분 디코더를 사용하므로 블록 경계에서 잘린 멀티바이트 문자도 안전하게 처리합니다.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    async for block in blocks:
+        text = decoder.decode(block)
+        if text:
+            yield text
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class SpooledUpload(NamedTuple):
+    """디스크에 저장된 업로드 파일"""
+
+    path: str
+    sha256: str  # 내용 해시 (hex)
+    size: int
+
+
+async def spool_upload(file: Any, directory: Union[str, Path]) -> SpooledUpload:
+    """업로드 파일을 블록 단위로 임시 파일에 기록하면서 내용 해시 계산
+
+    응답 스트리밍이나 프로세스 풀처럼 요청 처리 이후에도 파일이 필요할 때 사용합니다.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    suffix = Path(getattr(file, "filename", "") or "").suffix.lower()
+    fd, path = tempfile.mkstemp(dir=directory, suffix=suffix)
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with os.fdopen(fd, "wb") as output:
+            async for block in iter_upload(file):
+                digest.update(block)
+                size += len(block)
+                await asyncio.to_thread(output.write, block)
+    except BaseException:
+        os.remove(path)
+        raise
+
+    return SpooledUpload(path, digest.hexdigest(), size)
+
+
+async def iter_file(
+    path: str, chunk_size: int = READ_CHUNK_SIZE, remove: bool = False
+) -> AsyncIterator[bytes]:
+    """디스크 파일을 고정 크기 블록으로 읽기
+
+    Args:
+        path: 파일 경로
+        chunk_size: 블록 크기
+        remove: 다 읽은 뒤(또는 중단 시) 파일 삭제 여부
+    """
+    try:
+        with open(path, "rb") as f:
+            while True:
+                block = await asyncio.to_thread(f.read, chunk_size)
+                if not block:
+                    break
+                yield block
+    finally:
+        if remove:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+async def tee_stream(stream: AsyncIterator[str], queue: asyncio.Queue) -> AsyncIterator[str]:
+    """스트림을 그대로 전달하면서 각 조각을 큐에도 복사 (종료 시 None)
+
+    큐가 가득 차면 대기하므로 느린 소비자 쪽에도 backpressure가 걸립니다.
+    """
+    try:
+        async for piece in stream:
+            await queue.put(piece)
+            yield piece
+    finally:
+        await queue.put(None)
+
+
+async def iter_queue(queue: asyncio.Queue) -> AsyncIterator[str]:
+    """``tee_stream``이 채우는 큐를 None이 나올 때까지 읽기"""
+    while True:
+        piece = await queue.get()
+        if piece is None:
+            break
+        yield piece
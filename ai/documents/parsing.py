@@ -0,0 +1,285 @@
+"""프로세스 풀 기반 문서 파싱 서비스"""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from core.settings import settings
+from .extractors import READ_CHUNK_SIZE, SpooledUpload, spool_upload
+
+# 프로세스 풀에서 파싱하는 형식 (CPU 바운드)
+PARSEABLE_EXTENSIONS = {".pdf", ".docx", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"}
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"}
+
+
+class DocumentParseTimeoutError(TimeoutError):
+    """문서 파싱 제한 시간 초과"""
+
+
+class DocumentTooLargeError(ValueError):
+    """문서 파싱 중 워커 메모리 상한 초과"""
+
+
+def is_parseable_document(filename: Optional[str]) -> bool:
+    """프로세스 풀 파싱 대상 문서인지 확인"""
+    return Path(filename or "").suffix.lower() in PARSEABLE_EXTENSIONS
+
+
+# ---------------------------------------------------------------------------
+# 워커 프로세스에서 실행되는 함수들 (pickle 가능해야 하므로 모듈 최상위에 정의)
+# ---------------------------------------------------------------------------
+
+def _init_worker(memory_limit_mb: int):
+    """워커 초기화: 메모리 상한 설정, 인터럽트 신호 무시"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if memory_limit_mb:
+        try:
+            import resource
+
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            # RLIMIT_AS를 지원하지 않는 플랫폼
+            pass
+
+
+def _on_timeout(signum, frame):
+    raise DocumentParseTimeoutError("문서 파싱 시간이 초과되었습니다.")
+
+
+def _limit_cpu_time(timeout: int):
+    """현재 사용량 + timeout 초로 CPU 시간 상한 설정
+
+    네이티브 코드에서 멈춰 SIGALRM이 처리되지 않아도 커널이 워커를 종료시킵니다.
+    """
+    try:
+        import resource
+
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = used + timeout + 1
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def _extract_pdf(path: str) -> Iterator[str]:
+    try:
+        from pypdf import PdfReader  # type: ignore[import-not-found]
+    except ImportError:
+        raise ValueError("PDF 파싱에는 pypdf 패키지가 필요합니다.")
+
+    for page in PdfReader(path).pages:
+        yield (page.extract_text() or "") + "\n\n"
+
+
+def _extract_docx(path: str) -> Iterator[str]:
+    try:
+        import docx  # type: ignore[import-not-found]
+    except ImportError:
+        raise ValueError("DOCX 파싱에는 python-docx 패키지가 필요합니다.")
+
+    for paragraph in docx.Document(path).paragraphs:
+        yield paragraph.text + "\n"
+
+
+def _extract_image(path: str) -> Iterator[str]:
+    try:
+        import pytesseract  # type: ignore[import-not-found]
+        from PIL import Image
+    except ImportError:
+        raise ValueError("이미지 OCR에는 pytesseract 패키지가 필요합니다.")
+
+    with Image.open(path) as image:
+        yield pytesseract.image_to_string(image, lang="kor+eng")
+
+
+def _parse_in_worker(path: str, output_dir: str, timeout: int) -> str:
+    """문서를 파싱해 추출 텍스트를 파일로 기록하고 그 경로 반환
+
+    입력/출력 모두 경로로 주고받으므로 큰 바이트열이 프로세스 간에 pickle되지 않습니다.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".pdf":
+        pieces = _extract_pdf(path)
+    elif suffix == ".docx":
+        pieces = _extract_docx(path)
+    elif suffix in IMAGE_EXTENSIONS:
+        pieces = _extract_image(path)
+    else:
+        raise ValueError(f"지원하지 않는 문서 형식: {suffix}")
+
+    fd, output_path = tempfile.mkstemp(dir=output_dir, suffix=".txt")
+
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    _limit_cpu_time(timeout)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as output:
+            for piece in pieces:
+                output.write(piece)
+    except BaseException:
+        os.remove(output_path)
+        raise
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return output_path
+
+
+# ---------------------------------------------------------------------------
+
+
+class DocumentParsingService:
+    """CPU 바운드 문서 파싱을 이벤트 루프 밖의 프로세스 풀에서 실행하는 서비스
+
+    - 워커 수는 CPU 코어 수에 맞추고, N개 작업마다 워커를 재생성해 메모리 누수를 막습니다.
+    - 작업별 시간 제한(SIGALRM + CPU 시간 상한)과 워커 메모리 상한(RLIMIT_AS)을 적용합니다.
+    - 워커가 강제 종료되어 풀이 깨지면 새 풀로 교체합니다.
+
+    Args:
+        max_workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+        max_tasks_per_child: 워커 재생성 주기 (작업 수)
+        timeout: 작업별 제한 시간(초)
+        memory_limit_mb: 워커별 메모리 상한(MB)
+        work_dir: 업로드/추출 텍스트 임시 파일 디렉토리
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        timeout: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        work_dir: Optional[str] = None,
+    ):
+        self.max_workers = max_workers or settings.DOCUMENT_PARSER_WORKERS or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child or settings.DOCUMENT_PARSER_MAX_TASKS_PER_CHILD
+        self.timeout = timeout or settings.DOCUMENT_PARSER_TIMEOUT
+        self.memory_limit_mb = (
+            memory_limit_mb if memory_limit_mb is not None
+            else settings.DOCUMENT_PARSER_MEMORY_LIMIT_MB
+        )
+        self.work_dir = Path(work_dir or settings.DOCUMENT_PARSER_WORK_DIR)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (첫 사용 시 생성)"""
+        if self._executor is None:
+            self.work_dir.mkdir(parents=True, exist_ok=True)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.memory_limit_mb,),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._executor
+
+    async def spool_upload(self, file: Any) -> SpooledUpload:
+        """업로드 파일을 작업 디렉토리에 기록하고 경로와 내용 해시 반환"""
+        return await spool_upload(file, self.work_dir)
+
+    async def parse(self, path: str) -> str:
+        """문서를 프로세스 풀에서 파싱하고 추출 텍스트 파일 경로 반환
+
+        Raises:
+            DocumentParseTimeoutError: 제한 시간 초과
+            DocumentTooLargeError: 워커 메모리 상한 초과
+            ValueError: 지원하지 않거나 파싱할 수 없는 문서
+        """
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            executor, _parse_in_worker, path, str(self.work_dir), self.timeout
+        )
+
+        try:
+            # 워커 내부 제한 시간이 먼저 동작하고, 이는 응답 없는 워커에 대한 안전장치
+            return await asyncio.wait_for(future, timeout=self.timeout + 5)
+        except DocumentParseTimeoutError:
+            # 워커가 스스로 작업을 중단했으므로 풀은 그대로 사용 (다른 작업에 영향 없음)
+            raise
+        except MemoryError:
+            raise DocumentTooLargeError("문서 파싱 중 워커 메모리 상한을 초과했습니다.")
+        except BrokenProcessPool:
+            self._reset_executor(executor)
+            raise ValueError("문서 파싱 중 워커가 종료되었습니다 (메모리 또는 시간 초과).")
+        except asyncio.TimeoutError:
+            # 응답 없는 워커는 shutdown으로 멈추지 않으므로 강제 종료
+            self._reset_executor(executor, terminate=True)
+            raise DocumentParseTimeoutError("문서 파싱 시간이 초과되었습니다.")
+
+    async def stream_text(self, path: str) -> AsyncIterator[str]:
+        """문서를 파싱한 뒤 추출 텍스트를 조각 단위로 스트리밍 (임시 파일은 정리)"""
+        try:
+            output_path = await self.parse(path)
+        finally:
+            _remove_quietly(path)
+
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                while True:
+                    piece = await asyncio.to_thread(f.read, READ_CHUNK_SIZE)
+                    if not piece:
+                        break
+                    yield piece
+        finally:
+            _remove_quietly(output_path)
+
+    def _reset_executor(self, executor: ProcessPoolExecutor, terminate: bool = False):
+        """깨졌거나 멈춘 풀을 버리고 다음 작업에서 새 풀 생성
+
+        같은 풀에서 실패한 작업이 여럿이어도 이미 교체된 새 풀은 건드리지 않도록
+        작업을 제출한 풀이 현재 풀일 때만 교체합니다.
+
+        Args:
+            executor: 작업을 제출한 풀
+            terminate: 워커 프로세스를 강제 종료할지 여부 (같은 풀의 다른 작업도 실패함)
+        """
+        if self._executor is executor:
+            self._executor = None
+
+        if terminate:
+            processes = getattr(executor, "_processes", None) or {}
+            for process in list(processes.values()):
+                if process.is_alive():
+                    process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def shutdown(self):
+        """프로세스 풀 종료"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# 전역 문서 파싱 서비스 인스턴스
+_parsing_service: Optional[DocumentParsingService] = None
+
+
+def get_parsing_service() -> DocumentParsingService:
+    """문서 파싱 서비스 인스턴스 반환"""
+    global _parsing_service
+
+    if _parsing_service is None:
+        _parsing_service = DocumentParsingService()
+
+    return _parsing_service
@@ -0,0 +1,197 @@
+"""스트리밍 문서 수집 파이프라인 (파싱 → 청킹 → 임베딩 → 색인)"""
+
+import asyncio
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ai.retrieval import KnowledgeBase, get_knowledge_base
+from core.settings import settings
+from .chunker import Chunk, TextChunker
+from .dedup import ChunkDeduplicator, ChunkRef, get_deduplicator
+
+# 스테이지 종료 신호
+_DONE = None
+
+
+class IngestionPipeline:
+    """비동기 스테이지와 제한 큐로 구성된 문서 수집 파이프라인
+
+    각 스테이지는 독립 태스크로 동시에 실행되고 제한 크기 큐로 연결됩니다.
+    텍스트 추출/청킹(CPU)과 임베딩 요청(네트워크)이 겹쳐서 진행되며,
+    하위 스테이지가 밀리면 큐가 가득 차 상위 스테이지가 대기하므로(backpressure)
+    파일 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        knowledge_base: 색인 대상 지식 베이스 (기본값: 전역 지식 베이스)
+        chunk_size: 청크 최대 문자 수
+        chunk_overlap: 인접 청크 간 겹치는 문자 수
+        batch_size: 임베딩/색인 배치 크기
+        queue_size: 스테이지 사이 큐에 쌓을 수 있는 배치 수
+        embed_concurrency: 동시에 진행할 임베딩 요청 수
+        deduplicator: 중복 청크 탐지기 (기본값: DEDUP_ENABLED이면 지식 베이스의 탐지기)
+    """
+
+    def __init__(
+        self,
+        knowledge_base: Optional[KnowledgeBase] = None,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        embed_concurrency: Optional[int] = None,
+        deduplicator: Optional[ChunkDeduplicator] = None,
+    ):
+        self.knowledge_base = (
+            knowledge_base if knowledge_base is not None else get_knowledge_base()
+        )
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.batch_size = batch_size or settings.INGEST_EMBED_BATCH_SIZE
+        self.queue_size = queue_size or settings.INGEST_QUEUE_SIZE
+        self.embed_concurrency = embed_concurrency or settings.INGEST_EMBED_CONCURRENCY
+        if deduplicator is None and settings.DEDUP_ENABLED:
+            deduplicator = get_deduplicator(self.knowledge_base)
+        self.deduplicator = deduplicator
+
+    async def run(
+        self,
+        text_stream: AsyncIterator[str],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """텍스트 스트림을 끝까지 처리하고 수집 결과 반환
+
+        Args:
+            text_stream: 추출된 텍스트 조각 스트림
+            metadata: 모든 청크에 공통으로 붙일 메타데이터
+
+        Returns:
+            Dict[str, Any]: 문서 ID, 청크 수, 문자 수, 색인된 청크 ID, 중복 청크 목록
+        """
+        metadata = dict(metadata or {})
+        metadata.setdefault("document_id", str(uuid.uuid4()))
+
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size * self.batch_size)
+        embedded_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        stats: Dict[str, Any] = {
+            "chunks": 0, "characters": 0, "batches": 0, "chunk_ids": [], "duplicates": [],
+        }
+
+        if self.deduplicator is not None:
+            await self.deduplicator.load(self.knowledge_base.document_ids)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._chunk_stage(text_stream, chunk_queue, metadata, stats))
+                for _ in range(self.embed_concurrency):
+                    group.create_task(self._embed_stage(chunk_queue, embedded_queue))
+                group.create_task(self._index_stage(embedded_queue, metadata, stats))
+            # 색인이 끝난 청크만 중복 판정의 원본으로 등록
+            if self.deduplicator is not None:
+                self.deduplicator.commit(metadata["document_id"])
+        except ExceptionGroup as e:
+            # 첫 번째 실패 원인을 그대로 전달
+            raise e.exceptions[0]
+        finally:
+            if self.deduplicator is not None:
+                self.deduplicator.discard(metadata["document_id"])
+
+        if self.deduplicator is not None:
+            await self.deduplicator.flush()
+
+        return {
+            "document_id": metadata["document_id"],
+            "chunks": stats["chunks"],
+            "characters": stats["characters"],
+            "batches": stats["batches"],
+            "chunk_ids": sorted(stats["chunk_ids"]),
+            "duplicates": stats["duplicates"],
+        }
+
+    async def _chunk_stage(
+        self,
+        text_stream: AsyncIterator[str],
+        chunk_queue: asyncio.Queue,
+        metadata: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        """텍스트 조각을 청크로 잘라 다음 스테이지로 전달 (중복 청크는 임베딩하지 않음)"""
+        chunker = TextChunker(self.chunk_size, self.chunk_overlap)
+
+        async def counted(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+            async for piece in stream:
+                stats["characters"] += len(piece)
+                yield piece
+
+        async for chunk in chunker.stream(counted(text_stream)):
+            if not chunk.text:
+                continue
+
+            if self.deduplicator is not None:
+                duplicate = self.deduplicator.check(
+                    ChunkRef(metadata["document_id"], chunk.number),
+                    chunk.text,
+                    source=metadata.get("source"),
+                    tenant=metadata.get("tenant"),
+                )
+                if duplicate is not None:
+                    stats["duplicates"].append({
+                        "chunk_index": chunk.number,
+                        "duplicate_of": duplicate.original._asdict(),
+                        "similarity": round(duplicate.similarity, 4),
+                    })
+                    continue
+
+            await chunk_queue.put(chunk)
+
+        for _ in range(self.embed_concurrency):
+            await chunk_queue.put(_DONE)
+
+    async def _embed_stage(self, chunk_queue: asyncio.Queue, embedded_queue: asyncio.Queue):
+        """청크를 배치로 모아 임베딩"""
+        embedding_provider = self.knowledge_base.embedding_provider
+        finished = False
+
+        while not finished:
+            batch: List[Chunk] = []
+            while len(batch) < self.batch_size:
+                chunk = await chunk_queue.get()
+                if chunk is _DONE:
+                    finished = True
+                    break
+                batch.append(chunk)
+
+            if batch:
+                embeddings = await embedding_provider.embed_documents(
+                    [chunk.text for chunk in batch]
+                )
+                await embedded_queue.put((batch, embeddings))
+
+        await embedded_queue.put(_DONE)
+
+    async def _index_stage(
+        self,
+        embedded_queue: asyncio.Queue,
+        metadata: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        """임베딩된 배치를 지식 베이스에 색인"""
+        remaining = self.embed_concurrency
+
+        while remaining:
+            item = await embedded_queue.get()
+            if item is _DONE:
+                remaining -= 1
+                continue
+
+            batch, embeddings = item
+            ids = await self.knowledge_base.add_texts(
+                [chunk.text for chunk in batch],
+                [
+                    {**metadata, "chunk_index": chunk.number, "offset": chunk.offset}
+                    for chunk in batch
+                ],
+                embeddings=embeddings,
+            )
+            stats["chunks"] += len(ids)
+            stats["batches"] += 1
+            stats["chunk_ids"].extend(ids)
@@ -0,0 +1,12 @@
+"""임베딩 저장 및 벡터 검색 모듈"""
+
+from .quantization import BinaryQuantizer, ScalarQuantizer
+from .vector_store import VectorStore, evaluate_recall, get_vector_store
+
+__all__ = [
+    "BinaryQuantizer",
+    "ScalarQuantizer",
+    "VectorStore",
+    "evaluate_recall",
+    "get_vector_store",
+]
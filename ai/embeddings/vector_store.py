@@ -0,0 +1,435 @@
+"""양자화 벡터 스토어"""
+
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ai.providers.base import BaseEmbeddingProvider
+from core.settings import settings
+from .quantization import (
+    CALIBRATION_SAMPLE_SIZE,
+    MIN_CALIBRATION_SIZE,
+    BinaryQuantizer,
+    ScalarQuantizer,
+    VectorLike,
+    as_matrix,
+    normalize,
+)
+
+QUANTIZATION_MODES = ("none", "int8", "binary")
+
+Quantizer = Union[ScalarQuantizer, BinaryQuantizer]
+
+# 1차 채점 시 한 번에 float32로 변환하는 행 수 (임시 메모리 상한)
+SCAN_BLOCK_SIZE = 16384
+
+
+def top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 내림차순 상위 k개 인덱스"""
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+class _GrowableArray:
+    """용량을 두 배씩 늘리는 행 단위 numpy 배열"""
+
+    def __init__(self, width: int, dtype, capacity: int = 1024):
+        shape = (capacity, width) if width else (capacity,)
+        self._data = np.zeros(shape, dtype=dtype)
+        self._size = 0
+
+    def append(self, rows: np.ndarray):
+        needed = self._size + len(rows)
+        if needed > len(self._data):
+            capacity = max(needed, len(self._data) * 2)
+            grown = np.zeros((capacity,) + self._data.shape[1:], dtype=self._data.dtype)
+            grown[: self._size] = self._data[: self._size]
+            self._data = grown
+        self._data[self._size:needed] = rows
+        self._size = needed
+
+    @property
+    def view(self) -> np.ndarray:
+        return self._data[: self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class _VectorFile:
+    """재채점용 float32 원본 벡터 디스크 저장소 (memmap)
+
+    원본은 상위 후보를 재채점할 때만 읽으므로 메모리에 상주시키지 않습니다.
+    이름 없는(unlink된) 임시 파일을 사용하므로 프로세스가 비정상 종료해도 파일이
+    남지 않습니다.
+    """
+
+    def __init__(self, directory: str, dimension: int, capacity: int = 1024):
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self._file = tempfile.TemporaryFile(dir=directory, suffix=".f32")
+        self.dimension = dimension
+        self._size = 0
+        self._capacity = 0
+        self._map = self._resize(capacity)
+
+    def _resize(self, capacity: int) -> np.memmap:
+        # 파일은 늘리기만 하므로 검색 중인 스냅샷이 잡고 있는 이전 매핑도 유효
+        self._file.truncate(capacity * self.dimension * 4)
+        self._map = np.memmap(
+            self._file, dtype=np.float32, mode="r+", shape=(capacity, self.dimension)
+        )
+        self._capacity = capacity
+        return self._map
+
+    def append(self, matrix: np.ndarray):
+        needed = self._size + len(matrix)
+        if needed > self._capacity:
+            self._resize(max(needed, self._capacity * 2))
+        self._map[self._size:needed] = matrix
+        self._size = needed
+
+    @property
+    def view(self) -> np.ndarray:
+        return self._map[: self._size]
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        return np.asarray(self._map[rows])
+
+    def close(self):
+        self._file.close()
+
+
+class _Snapshot(NamedTuple):
+    """검색 한 번이 보는 일관된 스토어 상태"""
+
+    codes: np.ndarray
+    deleted: Optional[np.ndarray]  # 삭제된 행이 없으면 None
+    quantizer: Optional[Quantizer]
+    originals: Optional[np.ndarray]
+
+
+class VectorStore:
+    """양자화 코드 기반 인메모리 벡터 스토어
+
+    1차 채점은 압축 코드(int8 내적 / 이진 해밍 거리)로 전체를 스캔하고,
+    상위 ``top_k * rescore_factor`` 후보만 float 정밀도로 재채점합니다.
+    벡터는 L2 정규화 후 저장하므로 점수는 코사인 유사도입니다.
+
+    양자화 범위는 첫 배치로 보정한 뒤 행 수가 두 배가 될 때마다, 표본이 적었거나
+    범위를 벗어난 값이 들어온 경우 다시 보정하고 기존 코드를 다시 인코딩합니다.
+    검색은 잠금 안에서 상태 스냅샷만 잡고 스캔은 잠금 밖에서 하므로 다른 스레드의
+    추가/삭제와 동시에 실행할 수 있습니다.
+
+    Args:
+        dimension: 임베딩 차원 (차원별 양자화 스케일의 크기)
+        quantization: 양자화 방식 (none, int8, binary)
+        rescore_factor: 재채점 후보 배수
+        storage_dir: float32 원본을 보관할 디렉토리 (None이면 코드 복원값으로 재채점)
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        quantization: str = "int8",
+        rescore_factor: int = 4,
+        storage_dir: Optional[str] = None,
+    ):
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"지원하지 않는 양자화 방식: {quantization}")
+
+        self.dimension = dimension
+        self.quantization = quantization
+        self.rescore_factor = max(1, rescore_factor)
+
+        self.quantizer: Optional[Quantizer]
+        if quantization == "int8":
+            self.quantizer = ScalarQuantizer(dimension)
+            self._codes = _GrowableArray(self.quantizer.code_size(), np.int8)
+        elif quantization == "binary":
+            self.quantizer = BinaryQuantizer(dimension)
+            self._codes = _GrowableArray(self.quantizer.code_size(), np.uint8)
+        else:
+            self.quantizer = None
+            self._codes = _GrowableArray(dimension, np.float32)
+
+        self._deleted = _GrowableArray(0, np.bool_)
+        self._deleted_count = 0
+        # 마지막 보정 이후 범위를 벗어난 값이 들어왔는지
+        self._clipped = False
+        self._lock = threading.RLock()
+
+        self._originals: Optional[_VectorFile] = None
+        if storage_dir and self.quantizer is not None:
+            self._originals = _VectorFile(storage_dir, dimension)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def add(self, vectors: VectorLike) -> List[int]:
+        """벡터 추가 후 할당된 행 ID 반환"""
+        matrix = normalize(as_matrix(vectors, self.dimension))
+
+        with self._lock:
+            quantizer = self.quantizer
+            if quantizer is not None:
+                self._clipped = self._clipped or not quantizer.covers(matrix)
+                if self._needs_refit(len(self._codes) + len(matrix)):
+                    quantizer = self._refit(matrix)
+
+            start = len(self._codes)
+            codes = matrix if quantizer is None else quantizer.encode(matrix)
+            self._codes.append(codes)
+            self._deleted.append(np.zeros(len(matrix), dtype=np.bool_))
+
+            if self._originals is not None:
+                self._originals.append(matrix)
+
+        return list(range(start, start + len(matrix)))
+
+    def delete(self, ids: Sequence[int]):
+        """행 삭제 (툼스톤 처리)"""
+        rows = np.asarray(ids, dtype=np.int64)
+        with self._lock:
+            deleted = self._deleted.view
+            self._deleted_count += int((~deleted[rows]).sum())
+            deleted[rows] = True
+
+    def search(
+        self,
+        query: Sequence[float],
+        top_k: int = 5,
+        mask: Optional[np.ndarray] = None,
+    ) -> List[Tuple[int, float]]:
+        """쿼리 벡터와 가장 유사한 (행 ID, 코사인 유사도) 목록
+
+        Args:
+            query: 쿼리 벡터
+            top_k: 반환할 결과 수
+            mask: 스캔 대상 행 마스크 (메타데이터 필터, None이면 전체)
+        """
+        snapshot = self._snapshot()
+        if len(snapshot.codes) == 0 or top_k <= 0:
+            return []
+
+        q = normalize(as_matrix(query, self.dimension))[0]
+        rows = self._active_rows(snapshot, mask)
+        if rows is not None and len(rows) == 0:
+            return []
+
+        if snapshot.quantizer is None:
+            ids, scores = self._first_pass(snapshot, q, rows, top_k)
+        else:
+            candidates, _ = self._first_pass(snapshot, q, rows, top_k * self.rescore_factor)
+            rescored = self._rescore(snapshot, q, candidates)
+            order = top_indices(rescored, top_k)
+            ids, scores = candidates[order], rescored[order]
+
+        return [(int(i), float(s)) for i, s in zip(ids, scores)]
+
+    def memory_usage(self) -> Dict[str, float]:
+        """메모리 사용량 (float32 대비 압축률 포함)"""
+        count = len(self)
+        row_bytes = self._codes.view.itemsize * (
+            self._codes.view.shape[1] if self._codes.view.ndim > 1 else 1
+        )
+        code_bytes = count * row_bytes
+        float_bytes = count * self.dimension * 4
+        return {
+            "vectors": count,
+            "code_bytes": code_bytes,
+            "float32_bytes": float_bytes,
+            "compression_ratio": (float_bytes / code_bytes) if code_bytes else 0.0,
+        }
+
+    def close(self):
+        """디스크 원본 파일 정리"""
+        with self._lock:
+            if self._originals is not None:
+                self._originals.close()
+                self._originals = None
+
+    def _snapshot(self) -> _Snapshot:
+        """현재 행까지의 코드/삭제 표시/양자화기 (이후 추가·재보정과 무관)
+
+        추가는 기존 행 뒤에만 쓰고 재보정은 새 배열로 교체하므로 코드는 복사하지
+        않고, 제자리에서 바뀌는 삭제 표시만 복사합니다.
+        """
+        with self._lock:
+            return _Snapshot(
+                codes=self._codes.view,
+                deleted=self._deleted.view.copy() if self._deleted_count else None,
+                quantizer=self.quantizer,
+                originals=self._originals.view if self._originals is not None else None,
+            )
+
+    def _needs_refit(self, total: int) -> bool:
+        """행 수가 마지막 보정의 두 배가 됐고 보정이 부정확할 수 있으면 재보정"""
+        quantizer = self.quantizer
+        if quantizer is None:
+            return False
+        if not quantizer.fitted:
+            return True
+        if total < 2 * quantizer.fitted_rows:
+            return False
+        if isinstance(quantizer, BinaryQuantizer) and self._originals is None:
+            # 이진 코드의 복원값으로는 임계값을 다시 학습할 수 없음
+            return False
+        return quantizer.fitted_rows < MIN_CALIBRATION_SIZE or self._clipped
+
+    def _refit(self, pending: np.ndarray) -> Quantizer:
+        """기존 행과 새 행의 표본으로 양자화기를 다시 만들고 기존 코드를 다시 인코딩"""
+        assert self.quantizer is not None
+        count = len(self._codes)
+        sample = pending
+        if count:
+            size = min(count, CALIBRATION_SAMPLE_SIZE)
+            rows = np.unique(np.linspace(0, count - 1, size).astype(np.int64))
+            sample = np.vstack([self._float_rows(rows), pending])
+        if len(sample) > CALIBRATION_SAMPLE_SIZE:
+            sample = sample[np.linspace(0, len(sample) - 1, CALIBRATION_SAMPLE_SIZE).astype(np.int64)]
+
+        quantizer = type(self.quantizer)(self.dimension).fit(sample)
+        quantizer.fitted_rows = count + len(pending)
+
+        codes = _GrowableArray(quantizer.code_size(), self._codes.view.dtype, max(1024, count))
+        for start in range(0, count, SCAN_BLOCK_SIZE):
+            block = np.arange(start, min(start + SCAN_BLOCK_SIZE, count))
+            codes.append(quantizer.encode(self._float_rows(block)))
+
+        # 검색 스냅샷이 이전 배열을 잡고 있을 수 있으므로 제자리 수정 대신 교체
+        self.quantizer, self._codes = quantizer, codes
+        self._clipped = False
+        return quantizer
+
+    def _float_rows(self, rows: np.ndarray) -> np.ndarray:
+        """행의 float 벡터 (원본이 없으면 현재 코드의 복원값)"""
+        if self._originals is not None:
+            return self._originals.take(rows)
+        assert self.quantizer is not None
+        return normalize(self.quantizer.decode(self._codes.view[rows]))
+
+    @staticmethod
+    def _active_rows(snapshot: _Snapshot, mask: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """스캔할 행 ID (삭제/필터 제외, 전체 스캔이면 None)
+
+        필터가 있으면 허용된 행만 모아서 스캔하므로 선택도가 높을수록 빨라집니다.
+        """
+        if mask is None:
+            if snapshot.deleted is None:
+                return None
+            return np.flatnonzero(~snapshot.deleted)
+
+        allowed = np.zeros(len(snapshot.codes), dtype=np.bool_)
+        size = min(len(mask), len(allowed))
+        allowed[:size] = mask[:size]
+        if snapshot.deleted is not None:
+            allowed &= ~snapshot.deleted
+        return np.flatnonzero(allowed)
+
+    @staticmethod
+    def _first_pass(
+        snapshot: _Snapshot, q: np.ndarray, rows: Optional[np.ndarray], limit: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """압축 코드로 전체 스캔 후 상위 limit개 (행 ID, 점수)"""
+        codes = snapshot.codes
+        quantizer = snapshot.quantizer
+        total = len(codes) if rows is None else len(rows)
+        scores = np.empty(total, dtype=np.float32)
+
+        if isinstance(quantizer, BinaryQuantizer):
+            query = quantizer.encode(q)[0]
+        elif isinstance(quantizer, ScalarQuantizer):
+            query = quantizer.query_weights(q)
+        else:
+            query = q
+
+        for start in range(0, total, SCAN_BLOCK_SIZE):
+            stop = min(start + SCAN_BLOCK_SIZE, total)
+            block = codes[start:stop] if rows is None else codes[rows[start:stop]]
+
+            if isinstance(quantizer, BinaryQuantizer):
+                scores[start:stop] = -quantizer.hamming_distance(block, query)
+            elif isinstance(quantizer, ScalarQuantizer):
+                scores[start:stop] = block.astype(np.float32) @ query
+            else:
+                scores[start:stop] = block @ query
+
+        top = top_indices(scores, limit)
+        ids = top if rows is None else rows[top]
+        return ids, scores[top]
+
+    @staticmethod
+    def _rescore(snapshot: _Snapshot, q: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """후보를 float 정밀도로 재채점"""
+        if snapshot.originals is not None:
+            vectors = np.asarray(snapshot.originals[ids])
+        else:
+            assert snapshot.quantizer is not None
+            vectors = normalize(snapshot.quantizer.decode(snapshot.codes[ids]))
+        return vectors @ q
+
+
+def get_vector_store(
+    embedding_provider: Optional[BaseEmbeddingProvider] = None,
+    dimension: Optional[int] = None,
+    quantization: Optional[str] = None,
+    rescore_factor: Optional[int] = None,
+    storage_dir: Optional[str] = None,
+) -> VectorStore:
+    """벡터 스토어 인스턴스 생성
+
+    Args:
+        embedding_provider: 임베딩 프로바이더 (embedding_dimension으로 차원 결정)
+        dimension: 임베딩 차원 (프로바이더 없이 직접 지정할 때)
+        quantization: 양자화 방식 (기본값: settings.VECTOR_QUANTIZATION)
+        rescore_factor: 재채점 후보 배수 (기본값: settings.VECTOR_RESCORE_FACTOR)
+        storage_dir: 원본 벡터 디렉토리 (기본값: settings.VECTOR_STORE_DIR)
+
+    Returns:
+        VectorStore: 벡터 스토어 인스턴스
+    """
+    if dimension is None:
+        if embedding_provider is None:
+            raise ValueError("embedding_provider 또는 dimension이 필요합니다.")
+        dimension = embedding_provider.embedding_dimension
+
+    return VectorStore(
+        dimension=dimension,
+        quantization=quantization or settings.VECTOR_QUANTIZATION,
+        rescore_factor=rescore_factor or settings.VECTOR_RESCORE_FACTOR,
+        storage_dir=storage_dir if storage_dir is not None else settings.VECTOR_STORE_DIR,
+    )
+
+
+def evaluate_recall(
+    store: VectorStore,
+    vectors: VectorLike,
+    queries: VectorLike,
+    top_k: int = 10,
+) -> float:
+    """양자화 검색의 recall@k 측정
+
+    Args:
+        store: 평가할 벡터 스토어 (vectors를 같은 순서로 추가한 상태)
+        vectors: 기준이 되는 float 원본 벡터
+        queries: 평가용 쿼리 벡터
+        top_k: 비교할 상위 결과 수
+
+    Returns:
+        float: 정확한 float32 검색 대비 평균 재현율 (0~1)
+    """
+    reference = normalize(as_matrix(vectors, store.dimension))
+    query_matrix = normalize(as_matrix(queries, store.dimension))
+
+    recalls = []
+    for q in query_matrix:
+        expected = set(top_indices(reference @ q, top_k).tolist())
+        found = {row_id for row_id, _ in store.search(q, top_k=top_k)}
+        recalls.append(len(expected & found) / len(expected))
+
+    return float(np.mean(recalls)) if recalls else 0.0
@@ -0,0 +1,34 @@
+"""MCP (Model Context Protocol) 클라이언트 모듈"""
+
+from .cache import ToolResultCache, canonical_arguments
+from .config import MCPServerConfig, ToolCachePolicy, load_mcp_config
+from .manager import (
+    MCPManager,
+    MCPServerNotAllowedError,
+    ToolCallOutcome,
+    get_mcp_manager,
+    tool_error_message,
+)
+from .pool import MCPServerPool
+from .schema import MCPToolValidationError, ToolSpec, compile_schema
+from .session import MCPConnectionError, MCPError, StdioSession
+
+__all__ = [
+    "MCPConnectionError",
+    "MCPError",
+    "MCPManager",
+    "MCPServerConfig",
+    "MCPServerNotAllowedError",
+    "MCPServerPool",
+    "MCPToolValidationError",
+    "StdioSession",
+    "ToolCachePolicy",
+    "ToolCallOutcome",
+    "ToolResultCache",
+    "ToolSpec",
+    "canonical_arguments",
+    "compile_schema",
+    "get_mcp_manager",
+    "load_mcp_config",
+    "tool_error_message",
+]
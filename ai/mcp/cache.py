@@ -0,0 +1,86 @@
+"""MCP 도구 결과 캐시"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Dict, Tuple
+
+from .config import ToolCachePolicy
+
+
+def canonical_arguments(arguments: Dict[str, Any]) -> str:
+    """키 순서와 공백에 무관한 인자 문자열 (캐시 키용)"""
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class ToolResultCache:
+    """도구 하나의 결과 캐시 (TTL + LRU, 동시 동일 호출은 한 번만 실행)
+
+    오류 결과(``isError``)와 예외는 캐시하지 않습니다. 반환값은 호출자 간에
+    공유되므로 수정하지 않아야 합니다.
+
+    Args:
+        policy: TTL과 최대 항목 수
+    """
+
+    def __init__(self, policy: ToolCachePolicy):
+        self.policy = policy
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Coroutine[Any, Any, Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """캐시된 결과 반환, 없으면 호출 (진행 중인 같은 호출이 있으면 그 결과를 공유)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.create_task(call())
+            self._inflight[key] = task
+            generation = self._generation
+            task.add_done_callback(lambda done: self._store(key, done, generation))
+
+        # 한 호출자가 취소되어도 다른 대기자를 위해 호출은 계속 진행
+        return await asyncio.shield(task)
+
+    def clear(self):
+        """모든 결과 삭제 (진행 중인 호출의 결과도 저장하지 않음)"""
+        self._entries.clear()
+        self._generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _store(self, key: str, task: asyncio.Task, generation: int):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None or generation != self._generation:
+            return
+        result = task.result()
+        if result.get("isError"):
+            return
+
+        self._entries[key] = (time.monotonic() + self.policy.ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.policy.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,108 @@
+"""MCP 서버 설정 로드"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+from core.settings import settings
+
+# ${VAR} 형식의 환경 변수 참조
+_ENV_REFERENCE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def expand_env(value: str) -> str:
+    """``${VAR}``를 환경 변수(없으면 같은 이름의 설정값)로 치환"""
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name in os.environ:
+            return os.environ[name]
+        configured = getattr(settings, name, None)
+        if configured is not None:
+            return str(configured)
+        logger.warning(f"MCP 설정의 환경 변수 '{name}'가 정의되지 않았습니다.")
+        return ""
+
+    return _ENV_REFERENCE.sub(replace, value)
+
+
+class ToolCachePolicy(NamedTuple):
+    """도구 결과 캐시 설정"""
+
+    ttl: float
+    max_entries: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ToolCachePolicy":
+        ttl = float(data["ttl"])
+        if ttl <= 0:
+            raise ValueError("캐시 ttl은 0보다 커야 합니다.")
+        return cls(ttl, max(int(data.get("maxEntries", settings.MCP_TOOL_CACHE_MAX_ENTRIES)), 1))
+
+
+@dataclass
+class MCPServerConfig:
+    """MCP 서버 하나의 실행 설정"""
+
+    name: str
+    command: str
+    args: List[str] = field(default_factory=list)
+    env: Dict[str, str] = field(default_factory=dict)
+    cwd: Optional[str] = None
+    pool_size: int = 1
+    idle_timeout: float = 300.0
+    request_timeout: float = 30.0
+    startup_timeout: float = 30.0
+    # 결과를 캐시할 도구 (opt-in)
+    cache: Dict[str, ToolCachePolicy] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "MCPServerConfig":
+        if not isinstance(data, dict) or not data.get("command"):
+            raise ValueError(f"MCP 서버 '{name}'에 command가 없습니다.")
+        return cls(
+            name=name,
+            command=expand_env(str(data["command"])),
+            args=[expand_env(str(arg)) for arg in data.get("args", [])],
+            env={key: expand_env(str(value)) for key, value in (data.get("env") or {}).items()},
+            cwd=data.get("cwd"),
+            pool_size=max(int(data.get("poolSize", settings.MCP_POOL_SIZE)), 1),
+            idle_timeout=float(data.get("idleTimeout", settings.MCP_IDLE_TIMEOUT)),
+            request_timeout=float(data.get("requestTimeout", settings.MCP_REQUEST_TIMEOUT)),
+            startup_timeout=float(data.get("startupTimeout", settings.MCP_STARTUP_TIMEOUT)),
+            cache={
+                tool: ToolCachePolicy.from_dict(policy)
+                for tool, policy in (data.get("cache") or {}).items()
+            },
+        )
+
+
+def load_mcp_config(path: Optional[str] = None) -> Dict[str, MCPServerConfig]:
+    """MCP 서버 설정 파일 로드 (``mcpServers`` 형식)
+
+    Args:
+        path: 설정 파일 경로 (기본값: MCP_SERVERS_CONFIG_PATH)
+
+    Returns:
+        Dict[str, MCPServerConfig]: 서버 이름별 설정 (파일이 없으면 빈 딕셔너리)
+    """
+    config_file = Path(path or settings.MCP_SERVERS_CONFIG_PATH)
+    if not config_file.exists():
+        logger.warning(f"MCP 서버 설정 파일이 없습니다: {config_file}")
+        return {}
+
+    with open(config_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    servers = {}
+    for name, server in (data.get("mcpServers") or {}).items():
+        try:
+            servers[name] = MCPServerConfig.from_dict(name, server)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"MCP 서버 '{name}' 설정 오류: {e}")
+    return servers
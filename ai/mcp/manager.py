@@ -0,0 +1,228 @@
+"""MCP 서버 관리자"""
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from loguru import logger
+
+from core.settings import settings
+from .config import MCPServerConfig, load_mcp_config
+from .pool import MCPServerPool
+from .session import MCPError
+
+
+class MCPServerNotAllowedError(MCPError):
+    """허용 목록(MCP_ALLOWED_SERVERS)에 없는 서버를 사용하려는 경우"""
+
+
+class ToolCallOutcome(NamedTuple):
+    """일괄 호출 중 한 도구 호출의 결과 (position은 요청 목록에서의 위치)"""
+
+    position: int
+    server: str
+    tool: str
+    result: Optional[Dict[str, Any]]
+    error: Optional[BaseException]
+    execution_time: float
+
+
+def tool_error_message(result: Dict[str, Any]) -> str:
+    """도구 오류 결과(``isError``)의 텍스트 내용"""
+    texts = [
+        item.get("text", "")
+        for item in result.get("content") or []
+        if item.get("type") == "text"
+    ]
+    return "\n".join(texts) or "도구 실행 오류"
+
+
+class MCPManager:
+    """설정된 MCP 서버들의 세션 풀 관리
+
+    서버 프로세스는 첫 호출 때 시작되고 유휴 시간이 지나면 종료되므로, 설정된 서버
+    수가 늘어도 앱 시작 시간과 워커 메모리는 늘지 않습니다. 허용 목록에 없는 서버는
+    시작하거나 호출할 수 없습니다.
+
+    Args:
+        config_path: 서버 설정 파일 경로 (기본값: MCP_SERVERS_CONFIG_PATH)
+        allowed_servers: 사용을 허용할 서버 이름 (``*``는 전체, 기본값: MCP_ALLOWED_SERVERS)
+    """
+
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        allowed_servers: Optional[Sequence[str]] = None,
+    ):
+        self.config_path = config_path or settings.MCP_SERVERS_CONFIG_PATH
+        self.servers: Dict[str, MCPServerConfig] = load_mcp_config(self.config_path)
+        if allowed_servers is None:
+            allowed_servers = [
+                name.strip() for name in settings.MCP_ALLOWED_SERVERS.split(",") if name.strip()
+            ]
+        self._allowed: Set[str] = set(allowed_servers)
+        self._pools: Dict[str, MCPServerPool] = {
+            name: MCPServerPool(config) for name, config in self.servers.items()
+        }
+        self._reaper_task: Optional[asyncio.Task] = None
+
+    def is_allowed(self, server: str) -> bool:
+        """허용 목록에 있는 서버인지 여부"""
+        return "*" in self._allowed or server in self._allowed
+
+    @property
+    def allowed_servers(self) -> List[str]:
+        """설정된 서버 중 사용이 허용된 서버"""
+        return [name for name in self.servers if self.is_allowed(name)]
+
+    def pool(self, server: str) -> MCPServerPool:
+        """서버의 세션 풀 반환
+
+        Raises:
+            KeyError: 설정에 없는 서버
+            MCPServerNotAllowedError: 허용 목록에 없는 서버
+        """
+        if server not in self._pools:
+            raise KeyError(f"MCP 서버 '{server}'가 설정되어 있지 않습니다.")
+        if not self.is_allowed(server):
+            raise MCPServerNotAllowedError(
+                f"MCP 서버 '{server}'는 허용 목록(MCP_ALLOWED_SERVERS)에 없습니다."
+            )
+        return self._pools[server]
+
+    async def start(self):
+        """유휴 세션 정리 작업 시작 (서버는 첫 호출 때 시작)"""
+        timeouts = [pool.config.idle_timeout for pool in self._pools.values() if pool.config.idle_timeout > 0]
+        if timeouts and (self._reaper_task is None or self._reaper_task.done()):
+            interval = min(max(min(timeouts) / 4, 1.0), 60.0)
+            self._reaper_task = asyncio.create_task(self._reap_loop(interval))
+        logger.info(
+            f"MCP 서버 {len(self._pools)}개 설정, {len(self.allowed_servers)}개 허용 (첫 호출 시 시작)"
+        )
+
+    async def _reap_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            for pool in self._pools.values():
+                try:
+                    await pool.reap_idle()
+                except Exception as e:
+                    logger.error(f"MCP 서버 '{pool.name}' 유휴 세션 정리 실패: {e}")
+
+    async def call_tool(
+        self,
+        server: str,
+        tool: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """도구 호출
+
+        Args:
+            server: 서버 이름
+            tool: 도구 이름
+            arguments: 도구 인자
+            timeout: 제한 시간(초, 기본값: 서버 설정)
+
+        Returns:
+            Dict[str, Any]: ``tools/call`` 결과 (``content``, ``isError`` 등)
+        """
+        return await self.pool(server).call_tool(tool, arguments, timeout=timeout)
+
+    async def call_batch(
+        self,
+        calls: Sequence[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        server_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[ToolCallOutcome]:
+        """여러 도구 호출을 동시에 실행하고 끝나는 순서대로 반환
+
+        서버별 동시 실행 수를 먼저 제한한 뒤 전체 동시 실행 수를 제한하므로, 한
+        서버에 몰린 호출이 다른 서버 호출의 자리를 차지하지 않습니다.
+
+        Args:
+            calls: ``server``, ``tool``, ``arguments`` 키를 가진 호출 목록
+            concurrency: 전체 동시 실행 수 (기본값: MCP_BATCH_CONCURRENCY)
+            server_concurrency: 서버별 동시 실행 수 (기본값: MCP_BATCH_SERVER_CONCURRENCY)
+
+        Yields:
+            ToolCallOutcome: 호출 결과 (실패하면 ``error``에 예외)
+        """
+        overall = asyncio.Semaphore(concurrency or settings.MCP_BATCH_CONCURRENCY)
+        limit = server_concurrency or settings.MCP_BATCH_SERVER_CONCURRENCY
+        per_server: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(limit))
+        outcomes: asyncio.Queue = asyncio.Queue()
+
+        async def run(position: int, call: Dict[str, Any]):
+            server, tool = call["server"], call["tool"]
+            async with per_server[server], overall:
+                started = time.perf_counter()
+                try:
+                    result, error = await self.call_tool(server, tool, call.get("arguments")), None
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    result, error = None, e
+                await outcomes.put(
+                    ToolCallOutcome(position, server, tool, result, error, time.perf_counter() - started)
+                )
+
+        tasks = [asyncio.create_task(run(index, call)) for index, call in enumerate(calls)]
+        try:
+            for _ in tasks:
+                yield await outcomes.get()
+        finally:
+            # 클라이언트 연결이 끊기면 남은 호출 취소
+            for task in tasks:
+                task.cancel()
+
+    async def list_tools(self, server: str) -> List[Dict[str, Any]]:
+        """서버의 도구 목록 (첫 연결 후 캐시)"""
+        return await self.pool(server).list_tools()
+
+    def list_servers(self, detailed: bool = True) -> List[Dict[str, Any]]:
+        """서버 설정과 상태 목록
+
+        Args:
+            detailed: 실행 명령과 프로세스 ID 포함 여부
+        """
+        servers = []
+        for name, pool in self._pools.items():
+            status = pool.status()
+            server = {
+                "name": name,
+                "command": pool.config.command,
+                "allowed": self.is_allowed(name),
+                "status": "running" if status["live_sessions"] else "idle",
+                **status,
+            }
+            if not detailed:
+                del server["command"], server["pids"]
+            servers.append(server)
+        return servers
+
+    async def shutdown(self):
+        """모든 서버 종료"""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+        await asyncio.gather(*(pool.close() for pool in self._pools.values()))
+
+
+# 전역 MCP 관리자 인스턴스
+_mcp_manager: Optional[MCPManager] = None
+
+
+def get_mcp_manager() -> MCPManager:
+    """MCP 관리자 인스턴스 반환"""
+    global _mcp_manager
+
+    if _mcp_manager is None:
+        _mcp_manager = MCPManager()
+
+    return _mcp_manager
@@ -0,0 +1,244 @@
+"""MCP 서버별 세션 풀"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .cache import ToolResultCache, canonical_arguments
+from .config import MCPServerConfig
+from .schema import MCPToolValidationError, ToolSpec
+from .session import MCPConnectionError, StdioSession
+
+# 재시작 실패 시 대기 시간 (지수 증가, 최대값)
+RESTART_BACKOFF_BASE = 1.0
+RESTART_BACKOFF_MAX = 60.0
+
+
+class MCPServerPool:
+    """MCP 서버 하나에 대한 프로세스(세션) 풀
+
+    - 첫 호출 때 세션 하나를 시작하고, 모든 세션이 요청을 처리 중이면 ``pool_size``까지
+      백그라운드로 늘립니다. 시작은 한 번에 하나만 진행되며 동시에 들어온 첫 호출들은
+      같은 시작을 기다립니다.
+    - 각 세션은 요청 ID로 다중화되므로 대여/반납 없이 진행 중인 요청이 가장 적은
+      세션을 골라 씁니다.
+    - 종료된(충돌한) 세션 자리는 다음 호출 때 다시 채우며, 시작이 연속으로 실패하면
+      재시도 간격을 늘립니다.
+    - ``idle_timeout`` 동안 쓰이지 않은 세션은 ``reap_idle``에서 종료합니다.
+    - 도구 목록은 첫 세션 시작 때 받아 입력 스키마를 검증기로 컴파일해 두고, 서버
+      재시작이나 ``tools/list_changed`` 알림 때 갱신합니다. 잘못된 인자는 서버에
+      보내기 전에 거부합니다.
+    - 설정에서 캐시를 켠 도구는 (도구, 정규화한 인자)별로 결과를 TTL 동안 재사용하고,
+      동시에 들어온 같은 호출은 한 번만 실행합니다.
+
+    Args:
+        config: 서버 실행 설정
+    """
+
+    def __init__(self, config: MCPServerConfig):
+        self.config = config
+        self._sessions: List[Optional[StdioSession]] = [None] * config.pool_size
+        self._starting: Optional[asyncio.Task] = None
+        self._failures = 0
+        self._retry_at = 0.0
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self.tools: Optional[Dict[str, ToolSpec]] = None
+        self.catalog_version = 0
+        self._catalog_task: Optional[asyncio.Task] = None
+        self._result_caches: Dict[str, ToolResultCache] = {
+            tool: ToolResultCache(policy) for tool, policy in config.cache.items()
+        }
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def live_sessions(self) -> List[StdioSession]:
+        return [session for session in self._sessions if session is not None and not session.closed]
+
+    async def session(self) -> StdioSession:
+        """진행 중인 요청이 가장 적은 세션 반환 (필요하면 시작)
+
+        Raises:
+            MCPConnectionError: 세션을 시작할 수 없는 경우
+        """
+        live = self.live_sessions
+        if not live:
+            starting = self._grow()
+            if starting is not None:
+                # 호출자가 취소되어도 시작은 계속 진행
+                await asyncio.wait([starting])
+                live = self.live_sessions
+            if not live:
+                raise MCPConnectionError(
+                    f"MCP 서버 '{self.name}'를 시작할 수 없습니다: {self.last_error or '재시작 대기 중'}"
+                )
+        elif len(live) < len(self._sessions) and all(session.in_flight for session in live):
+            self._grow()
+
+        return min(live, key=lambda session: session.in_flight)
+
+    async def call_tool(
+        self,
+        tool: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """도구 호출 (실행 중 서버가 종료되면 MCPConnectionError, 재시도하지 않음)
+
+        Raises:
+            MCPToolValidationError: 없는 도구이거나 인자가 입력 스키마에 맞지 않는 경우
+        """
+        arguments = arguments or {}
+        # 도구 목록이 캐시되어 있으면 세션을 깨우기 전에 검증
+        if self.tools is None:
+            await self.session()
+            if self.tools is None:
+                await self.refresh_catalog()
+        self.validate(tool, arguments)
+
+        cache = self._result_caches.get(tool)
+        if cache is None:
+            return await self._call(tool, arguments, timeout)
+        return await cache.get_or_call(
+            canonical_arguments(arguments), lambda: self._call(tool, arguments, timeout)
+        )
+
+    async def _call(self, tool: str, arguments: Dict[str, Any], timeout: Optional[float]) -> Dict[str, Any]:
+        session = await self.session()
+        return await session.call_tool(tool, arguments, timeout=timeout)
+
+    def validate(self, tool: str, arguments: Dict[str, Any]):
+        """캐시된 스키마로 인자 검증 (도구 목록이 없으면 검증하지 않음)"""
+        if self.tools is None:
+            return
+        spec = self.tools.get(tool)
+        if spec is None:
+            raise MCPToolValidationError(f"MCP 서버 '{self.name}'에 도구 '{tool}'가 없습니다")
+        if spec.validate is not None:
+            spec.validate(arguments)
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        """캐시된 도구 목록"""
+        if self.tools is None:
+            await self.session()
+            if self.tools is None:
+                await self.refresh_catalog()
+        return [spec.info() for spec in (self.tools or {}).values()]
+
+    async def refresh_catalog(self):
+        """도구 목록 갱신 (동시 요청은 하나의 갱신을 공유, 실패하면 기존 목록 유지)"""
+        if self._catalog_task is None or self._catalog_task.done():
+            self._catalog_task = asyncio.create_task(self._refresh_catalog())
+        await asyncio.wait([self._catalog_task])
+
+    async def _refresh_catalog(self, session: Optional[StdioSession] = None):
+        try:
+            session = session or await self.session()
+            tools = await session.list_tools()
+        except Exception as e:
+            logger.error(f"MCP 서버 '{self.name}' 도구 목록 조회 실패: {e}")
+            return
+        self.tools = {tool["name"]: ToolSpec.from_tool(tool) for tool in tools if "name" in tool}
+        self.catalog_version += 1
+        # 서버가 재시작되었거나 도구가 바뀌었으므로 이전 결과는 버림
+        for cache in self._result_caches.values():
+            cache.clear()
+        logger.info(f"MCP 서버 '{self.name}' 도구 {len(self.tools)}개 로드")
+
+    def _on_notification(self, method: str, params: Dict[str, Any]):
+        if method == "notifications/tools/list_changed":
+            self._catalog_task = asyncio.create_task(self._refresh_catalog())
+
+    async def reap_idle(self, now: Optional[float] = None) -> int:
+        """유휴 시간이 지난 세션 종료
+
+        Returns:
+            int: 종료한 세션 수
+        """
+        if self.config.idle_timeout <= 0:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        idle = []
+        for slot, session in enumerate(self._sessions):
+            if (
+                session is not None
+                and not session.closed
+                and session.in_flight == 0
+                and now - session.last_used >= self.config.idle_timeout
+            ):
+                self._sessions[slot] = None
+                idle.append(session)
+
+        if idle:
+            await asyncio.gather(*(session.close() for session in idle), return_exceptions=True)
+            logger.info(f"MCP 서버 '{self.name}' 유휴 세션 {len(idle)}개 종료")
+        return len(idle)
+
+    async def close(self):
+        """모든 세션 종료"""
+        if self._starting is not None and not self._starting.done():
+            self._starting.cancel()
+        sessions = [session for session in self._sessions if session is not None]
+        self._sessions = [None] * len(self._sessions)
+        await asyncio.gather(*(session.close() for session in sessions), return_exceptions=True)
+
+    def status(self) -> Dict[str, Any]:
+        live = self.live_sessions
+        return {
+            "pool_size": len(self._sessions),
+            "idle_timeout": self.config.idle_timeout,
+            "live_sessions": len(live),
+            "in_flight": sum(session.in_flight for session in live),
+            "pids": [session.pid for session in live],
+            "restarts": self.restarts,
+            "last_error": self.last_error,
+            "result_cache": {tool: cache.stats() for tool, cache in self._result_caches.items()},
+        }
+
+    def _grow(self) -> Optional[asyncio.Task]:
+        """빈 자리에 세션 하나 시작 (진행 중인 시작이 있으면 그것을 반환)"""
+        if self._starting is not None and not self._starting.done():
+            return self._starting
+        if time.monotonic() < self._retry_at:
+            return None
+
+        for slot, session in enumerate(self._sessions):
+            if session is None or session.closed:
+                self._starting = asyncio.create_task(self._start_slot(slot))
+                return self._starting
+        return None
+
+    async def _start_slot(self, slot: int):
+        current = self._sessions[slot]
+        if current is not None:
+            # 충돌로 종료된 세션 교체
+            await current.close()
+            self.restarts += 1
+
+        session = StdioSession(self.config, on_notification=self._on_notification)
+        try:
+            await session.start()
+        except Exception as e:
+            self._failures += 1
+            delay = min(RESTART_BACKOFF_BASE * 2 ** (self._failures - 1), RESTART_BACKOFF_MAX)
+            self._retry_at = time.monotonic() + delay
+            self.last_error = str(e) or type(e).__name__
+            self._sessions[slot] = None
+            logger.error(f"MCP 서버 '{self.name}' 시작 실패 ({delay:.0f}초 후 재시도): {self.last_error}")
+            return
+
+        self._failures = 0
+        self._retry_at = 0.0
+        self.last_error = None
+        self._sessions[slot] = session
+        logger.info(f"MCP 서버 '{self.name}' 세션 시작 (pid={session.pid})")
+
+        # 첫 시작이나 재시작(서버가 바뀌었을 수 있음) 때 도구 목록 갱신
+        if self.tools is None or current is not None:
+            await self._refresh_catalog(session)
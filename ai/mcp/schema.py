@@ -0,0 +1,206 @@
+"""MCP 도구 입력 스키마 검증"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+from .session import MCPError
+
+# JSON-RPC invalid params
+INVALID_PARAMS = -32602
+
+Validator = Callable[[Any], None]
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "integer": lambda value: (
+        isinstance(value, int) and not isinstance(value, bool)
+        or isinstance(value, float) and value.is_integer()
+    ),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+}
+
+
+class MCPToolValidationError(MCPError):
+    """도구 인자가 입력 스키마에 맞지 않거나 도구가 없는 경우"""
+
+    def __init__(self, message: str):
+        super().__init__(message, code=INVALID_PARAMS)
+
+
+class ToolSpec(NamedTuple):
+    """캐시된 도구 정의와 컴파일된 입력 검증기"""
+
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    validate: Optional[Validator]
+
+    @classmethod
+    def from_tool(cls, tool: Dict[str, Any]) -> "ToolSpec":
+        schema = tool.get("inputSchema") or {}
+        return cls(tool["name"], tool.get("description", ""), schema, compile_schema(schema, tool["name"]))
+
+    def info(self) -> Dict[str, Any]:
+        return {"name": self.name, "description": self.description, "inputSchema": self.input_schema}
+
+
+def _compile(schema: Any, path: str) -> Optional[Validator]:
+    """JSON Schema 일부 키워드를 검사 함수로 컴파일 (fastjsonschema가 없을 때 사용)
+
+    지원하지 않는 키워드는 무시하므로 유효한 인자를 거부하지는 않습니다.
+    """
+    if not isinstance(schema, dict):
+        return None
+
+    checks: List[Validator] = []
+
+    types = schema.get("type")
+    if types is not None:
+        names = [types] if isinstance(types, str) else list(types)
+        known = [_TYPE_CHECKS[name] for name in names if name in _TYPE_CHECKS]
+        if known and len(known) == len(names):
+            expected = " 또는 ".join(names)
+
+            def check_type(value, known=known, expected=expected):
+                if not any(check(value) for check in known):
+                    raise MCPToolValidationError(f"{path}: {expected} 타입이어야 합니다")
+
+            checks.append(check_type)
+
+    if "enum" in schema:
+        choices = schema["enum"]
+
+        def check_enum(value):
+            if value not in choices:
+                raise MCPToolValidationError(f"{path}: {choices} 중 하나여야 합니다")
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value):
+            if value != constant:
+                raise MCPToolValidationError(f"{path}: {constant!r}이어야 합니다")
+
+        checks.append(check_const)
+
+    for keyword, compare, message in (
+        ("minimum", lambda value, limit: value >= limit, "이상"),
+        ("maximum", lambda value, limit: value <= limit, "이하"),
+    ):
+        if keyword in schema:
+            limit = schema[keyword]
+
+            def check_bound(value, limit=limit, compare=compare, message=message):
+                if _TYPE_CHECKS["number"](value) and not compare(value, limit):
+                    raise MCPToolValidationError(f"{path}: {limit} {message}이어야 합니다")
+
+            checks.append(check_bound)
+
+    for keyword, kind, compare, message in (
+        ("minLength", str, lambda size, limit: size >= limit, "이상"),
+        ("maxLength", str, lambda size, limit: size <= limit, "이하"),
+        ("minItems", list, lambda size, limit: size >= limit, "이상"),
+        ("maxItems", list, lambda size, limit: size <= limit, "이하"),
+    ):
+        if keyword in schema:
+            limit = schema[keyword]
+
+            def check_size(value, limit=limit, kind=kind, compare=compare, message=message):
+                if isinstance(value, kind) and not compare(len(value), limit):
+                    raise MCPToolValidationError(f"{path}: 길이가 {limit} {message}이어야 합니다")
+
+            checks.append(check_size)
+
+    required = schema.get("required")
+    if required:
+        def check_required(value, required=tuple(required)):
+            if isinstance(value, dict):
+                missing = [name for name in required if name not in value]
+                if missing:
+                    raise MCPToolValidationError(f"{path}: 필수 인자 누락 {missing}")
+
+        checks.append(check_required)
+
+    properties = {
+        name: validator
+        for name, sub in (schema.get("properties") or {}).items()
+        if (validator := _compile(sub, f"{path}.{name}")) is not None
+    }
+    additional = schema.get("additionalProperties", True)
+    known_names = frozenset((schema.get("properties") or {}).keys())
+    additional_validator = _compile(additional, f"{path}.*") if isinstance(additional, dict) else None
+
+    if properties or additional is False or additional_validator is not None:
+        def check_properties(value):
+            if not isinstance(value, dict):
+                return
+            for name, item in value.items():
+                validator = properties.get(name)
+                if validator is not None:
+                    validator(item)
+                elif name not in known_names:
+                    if additional is False:
+                        raise MCPToolValidationError(f"{path}: 허용되지 않는 인자 '{name}'")
+                    if additional_validator is not None:
+                        additional_validator(item)
+
+        checks.append(check_properties)
+
+    items = _compile(schema.get("items"), f"{path}[]")
+    if items is not None:
+        def check_items(value):
+            if isinstance(value, list):
+                for item in value:
+                    items(item)
+
+        checks.append(check_items)
+
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value):
+        for check in checks:
+            check(value)
+
+    return check_all
+
+
+def compile_schema(schema: Optional[Dict[str, Any]], name: str = "arguments") -> Optional[Validator]:
+    """입력 스키마를 검증 함수로 컴파일
+
+    fastjsonschema가 설치되어 있으면 사용하고, 없으면 주요 키워드만 검사하는
+    내장 검증기를 사용합니다.
+
+    Returns:
+        Optional[Validator]: 검증 함수 (검사할 것이 없으면 None)
+    """
+    if not schema:
+        return None
+
+    try:
+        import fastjsonschema  # type: ignore[import-not-found]
+    except ImportError:
+        return _compile(schema, name)
+
+    try:
+        validate = fastjsonschema.compile(schema)
+    except Exception as e:
+        logger.warning(f"도구 스키마 컴파일 실패, 내장 검증기 사용 ({name}): {e}")
+        return _compile(schema, name)
+
+    def check(value):
+        try:
+            validate(value)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise MCPToolValidationError(f"{name}: {e.message}")
+
+    return check
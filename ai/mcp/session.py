@@ -0,0 +1,300 @@
+"""MCP stdio JSON-RPC 세션"""
+
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from core.settings import settings
+from .config import MCPServerConfig
+
+PROTOCOL_VERSION = "2024-11-05"
+
+# 한 줄(메시지) 최대 크기 - 큰 도구 결과도 받을 수 있도록
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# JSON-RPC 오류 코드
+METHOD_NOT_FOUND = -32601
+
+
+class MCPError(Exception):
+    """MCP 서버가 반환한 오류 또는 통신 오류"""
+
+    def __init__(self, message: str, code: Optional[int] = None, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class MCPConnectionError(MCPError):
+    """서버 프로세스가 없거나 종료된 경우"""
+
+
+class StdioSession:
+    """MCP 서버 프로세스 하나와의 JSON-RPC 세션
+
+    요청마다 ID를 붙여 보내고, 읽기 작업이 응답 ID로 대기 중인 Future를 찾아
+    완료하므로 한 프로세스에서 여러 도구 호출을 동시에 처리할 수 있습니다.
+
+    Args:
+        config: 서버 실행 설정
+        on_notification: 서버 알림 콜백 ``(method, params)``
+    """
+
+    def __init__(
+        self,
+        config: MCPServerConfig,
+        on_notification: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ):
+        self.config = config
+        self.on_notification = on_notification
+        self.server_info: Dict[str, Any] = {}
+        self.capabilities: Dict[str, Any] = {}
+
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._write_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._closed = True
+        self.last_used = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def in_flight(self) -> int:
+        """응답을 기다리는 요청 수"""
+        return len(self._pending)
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    async def start(self):
+        """프로세스 실행 및 initialize 핸드셰이크"""
+        self._process = await asyncio.create_subprocess_exec(
+            self.config.command,
+            *self.config.args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, **self.config.env},
+            cwd=self.config.cwd,
+            limit=STREAM_LIMIT,
+        )
+        self._closed = False
+        self._reader_task = asyncio.create_task(self._read_loop())
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+        try:
+            result = await self.request(
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": settings.APP_NAME, "version": settings.APP_VERSION},
+                },
+                timeout=self.config.startup_timeout,
+            )
+            self.server_info = result.get("serverInfo", {})
+            self.capabilities = result.get("capabilities", {})
+            await self.notify("notifications/initialized")
+        except BaseException:
+            await self.close()
+            raise
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """요청을 보내고 응답 대기
+
+        Raises:
+            MCPError: 서버 오류 응답
+            MCPConnectionError: 프로세스가 종료된 경우
+            asyncio.TimeoutError: 제한 시간 초과
+        """
+        if self._closed:
+            raise MCPConnectionError(f"MCP 서버 '{self.config.name}' 세션이 종료되었습니다.")
+
+        self.last_used = time.monotonic()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+
+        try:
+            await self._send(message)
+            return await asyncio.wait_for(
+                future, timeout=timeout if timeout is not None else self.config.request_timeout
+            )
+        except asyncio.TimeoutError:
+            # 서버에 취소를 알리고, 늦게 온 응답은 버림
+            if not self._closed:
+                await self.notify(
+                    "notifications/cancelled",
+                    {"requestId": request_id, "reason": "timeout"},
+                )
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+            self.last_used = time.monotonic()
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """알림 전송 (응답 없음)"""
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            await self._send(message)
+        except MCPConnectionError:
+            pass
+
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        """서버의 도구 목록 (페이지네이션 처리)"""
+        tools = []
+        cursor = None
+        while True:
+            result = await self.request("tools/list", {"cursor": cursor} if cursor else {})
+            tools.extend(result.get("tools", []))
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """도구 호출"""
+        return await self.request(
+            "tools/call", {"name": name, "arguments": arguments or {}}, timeout=timeout
+        )
+
+    async def close(self):
+        """프로세스 종료"""
+        self._closed = True
+        process = self._process
+
+        if process is not None and process.returncode is None:
+            try:
+                process.stdin.close()
+                await asyncio.wait_for(process.wait(), timeout=2)
+            except (asyncio.TimeoutError, ProcessLookupError, BrokenPipeError, ConnectionResetError):
+                try:
+                    process.terminate()
+                    await asyncio.wait_for(process.wait(), timeout=3)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                except ProcessLookupError:
+                    pass
+
+        for task in (self._reader_task, self._stderr_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._fail_pending(MCPConnectionError(f"MCP 서버 '{self.config.name}' 세션이 종료되었습니다."))
+
+    async def _send(self, message: Dict[str, Any]):
+        data = json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+        async with self._write_lock:
+            stdin = self._process.stdin if self._process is not None else None
+            if self._closed or stdin is None:
+                raise MCPConnectionError(f"MCP 서버 '{self.config.name}' 세션이 종료되었습니다.")
+            try:
+                stdin.write(data)
+                await stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                raise MCPConnectionError(f"MCP 서버 '{self.config.name}'에 쓸 수 없습니다: {e}")
+
+    async def _read_loop(self):
+        """응답을 요청 ID로 분배하고 서버 요청/알림 처리"""
+        stdout = self._process.stdout
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.debug(f"MCP '{self.config.name}' 비JSON 출력 무시: {line[:200]!r}")
+                    continue
+                if isinstance(message, dict):
+                    await self._dispatch(message)
+        except (asyncio.LimitOverrunError, ValueError) as e:
+            logger.error(f"MCP '{self.config.name}' 메시지 읽기 실패: {e}")
+        finally:
+            if not self._closed:
+                logger.warning(f"MCP 서버 '{self.config.name}' 프로세스가 종료되었습니다 (pid={self.pid})")
+            self._closed = True
+            self._fail_pending(
+                MCPConnectionError(f"MCP 서버 '{self.config.name}' 프로세스가 종료되었습니다.")
+            )
+
+    async def _dispatch(self, message: Dict[str, Any]):
+        method = message.get("method")
+
+        if method is None:
+            request_id = message.get("id")
+            future = self._pending.get(request_id) if isinstance(request_id, int) else None
+            if future is None or future.done():
+                return
+            error = message.get("error")
+            if error is not None:
+                future.set_exception(
+                    MCPError(error.get("message", "MCP 오류"), error.get("code"), error.get("data"))
+                )
+            else:
+                future.set_result(message.get("result") or {})
+            return
+
+        if "id" in message:
+            # 서버 → 클라이언트 요청 (ping만 지원)
+            if method == "ping":
+                response = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+            else:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": message["id"],
+                    "error": {"code": METHOD_NOT_FOUND, "message": f"지원하지 않는 메서드: {method}"},
+                }
+            try:
+                await self._send(response)
+            except MCPConnectionError:
+                pass
+            return
+
+        if self.on_notification is not None:
+            try:
+                self.on_notification(method, message.get("params") or {})
+            except Exception as e:
+                logger.error(f"MCP 알림 처리 실패 ({method}): {e}")
+
+    async def _drain_stderr(self):
+        """서버 stderr를 읽어 로그로 남김 (파이프가 차서 서버가 멈추지 않도록)"""
+        stderr = self._process.stderr
+        while True:
+            line = await stderr.readline()
+            if not line:
+                return
+            logger.debug(f"MCP '{self.config.name}': {line.decode('utf-8', 'replace').rstrip()}")
+
+    def _fail_pending(self, error: Exception):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
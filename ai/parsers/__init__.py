@@ -0,0 +1,9 @@
+"""LLM 출력 파서 모듈"""
+
+from .streaming_json import JSONStreamError, StreamingJSONParser, astream_json
+
+__all__ = [
+    "JSONStreamError",
+    "StreamingJSONParser",
+    "astream_json",
+]
@@ -0,0 +1,283 @@
+"""스트리밍 LLM 출력용 증분 JSON 파서"""
+
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+_LITERALS = {"true": True, "false": False, "null": None}
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+# 컨테이너에서 다음에 올 토큰
+_KEY = 0  # 객체 키 또는 '}'
+_COLON = 1
+_VALUE = 2
+_NEXT = 3  # ',' 또는 닫는 괄호
+_FIRST = 4  # 배열 첫 값 또는 ']'
+
+Field = Tuple[Union[str, int], Any]
+
+
+class JSONStreamError(ValueError):
+    """스트림이 올바른 JSON이 아닌 경우"""
+
+
+def _reject_constant(name: str):
+    # NaN, Infinity는 JSON 표준이 아님
+    raise ValueError(name)
+
+
+class _Frame:
+    __slots__ = ("container", "key", "expect")
+
+    def __init__(self, container: Union[Dict[str, Any], List[Any]]):
+        self.container = container
+        self.key: Optional[str] = None
+        self.expect = _KEY if isinstance(container, dict) else _FIRST
+
+
+class StreamingJSONParser:
+    """토큰 조각을 받는 대로 파싱하는 증분 JSON 파서
+
+    받은 조각은 한 번만 훑으며(전체 재파싱 없음), 최상위 객체의 필드(배열이면
+    요소) 값이 완성될 때마다 돌려줍니다. 첫 ``{`` 또는 ``[`` 앞의 텍스트(설명,
+    코드 펜스)와 최상위 값이 끝난 뒤의 텍스트는 무시합니다.
+    """
+
+    def __init__(self):
+        self._stack: List[_Frame] = []
+        self._root: Union[Dict[str, Any], List[Any], None] = None
+        self._string: Optional[List[str]] = None
+        self._escape: Optional[str] = None
+        self._surrogates = False
+        self._literal: Optional[List[str]] = None
+        self._offset = 0
+        self.done = False
+
+    @property
+    def value(self) -> Union[Dict[str, Any], List[Any], None]:
+        """최상위 값 (완성된 필드만 포함)"""
+        return self._root
+
+    def feed(self, text: str) -> List[Field]:
+        """조각 하나를 파싱
+
+        Returns:
+            List[Field]: 이번 조각에서 완성된 최상위 (필드 이름 또는 인덱스, 값) 목록
+
+        Raises:
+            JSONStreamError: 올바르지 않은 JSON
+        """
+        fields: List[Field] = []
+        i, size = 0, len(text)
+        try:
+            while i < size and not self.done:
+                if self._string is not None:
+                    i = self._read_string(self._string, text, i, fields)
+                    continue
+
+                char = text[i]
+                if self._literal is not None:
+                    if char not in _DELIMITERS:
+                        self._literal.append(char)
+                        i += 1
+                        continue
+                    self._end_literal(self._literal, fields)
+
+                if not self._stack:
+                    if char == "{" or char == "[":
+                        self._root = {} if char == "{" else []
+                        self._stack.append(_Frame(self._root))
+                    i += 1
+                    continue
+
+                if char not in _WHITESPACE:
+                    self._token(char, fields)
+                i += 1
+        except JSONStreamError as e:
+            raise JSONStreamError(f"{e} (위치 {self._offset + i})") from None
+
+        self._offset += size
+        return fields
+
+    def close(self) -> Union[Dict[str, Any], List[Any]]:
+        """스트림 종료 후 완성된 최상위 값 반환
+
+        Raises:
+            JSONStreamError: JSON이 완결되지 않은 경우
+        """
+        if not self.done or self._root is None:
+            raise JSONStreamError("JSON이 완결되지 않았습니다" if self._stack else "JSON 값이 없습니다")
+        return self._root
+
+    def _token(self, char: str, fields: List[Field]):
+        frame = self._stack[-1]
+        expect = frame.expect
+
+        if expect == _KEY:
+            if char == '"':
+                self._string = []
+            elif char == "}" and not frame.container:
+                self._close_container(fields)
+            else:
+                raise JSONStreamError(f"객체 키가 와야 합니다: {char!r}")
+        elif expect == _COLON:
+            if char != ":":
+                raise JSONStreamError(f"':'가 와야 합니다: {char!r}")
+            frame.expect = _VALUE
+        elif expect == _NEXT:
+            if char == ",":
+                frame.expect = _KEY if isinstance(frame.container, dict) else _VALUE
+            elif char == ("}" if isinstance(frame.container, dict) else "]"):
+                self._close_container(fields)
+            else:
+                raise JSONStreamError(f"',' 또는 닫는 괄호가 와야 합니다: {char!r}")
+        elif char == "]" and expect == _FIRST:
+            self._close_container(fields)
+        elif char == '"':
+            self._string = []
+        elif char == "{":
+            self._stack.append(_Frame({}))
+        elif char == "[":
+            self._stack.append(_Frame([]))
+        elif char in "}],:":
+            raise JSONStreamError(f"값이 와야 합니다: {char!r}")
+        else:
+            self._literal = [char]
+
+    def _read_string(self, parts: List[str], text: str, i: int, fields: List[Field]) -> int:
+        """문자열 내용을 읽고 다음 위치 반환 (조각 경계에 걸친 이스케이프 처리)"""
+        size = len(text)
+        while i < size:
+            if self._escape is not None:
+                self._escape += text[i]
+                i += 1
+                escape = self._escape
+                if escape[0] == "u":
+                    if len(escape) < 5:
+                        continue
+                    try:
+                        code = int(escape[1:], 16)
+                    except ValueError:
+                        raise JSONStreamError(f"잘못된 유니코드 이스케이프: \\{escape}")
+                    self._surrogates |= 0xD800 <= code <= 0xDFFF
+                    parts.append(chr(code))
+                elif escape in _ESCAPES:
+                    parts.append(_ESCAPES[escape])
+                else:
+                    raise JSONStreamError(f"잘못된 이스케이프: \\{escape}")
+                self._escape = None
+                continue
+
+            quote = text.find('"', i)
+            backslash = text.find("\\", i, quote if quote != -1 else size)
+            if backslash != -1:
+                parts.append(text[i:backslash])
+                self._escape = ""
+                i = backslash + 1
+            elif quote != -1:
+                parts.append(text[i:quote])
+                self._end_string(parts, fields)
+                return quote + 1
+            else:
+                parts.append(text[i:])
+                return size
+        return size
+
+    def _end_string(self, parts: List[str], fields: List[Field]):
+        value = "".join(parts)
+        if self._surrogates:
+            # 서로게이트 쌍은 한 문자로 합치고, 짝이 없는 서로게이트는 json.loads처럼 그대로 둠
+            value = value.encode("utf-16", "surrogatepass").decode("utf-16", "surrogatepass")
+            self._surrogates = False
+        self._string = None
+
+        frame = self._stack[-1]
+        if frame.expect == _KEY:
+            frame.key = value
+            frame.expect = _COLON
+        else:
+            self._add(value, fields)
+
+    def _end_literal(self, chars: List[str], fields: List[Field]):
+        literal = "".join(chars)
+        self._literal = None
+        if literal in _LITERALS:
+            self._add(_LITERALS[literal], fields)
+            return
+        try:
+            value = json.loads(literal, parse_constant=_reject_constant)
+        except ValueError:
+            raise JSONStreamError(f"잘못된 값: {literal!r}")
+        if not isinstance(value, (int, float)):
+            raise JSONStreamError(f"잘못된 값: {literal!r}")
+        self._add(value, fields)
+
+    def _close_container(self, fields: List[Field]):
+        frame = self._stack.pop()
+        if not self._stack:
+            self.done = True
+            return
+        self._add(frame.container, fields)
+
+    def _add(self, value: Any, fields: List[Field]):
+        """완성된 값을 부모 컨테이너에 추가"""
+        frame = self._stack[-1]
+        container = frame.container
+        if isinstance(container, dict):
+            key = frame.key
+            if key is None:
+                raise JSONStreamError("객체 키가 없습니다")
+            name: Union[str, int] = key
+            container[key] = value
+            frame.key = None
+        else:
+            name = len(container)
+            container.append(value)
+        frame.expect = _NEXT
+
+        if len(self._stack) == 1:
+            fields.append((name, value))
+
+
+async def astream_json(
+    chunks: AsyncIterator[Any],
+    schema: Optional[Type[BaseModel]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """텍스트 스트림에서 JSON 필드를 완성되는 대로 이벤트로 반환
+
+    Args:
+        chunks: LLM 출력 조각 스트림 (``stream_chat_completion`` 등)
+        schema: 마지막에 전체 값을 검증할 Pydantic 모델
+
+    Yields:
+        Dict[str, Any]: 필드가 완성될 때마다 ``field`` 이벤트(name, value, partial),
+            마지막에 ``final`` 이벤트(value: 검증된 모델 인스턴스 또는 원본 값)
+
+    Raises:
+        JSONStreamError: 출력이 올바른 JSON이 아닌 경우
+        pydantic.ValidationError: 최종 값이 스키마에 맞지 않는 경우
+    """
+    parser = StreamingJSONParser()
+    async for chunk in chunks:
+        if not isinstance(chunk, str):
+            # 블록 목록 형식의 content (Anthropic 등)
+            chunk = "".join(
+                block.get("text", "") if isinstance(block, dict) else str(block)
+                for block in chunk or []
+            )
+        for name, value in parser.feed(chunk):
+            partial = parser.value
+            yield {
+                "type": "field",
+                "name": name,
+                "value": value,
+                "partial": dict(partial) if isinstance(partial, dict) else list(partial or []),
+            }
+
+    value = parser.close()
+    if schema is not None:
+        value = schema.model_validate(value)
+    yield {"type": "final", "value": value}
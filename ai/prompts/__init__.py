@@ -1,10 +1,26 @@
 """프롬프트 관리 모듈"""
 
-from .manager import PromptManager
+from .context import ContextBuilder, PackedContext, build_context
+from .manager import PromptManager, get_prompt_manager
+from .registry import CompiledPrompt, PromptRegistry, get_prompt_registry
+from .store import PromptSnapshot, PromptStore, get_prompt_store
 from .templates import SYSTEM_PROMPTS, USER_PROMPTS
+from .tokens import count_tokens, load_encoding
 
 __all__ = [
+    "CompiledPrompt",
+    "ContextBuilder",
+    "PackedContext",
     "PromptManager",
+    "PromptRegistry",
+    "PromptSnapshot",
+    "PromptStore",
     "SYSTEM_PROMPTS",
     "USER_PROMPTS",
+    "build_context",
+    "count_tokens",
+    "get_prompt_manager",
+    "get_prompt_registry",
+    "get_prompt_store",
+    "load_encoding",
 ] 
\ No newline at end of file
@@ -0,0 +1,253 @@
+"""RAG 컨텍스트 구성 (토큰 예산 내 청크 패킹)"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from core.settings import settings
+from .tokens import count_tokens
+
+# 문장 경계 (구분자를 보존하기 위해 캡처)
+_SENTENCE_BREAK = re.compile(r"((?<=[.!?。])\s+|\n+)")
+_NON_WORD = re.compile(r"\W+")
+
+# 중복 판정 대상 최소 문장 길이 (정규화 후 문자 수, 짧은 문장은 항상 유지)
+MIN_SENTENCE_CHARS = 10
+
+# 인접 청크 겹침 탐색 범위 (문자 수)
+MIN_OVERLAP_CHARS = 20
+MAX_OVERLAP_CHARS = 2000
+
+
+@dataclass
+class ContextSpan:
+    """같은 문서의 연속된 청크를 합친 컨텍스트 단위"""
+
+    document_id: Optional[str]
+    source: Optional[str]
+    chunk_ids: List[int]
+    chunk_indices: List[int]
+    text: str
+    score: float
+    tokens: int = 0
+    truncated: bool = False
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "document_id": self.document_id,
+            "source": self.source,
+            "chunk_ids": self.chunk_ids,
+            "chunk_indices": self.chunk_indices,
+            "score": self.score,
+            "tokens": self.tokens,
+            "truncated": self.truncated,
+        }
+
+
+@dataclass
+class PackedContext:
+    """패킹된 컨텍스트와 포함 내역"""
+
+    text: str
+    tokens: int
+    budget: int
+    included: List[ContextSpan] = field(default_factory=list)
+    dropped: List[int] = field(default_factory=list)
+    removed_sentences: int = 0
+
+    def report(self) -> Dict[str, Any]:
+        """포함/제외된 청크 보고서"""
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "included": [span.report() for span in self.included],
+            "dropped": self.dropped,
+            "removed_sentences": self.removed_sentences,
+        }
+
+
+def _join_overlap(left: str, right: str) -> str:
+    """인접 청크 연결 (청크 간 겹치는 부분은 한 번만 포함)"""
+    tail = left[-MAX_OVERLAP_CHARS:]
+    prefix = right[:MIN_OVERLAP_CHARS]
+    if len(prefix) == MIN_OVERLAP_CHARS:
+        start = tail.find(prefix)
+        while start != -1:
+            # 가장 앞에서 시작하는 일치가 가장 긴 겹침
+            if right.startswith(tail[start:]):
+                return left + right[len(tail) - start:]
+            start = tail.find(prefix, start + 1)
+    return f"{left}\n{right}"
+
+
+def _split_sentences(text: str) -> List[List[str]]:
+    """[문장, 뒤따르는 구분자] 목록으로 분리"""
+    parts = _SENTENCE_BREAK.split(text)
+    parts.append("")
+    return [[parts[i], parts[i + 1]] for i in range(0, len(parts) - 1, 2) if parts[i]]
+
+
+def _sentence_key(sentence: str) -> str:
+    return _NON_WORD.sub("", sentence.lower())
+
+
+class ContextBuilder:
+    """검색 결과를 토큰 예산 안에서 관련도 대비 토큰 효율 순으로 패킹
+
+    - 같은 문서의 인접 청크(chunk_index 연속)는 겹침을 제거하고 하나로 합칩니다.
+    - 이미 포함된 문장과 같은 문장(정규화 기준)은 제외합니다.
+    - 토큰당 점수가 높은 단위부터 채우고, 남은 예산이 부족하면 문장 단위로 자릅니다.
+
+    Args:
+        max_tokens: 컨텍스트 토큰 예산
+        min_tokens: 잘라서라도 넣을 최소 남은 예산
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None, min_tokens: int = 32):
+        self.max_tokens = max_tokens or settings.RAG_CONTEXT_MAX_TOKENS
+        self.min_tokens = min_tokens
+
+    def build(self, results: Sequence[Dict[str, Any]]) -> PackedContext:
+        """검색 결과로 컨텍스트 구성
+
+        Args:
+            results: 검색 결과 (``id``, ``content``, ``score``, ``metadata`` 포함)
+
+        Returns:
+            PackedContext: 컨텍스트 문자열과 포함 내역
+        """
+        spans = self._merge(results)
+        for span in spans:
+            span.tokens = max(count_tokens(span.text), 1)
+        spans.sort(key=lambda span: span.score / span.tokens, reverse=True)
+
+        seen: Set[str] = set()
+        included: List[ContextSpan] = []
+        dropped: List[int] = []
+        removed = 0
+        remaining = self.max_tokens
+
+        for span in spans:
+            sentences: List[str] = []
+            keys: List[Optional[str]] = []
+            for sentence, separator in _split_sentences(span.text):
+                key = _sentence_key(sentence)
+                if len(key) >= MIN_SENTENCE_CHARS and (key in seen or key in keys):
+                    removed += 1
+                    continue
+                sentences.append(sentence + separator)
+                # 짧은 문장은 중복 제거 대상이 아님
+                keys.append(key if len(key) >= MIN_SENTENCE_CHARS else None)
+
+            if not "".join(sentences).strip():
+                dropped.extend(span.chunk_ids)
+                continue
+
+            overhead = count_tokens(self._header(len(included) + 1, span))
+            costs = [count_tokens(sentence) for sentence in sentences]
+            if overhead + sum(costs) > remaining:
+                if remaining - overhead < self.min_tokens:
+                    dropped.extend(span.chunk_ids)
+                    continue
+                # 남은 예산만큼 문장 단위로 자름
+                budget = remaining - overhead
+                kept = 0
+                for cost in costs:
+                    if cost > budget:
+                        break
+                    budget -= cost
+                    kept += 1
+                if not kept:
+                    dropped.extend(span.chunk_ids)
+                    continue
+                sentences = sentences[:kept]
+                keys = keys[:kept]
+                costs = costs[:kept]
+                span.truncated = True
+
+            span.text = "".join(sentences).strip()
+            span.tokens = overhead + sum(costs)
+            remaining -= span.tokens
+            seen.update(key for key in keys if key)
+            included.append(span)
+
+        # 프롬프트에는 관련도 순으로 배치
+        included.sort(key=lambda span: span.score, reverse=True)
+        text = "\n\n".join(
+            self._header(number, span) + span.text
+            for number, span in enumerate(included, start=1)
+        )
+
+        return PackedContext(
+            text=text,
+            tokens=count_tokens(text),
+            budget=self.max_tokens,
+            included=included,
+            dropped=dropped,
+            removed_sentences=removed,
+        )
+
+    @staticmethod
+    def _header(number: int, span: ContextSpan) -> str:
+        return f"[{number}] {span.source}\n" if span.source else f"[{number}]\n"
+
+    @staticmethod
+    def _scores(results: Sequence[Dict[str, Any]]) -> List[float]:
+        """점수를 (0.1, 1] 범위로 정규화 (재순위화 점수는 음수일 수 있음)"""
+        raw = [
+            float(result["rerank_score"] if result.get("rerank_score") is not None
+                  else result.get("score") or 0.0)
+            for result in results
+        ]
+        if not raw:
+            return []
+        low, high = min(raw), max(raw)
+        if high == low:
+            return [1.0] * len(raw)
+        return [0.1 + 0.9 * (score - low) / (high - low) for score in raw]
+
+    def _merge(self, results: Sequence[Dict[str, Any]]) -> List[ContextSpan]:
+        """같은 문서의 연속된 청크를 하나의 단위로 병합"""
+        groups: Dict[str, List[tuple]] = {}
+        spans: List[ContextSpan] = []
+
+        for result, score in zip(results, self._scores(results)):
+            metadata = result.get("metadata") or {}
+            document_id = metadata.get("document_id")
+            chunk_index = metadata.get("chunk_index")
+            source = result.get("source") or metadata.get("source")
+            if document_id is None or chunk_index is None:
+                spans.append(ContextSpan(
+                    document_id, source, [result["id"]], [], result["content"].strip(), score
+                ))
+                continue
+            groups.setdefault(document_id, []).append((chunk_index, result, score, source))
+
+        for document_id, members in groups.items():
+            members.sort(key=lambda member: member[0])
+            span = None
+            for chunk_index, result, score, source in members:
+                if span is not None and chunk_index == span.chunk_indices[-1] + 1:
+                    span.text = _join_overlap(span.text, result["content"].strip())
+                    span.chunk_ids.append(result["id"])
+                    span.chunk_indices.append(chunk_index)
+                    span.score += score
+                    continue
+                if span is not None and chunk_index == span.chunk_indices[-1]:
+                    span.chunk_ids.append(result["id"])
+                    continue
+                span = ContextSpan(
+                    document_id, source, [result["id"]], [chunk_index],
+                    result["content"].strip(), score,
+                )
+                spans.append(span)
+
+        return spans
+
+
+def build_context(
+    results: Sequence[Dict[str, Any]],
+    max_tokens: Optional[int] = None,
+) -> PackedContext:
+    """검색 결과를 토큰 예산에 맞춘 컨텍스트로 구성"""
+    return ContextBuilder(max_tokens).build(results)
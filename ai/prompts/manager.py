@@ -1,56 +1,148 @@
 """프롬프트 관리자 클래스"""
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, cast
 from pathlib import Path
 import json
 import yaml
 
-from .templates import SYSTEM_PROMPTS, USER_PROMPTS, RAG_PROMPTS
+from .registry import PROMPT_KINDS, CompiledPrompt, PromptRegistry, compile_prompts
+from .search import PromptIndex
+from .store import get_prompt_store
 
 
 class PromptManager:
-    """프롬프트 템플릿 관리자"""
+    """프롬프트 템플릿 관리자
+
+    기본 프롬프트는 공유 레지스트리를 그대로 참조하고, 추가하거나 파일에서 읽은
+    프롬프트만 인스턴스별 오버레이에 컴파일해 둡니다. 레지스트리를 지정하지 않으면
+    프롬프트 저장소의 현재 버전을 따릅니다.
+    """
     
-    def __init__(self, custom_prompts_path: Optional[str] = None):
-        self.system_prompts = SYSTEM_PROMPTS.copy()
-        self.user_prompts = USER_PROMPTS.copy()
-        self.rag_prompts = RAG_PROMPTS.copy()
+    def __init__(
+        self,
+        custom_prompts_path: Optional[str] = None,
+        registry: Optional[PromptRegistry] = None,
+    ):
+        self._registry = registry
+        self._overlay: Dict[str, Dict[str, CompiledPrompt]] = {kind: {} for kind in PROMPT_KINDS}
+        
+        # 검색 색인 (첫 검색 시 구축, 이후 변경분만 반영)
+        self._index = PromptIndex()
+        self._indexed: Dict[Tuple[str, str], CompiledPrompt] = {}
+        self._indexed_registry: Optional[PromptRegistry] = None
         
         # 커스텀 프롬프트 로드
         if custom_prompts_path:
             self.load_custom_prompts(custom_prompts_path)
     
-    def get_system_prompt(self, key: str, default: str = None) -> str:
+    @property
+    def registry(self) -> PromptRegistry:
+        if self._registry is not None:
+            return self._registry
+        return get_prompt_store().registry
+    
+    @property
+    def version(self) -> str:
+        """기반 레지스트리 버전 (고정 레지스트리면 "custom")"""
+        return "custom" if self._registry is not None else get_prompt_store().version
+    
+    @property
+    def system_prompts(self) -> Dict[str, str]:
+        return self._templates("system_prompts")
+    
+    @property
+    def user_prompts(self) -> Dict[str, str]:
+        return self._templates("user_prompts")
+    
+    @property
+    def rag_prompts(self) -> Dict[str, str]:
+        return self._templates("rag_prompts")
+    
+    def _templates(self, kind: str) -> Dict[str, str]:
+        """종류별 {키: 템플릿} (레지스트리 + 오버레이)"""
+        templates = self.registry.templates(kind)
+        templates.update((key, prompt.template) for key, prompt in self._overlay[kind].items())
+        return templates
+    
+    def get_prompt(self, kind: str, key: str) -> Optional[CompiledPrompt]:
+        """컴파일된 프롬프트 반환 (없으면 None)"""
+        prompt = self._overlay[kind].get(key)
+        if prompt is None:
+            prompt = self.registry.get(kind, key)
+        return prompt
+    
+    def get_system_prompt(self, key: str, default: Optional[str] = None) -> str:
         """시스템 프롬프트 반환"""
-        return self.system_prompts.get(key, default or self.system_prompts["default_chat"])
+        prompt = self.get_prompt("system_prompts", key)
+        if prompt is not None:
+            return prompt.template
+        if default:
+            return default
+        fallback = self.get_prompt("system_prompts", "default_chat")
+        return fallback.template if fallback is not None else ""
     
     def get_user_prompt(self, key: str, **kwargs) -> str:
         """사용자 프롬프트 반환 (변수 포맷팅 포함)"""
-        template = self.user_prompts.get(key)
-        if not template:
+        prompt = self.get_prompt("user_prompts", key)
+        if prompt is None:
             raise ValueError(f"사용자 프롬프트 '{key}'를 찾을 수 없습니다.")
         
-        return template.format(**kwargs)
+        return prompt.render(**kwargs)
     
     def get_rag_prompt(self, key: str, **kwargs) -> str:
         """RAG 프롬프트 반환 (변수 포맷팅 포함)"""
-        template = self.rag_prompts.get(key)
-        if not template:
+        prompt = self.get_prompt("rag_prompts", key)
+        if prompt is None:
             raise ValueError(f"RAG 프롬프트 '{key}'를 찾을 수 없습니다.")
         
-        return template.format(**kwargs)
+        return prompt.render(**kwargs)
     
     def add_system_prompt(self, key: str, prompt: str):
         """시스템 프롬프트 추가"""
-        self.system_prompts[key] = prompt
+        self._add("system_prompts", key, prompt)
     
     def add_user_prompt(self, key: str, prompt: str):
         """사용자 프롬프트 추가"""
-        self.user_prompts[key] = prompt
+        self._add("user_prompts", key, prompt)
     
     def add_rag_prompt(self, key: str, prompt: str):
         """RAG 프롬프트 추가"""
-        self.rag_prompts[key] = prompt
+        self._add("rag_prompts", key, prompt)
+    
+    def _add(self, kind: str, key: str, prompt: str):
+        self._merge_overlay(kind, compile_prompts(kind, {key: prompt}))
+    
+    def _merge_overlay(self, kind: str, prompts: Dict[str, CompiledPrompt]):
+        self._overlay[kind].update(prompts)
+        if self._indexed_registry is not None:
+            for prompt in prompts.values():
+                self._index_prompt(kind, prompt)
+    
+    def _index_prompt(self, kind: str, prompt: CompiledPrompt):
+        doc_id = (kind, prompt.key)
+        if self._indexed.get(doc_id) is not prompt:
+            self._index.add(doc_id, prompt.key, prompt.template)
+            self._indexed[doc_id] = prompt
+    
+    def _sync_index(self):
+        """레지스트리가 바뀌었으면 달라진 프롬프트만 색인에 반영"""
+        registry = self.registry
+        if registry is self._indexed_registry:
+            return
+        
+        current = {}
+        for kind, prompt in registry:
+            current[(kind, prompt.key)] = prompt
+        for kind, prompts in self._overlay.items():
+            for key, prompt in prompts.items():
+                current[(kind, key)] = prompt
+        
+        for doc_id in self._indexed.keys() - current.keys():
+            self._index.remove(doc_id)
+            del self._indexed[doc_id]
+        for (kind, _), prompt in current.items():
+            self._index_prompt(kind, prompt)
+        self._indexed_registry = registry
     
     def load_custom_prompts(self, file_path: str):
         """커스텀 프롬프트 파일 로드"""
@@ -68,13 +160,14 @@ class PromptManager:
             else:
                 raise ValueError(f"지원하지 않는 파일 형식: {path.suffix}")
             
-            # 프롬프트 병합
-            if 'system_prompts' in data:
-                self.system_prompts.update(data['system_prompts'])
-            if 'user_prompts' in data:
-                self.user_prompts.update(data['user_prompts'])
-            if 'rag_prompts' in data:
-                self.rag_prompts.update(data['rag_prompts'])
+            # 프롬프트 병합 (모두 컴파일에 성공한 경우에만 반영)
+            compiled = {
+                kind: compile_prompts(kind, data[kind])
+                for kind in PROMPT_KINDS
+                if kind in data
+            }
+            for kind, prompts in compiled.items():
+                self._merge_overlay(kind, prompts)
         
         except Exception as e:
             print(f"커스텀 프롬프트 로드 실패: {e}")
@@ -110,29 +203,36 @@ class PromptManager:
             'rag_prompts': list(self.rag_prompts.keys())
         }
     
-    def search_prompts(self, keyword: str) -> Dict[str, list]:
-        """키워드로 프롬프트 검색"""
-        results = {
-            'system_prompts': [],
-            'user_prompts': [],
-            'rag_prompts': []
-        }
-        
-        keyword_lower = keyword.lower()
+    def search_prompts(self, keyword: str, limit: Optional[int] = None) -> Dict[str, list]:
+        """키워드로 프롬프트 검색 (키/본문 부분 문자열, 관련도 순)
         
-        # 시스템 프롬프트 검색
-        for key, prompt in self.system_prompts.items():
-            if keyword_lower in key.lower() or keyword_lower in prompt.lower():
-                results['system_prompts'].append(key)
+        Args:
+            keyword: 검색어
+            limit: 전체 최대 결과 수
         
-        # 사용자 프롬프트 검색
-        for key, prompt in self.user_prompts.items():
-            if keyword_lower in key.lower() or keyword_lower in prompt.lower():
-                results['user_prompts'].append(key)
+        Returns:
+            Dict[str, list]: 종류별 프롬프트 키 목록
+        """
+        self._sync_index()
         
-        # RAG 프롬프트 검색
-        for key, prompt in self.rag_prompts.items():
-            if keyword_lower in key.lower() or keyword_lower in prompt.lower():
-                results['rag_prompts'].append(key)
+        results: Dict[str, List[str]] = {kind: [] for kind in PROMPT_KINDS}
+        for doc_id, _ in self._index.search(keyword, limit):
+            # 색인 문서 ID는 (종류, 키)
+            kind, key = cast(Tuple[str, str], doc_id)
+            results[kind].append(key)
         
-        return results 
\ No newline at end of file
+        return results
+
+
+# 기본 프롬프트만 쓰는 공유 관리자 인스턴스
+_prompt_manager: Optional[PromptManager] = None
+
+
+def get_prompt_manager() -> PromptManager:
+    """공유 프롬프트 관리자 반환"""
+    global _prompt_manager
+
+    if _prompt_manager is None:
+        _prompt_manager = PromptManager()
+
+    return _prompt_manager
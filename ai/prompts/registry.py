@@ -0,0 +1,174 @@
+"""컴파일된 프롬프트 레지스트리"""
+
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, Mapping, Optional, Tuple
+
+from .templates import RAG_PROMPTS, SYSTEM_PROMPTS, USER_PROMPTS
+from .tokens import count_tokens
+
+PROMPT_KINDS = ("system_prompts", "user_prompts", "rag_prompts")
+
+# 포맷팅하지 않고 그대로 쓰는 프롬프트 종류
+LITERAL_KINDS = frozenset({"system_prompts"})
+
+_formatter = Formatter()
+
+
+class CompiledPrompt:
+    """한 번 파싱해 둔 프롬프트 템플릿
+
+    리터럴 조각과 플레이스홀더 위치를 미리 계산해 두므로 렌더링 시 포맷 문자열을
+    다시 파싱하지 않습니다.
+
+    Args:
+        key: 프롬프트 키
+        template: 원본 템플릿
+        literal: True면 플레이스홀더 없이 그대로 사용 (시스템 프롬프트)
+
+    Raises:
+        ValueError: 위치 인자(``{}``)나 속성/인덱스 접근 등 지원하지 않는 플레이스홀더
+    """
+
+    __slots__ = ("key", "template", "placeholders", "static_tokens", "_parts", "_fields", "_static")
+
+    def __init__(self, key: str, template: str, literal: bool = False):
+        if not isinstance(template, str):
+            raise ValueError(f"프롬프트 '{key}'는 문자열이어야 합니다.")
+
+        self.key = key
+        self.template = template
+
+        parts = []
+        fields = []
+        if literal:
+            parts.append(template)
+        else:
+            try:
+                parsed = list(_formatter.parse(template))
+            except ValueError as e:
+                raise ValueError(f"프롬프트 '{key}' 템플릿 오류: {e}")
+
+            for literal_text, name, format_spec, conversion in parsed:
+                if literal_text:
+                    parts.append(literal_text)
+                if name is None:
+                    continue
+                if not name.isidentifier():
+                    raise ValueError(
+                        f"프롬프트 '{key}'의 플레이스홀더 '{{{name}}}'는 지원하지 않습니다. "
+                        "이름 있는 변수만 사용할 수 있습니다."
+                    )
+                if format_spec and "{" in format_spec:
+                    raise ValueError(f"프롬프트 '{key}'의 중첩 포맷 지정은 지원하지 않습니다.")
+                # 플레이스홀더 자리는 렌더링 시 채움
+                fields.append((len(parts), name, conversion, format_spec))
+                parts.append("")
+
+        self._parts: Tuple[str, ...] = tuple(parts)
+        self._fields: Tuple[Tuple[int, str, Optional[str], Optional[str]], ...] = tuple(fields)
+        self.placeholders: FrozenSet[str] = frozenset(name for _, name, _, _ in fields)
+        self._static = "".join(parts)
+        # 변수를 제외한 고정 부분의 토큰 수
+        self.static_tokens = count_tokens(self._static)
+
+    def render(self, **kwargs: Any) -> str:
+        """변수를 채워 프롬프트 생성
+
+        Raises:
+            ValueError: 필요한 변수가 빠진 경우
+        """
+        if not self._fields:
+            return self._static
+
+        missing = self.placeholders.difference(kwargs)
+        if missing:
+            raise ValueError(
+                f"프롬프트 '{self.key}'에 필요한 변수가 없습니다: {', '.join(sorted(missing))}"
+            )
+
+        parts = list(self._parts)
+        for position, name, conversion, format_spec in self._fields:
+            value = kwargs[name]
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts[position] = format(value, format_spec) if format_spec else str(value)
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        return f"CompiledPrompt({self.key!r}, placeholders={sorted(self.placeholders)})"
+
+
+def compile_prompts(kind: str, prompts: Mapping[str, str]) -> Dict[str, CompiledPrompt]:
+    """프롬프트 종류 하나의 템플릿들을 컴파일"""
+    if kind not in PROMPT_KINDS:
+        raise ValueError(f"알 수 없는 프롬프트 종류: {kind}")
+    literal = kind in LITERAL_KINDS
+    return {key: CompiledPrompt(key, template, literal) for key, template in prompts.items()}
+
+
+class PromptRegistry:
+    """불변 프롬프트 레지스트리
+
+    생성 후에는 바뀌지 않으므로 여러 체인과 요청이 복사 없이 공유합니다.
+    변경이 필요하면 ``with_prompts``로 새 레지스트리를 만듭니다.
+
+    Args:
+        prompts: 종류별 {키: 템플릿}
+    """
+
+    def __init__(self, prompts: Mapping[str, Mapping[str, str]]):
+        self._prompts = self._freeze(
+            {kind: compile_prompts(kind, prompts.get(kind) or {}) for kind in PROMPT_KINDS}
+        )
+
+    @staticmethod
+    def _freeze(
+        compiled: Mapping[str, Mapping[str, CompiledPrompt]],
+    ) -> Mapping[str, Mapping[str, CompiledPrompt]]:
+        return MappingProxyType({kind: MappingProxyType(dict(compiled[kind])) for kind in PROMPT_KINDS})
+
+    def get(self, kind: str, key: str) -> Optional[CompiledPrompt]:
+        """컴파일된 프롬프트 반환 (없으면 None)"""
+        return self._prompts[kind].get(key)
+
+    def prompts(self, kind: str) -> Mapping[str, CompiledPrompt]:
+        """종류별 읽기 전용 프롬프트 매핑"""
+        return self._prompts[kind]
+
+    def templates(self, kind: str) -> Dict[str, str]:
+        """종류별 {키: 원본 템플릿}"""
+        return {key: prompt.template for key, prompt in self._prompts[kind].items()}
+
+    def with_prompts(self, prompts: Mapping[str, Mapping[str, str]]) -> "PromptRegistry":
+        """주어진 프롬프트를 덮어쓴 새 레지스트리 반환 (바뀌지 않은 프롬프트는 재사용)"""
+        compiled = {
+            kind: {**self._prompts[kind], **compile_prompts(kind, prompts.get(kind) or {})}
+            for kind in PROMPT_KINDS
+        }
+        registry = PromptRegistry.__new__(PromptRegistry)
+        registry._prompts = self._freeze(compiled)
+        return registry
+
+    def __iter__(self) -> Iterator[Tuple[str, CompiledPrompt]]:
+        for kind in PROMPT_KINDS:
+            for prompt in self._prompts[kind].values():
+                yield kind, prompt
+
+
+# 기본 템플릿으로 만든 전역 레지스트리
+_registry: Optional[PromptRegistry] = None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """기본 프롬프트 레지스트리 반환"""
+    global _registry
+
+    if _registry is None:
+        _registry = PromptRegistry({
+            "system_prompts": SYSTEM_PROMPTS,
+            "user_prompts": USER_PROMPTS,
+            "rag_prompts": RAG_PROMPTS,
+        })
+
+    return _registry
@@ -0,0 +1,103 @@
+"""프롬프트 n-gram 역색인"""
+
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+# 색인할 문자 n-gram 길이 (1글자 검색어는 unigram, 그 외는 bigram 사용)
+_NGRAM_SIZES = (1, 2)
+
+# 본문 등장 횟수 점수 상한
+MAX_BODY_HITS = 10
+
+
+def _ngrams(text: str, size: int) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class PromptIndex:
+    """프롬프트 키와 본문의 문자 n-gram 역색인
+
+    공백 단위 토큰이 아닌 문자 n-gram을 쓰므로 한국어 부분 문자열(조사가 붙은
+    단어 등)도 찾을 수 있습니다. 후보는 검색어 n-gram 목록의 교집합으로 좁힌 뒤
+    실제 포함 여부를 확인하므로 결과는 단순 부분 문자열 검색과 같습니다.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._documents: Dict[Hashable, Tuple[str, str]] = {}
+        self._grams: Dict[Hashable, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._documents
+
+    def add(self, doc_id: Hashable, key: str, body: str):
+        """문서 추가 (이미 있으면 교체)"""
+        key_lower, body_lower = key.lower(), body.lower()
+        if self._documents.get(doc_id) == (key_lower, body_lower):
+            return
+        self.remove(doc_id)
+
+        grams = set()
+        for text in (key_lower, body_lower):
+            for size in _NGRAM_SIZES:
+                grams |= _ngrams(text, size)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+        self._documents[doc_id] = (key_lower, body_lower)
+        self._grams[doc_id] = grams
+
+    def remove(self, doc_id: Hashable):
+        """문서 제거"""
+        grams = self._grams.pop(doc_id, None)
+        if grams is None:
+            return
+        del self._documents[doc_id]
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(doc_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """부분 문자열 검색 (관련도 순)
+
+        키와 일치할수록, 본문에 많이 등장할수록 높은 점수를 받습니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            List[Tuple[Hashable, float]]: (문서 ID, 점수) 목록
+        """
+        query = query.lower()
+        if not query:
+            documents = sorted(self._documents, key=str)
+            return [(doc_id, 0.0) for doc_id in (documents[:limit] if limit else documents)]
+
+        grams = _ngrams(query, min(len(query), _NGRAM_SIZES[-1]))
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        candidates = postings[0].intersection(*postings[1:])
+
+        results = []
+        for doc_id in candidates:
+            key, body = self._documents[doc_id]
+            score = 0.0
+            if key == query:
+                score += 100
+            elif key.startswith(query):
+                score += 50
+            elif query in key:
+                score += 30
+            score += min(body.count(query), MAX_BODY_HITS)
+            if score:
+                results.append((doc_id, score))
+
+        results.sort(key=lambda item: (-item[1], str(item[0])))
+        return results[:limit] if limit else results
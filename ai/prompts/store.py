@@ -0,0 +1,202 @@
+"""핫 리로드 프롬프트 저장소"""
+
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import yaml  # type: ignore[import-untyped]
+from loguru import logger
+
+from core.settings import settings
+from .registry import PROMPT_KINDS, PromptRegistry, get_prompt_registry
+
+
+class PromptSnapshot(NamedTuple):
+    """특정 버전의 프롬프트 레지스트리"""
+
+    version: str
+    registry: PromptRegistry
+    loaded_at: float
+
+
+def _parse_prompt_file(path: Path, content: bytes) -> Dict[str, Dict[str, str]]:
+    """JSON/YAML 프롬프트 파일 파싱"""
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        data = json.loads(content.decode("utf-8"))
+    elif suffix in (".yml", ".yaml"):
+        data = yaml.safe_load(content.decode("utf-8"))
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식: {path.suffix}")
+
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: 최상위 값은 객체여야 합니다.")
+
+    prompts = {}
+    for kind in PROMPT_KINDS:
+        values = data.get(kind)
+        if values is None:
+            continue
+        if not isinstance(values, dict):
+            raise ValueError(f"{path}: '{kind}'는 {{키: 템플릿}} 객체여야 합니다.")
+        prompts[kind] = values
+    return prompts
+
+
+class PromptStore:
+    """커스텀 프롬프트 파일을 감시해 새 버전으로 교체하는 저장소
+
+    - 백그라운드 작업이 파일 mtime/크기를 주기적으로 확인하고, 바뀌면 스레드에서
+      읽고 파싱·컴파일한 뒤 현재 스냅샷 참조를 한 번에 교체합니다.
+    - 렌더링은 메모리의 스냅샷만 사용하므로 요청 경로에서 파일 I/O가 없습니다.
+    - 파일이 잘못되면 오류를 기록하고 이전 버전을 유지합니다.
+
+    Args:
+        paths: 프롬프트 파일 경로 목록 (뒤 파일이 앞 파일을 덮어씀)
+        interval: 변경 확인 주기(초, 0이면 감시하지 않음)
+        base: 기본 레지스트리
+    """
+
+    def __init__(
+        self,
+        paths: Optional[Sequence[str]] = None,
+        interval: Optional[float] = None,
+        base: Optional[PromptRegistry] = None,
+    ):
+        if paths is None:
+            paths = [path.strip() for path in settings.PROMPT_FILES.split(",") if path.strip()]
+        self.paths = [Path(path) for path in paths]
+        self.interval = settings.PROMPT_RELOAD_INTERVAL if interval is None else interval
+
+        self._base = base or get_prompt_registry()
+        self._snapshot = PromptSnapshot("builtin", self._base, time.time())
+        self._fingerprint: Optional[Tuple] = None
+        self._digest: Optional[str] = None
+        self._sequence = 0
+        self._reload_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> PromptSnapshot:
+        return self._snapshot
+
+    @property
+    def registry(self) -> PromptRegistry:
+        return self._snapshot.registry
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    async def start(self):
+        """최초 로드 후 파일 감시 시작"""
+        await self.reload()
+        if self.paths and self.interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        """파일 감시 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def reload(self, force: bool = False) -> bool:
+        """파일이 바뀌었으면 다시 로드
+
+        Args:
+            force: 변경 여부와 관계없이 다시 로드
+
+        Returns:
+            bool: 새 버전으로 교체되었는지 여부
+        """
+        async with self._reload_lock:
+            fingerprint = await asyncio.to_thread(self._stat_files)
+            if not force and fingerprint == self._fingerprint:
+                return False
+
+            try:
+                registry, digest = await asyncio.to_thread(self._load)
+            except Exception as e:
+                # 같은 잘못된 파일을 매번 다시 읽지 않도록 지문은 갱신
+                self._fingerprint = fingerprint
+                logger.error(f"프롬프트 파일 로드 실패, 버전 {self.version} 유지: {e}")
+                return False
+
+            self._fingerprint = fingerprint
+            # mtime만 바뀌고 내용이 같으면 교체하지 않음
+            if digest == self._digest:
+                return False
+            self._digest = digest
+            if digest is None:
+                version = "builtin"
+            else:
+                self._sequence += 1
+                version = f"v{self._sequence}-{digest[:12]}"
+
+            self._snapshot = PromptSnapshot(version, registry, time.time())
+            logger.info(f"프롬프트 버전 교체: {version}")
+            return True
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error(f"프롬프트 파일 감시 오류: {e}")
+
+    def _stat_files(self) -> Tuple:
+        """파일별 (경로, mtime, 크기) 지문 (동기)"""
+        fingerprint: List[Tuple[str, Optional[int], Optional[int]]] = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                fingerprint.append((str(path), None, None))
+                continue
+            fingerprint.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(fingerprint)
+
+    def _load(self) -> Tuple[PromptRegistry, Optional[str]]:
+        """파일을 읽어 새 레지스트리 생성 (동기, 스레드에서 실행)"""
+        hasher = hashlib.sha256()
+        merged: Dict[str, Dict[str, Any]] = {}
+        found = False
+
+        for path in self.paths:
+            try:
+                content = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            found = True
+            hasher.update(str(path).encode("utf-8"))
+            hasher.update(content)
+            for kind, prompts in _parse_prompt_file(path, content).items():
+                merged.setdefault(kind, {}).update(prompts)
+
+        if not found:
+            return self._base, None
+        return self._base.with_prompts(merged), hasher.hexdigest()
+
+
+# 전역 프롬프트 저장소 인스턴스
+_prompt_store: Optional[PromptStore] = None
+
+
+def get_prompt_store() -> PromptStore:
+    """프롬프트 저장소 인스턴스 반환"""
+    global _prompt_store
+
+    if _prompt_store is None:
+        _prompt_store = PromptStore()
+
+    return _prompt_store
@@ -35,7 +35,14 @@ SYSTEM_PROMPTS = {
 다양한 언어 간의 정확한 번역을 제공합니다.
 원문의 의미와 뉘앙스를 최대한 보존하면서 번역하세요.
 문화적 맥락과 관용 표현을 고려하세요.
-번역 결과만 제공하거나, 요청 시 설명도 포함하세요."""
+번역 결과만 제공하거나, 요청 시 설명도 포함하세요.""",
+
+    "tool_agent": """당신은 도구를 사용해 작업을 수행하는 AI 어시스턴트입니다.
+필요한 정보는 제공된 도구로 확인하고, 추측하지 마세요.
+서로 결과에 의존하지 않는 도구 호출은 한 번의 응답에서 모두 함께 요청하세요.
+이전 도구 결과가 필요한 호출만 다음 단계로 미루세요.
+충분한 정보를 얻으면 도구 없이 최종 답변을 작성하세요.
+한국어로 답변해주세요."""
 }
 
 # 사용자 프롬프트 템플릿
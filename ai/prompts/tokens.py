@@ -0,0 +1,75 @@
+"""토큰 수 계산"""
+
+import asyncio
+import threading
+from typing import Optional
+
+from loguru import logger
+
+# tiktoken 인코딩 (로드 실패 시 False로 표시하고 근사치 사용)
+_encoding = None
+_encoding_lock = threading.Lock()
+
+# 요청 처리 중 처음 필요해진 경우의 백그라운드 로드 스레드
+_loader: Optional[threading.Thread] = None
+_loader_lock = threading.Lock()
+
+
+def _get_encoding():
+    global _encoding
+
+    if _encoding is None:
+        with _encoding_lock:
+            if _encoding is None:
+                try:
+                    import tiktoken
+
+                    _encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    # 패키지가 없거나 오프라인 환경에서 인코딩 파일을 받지 못한 경우
+                    logger.info(f"tiktoken을 사용할 수 없어 근사 토큰 수를 사용합니다: {e}")
+                    _encoding = False
+    return _encoding or None
+
+
+async def load_encoding() -> bool:
+    """tiktoken 인코딩을 스레드에서 미리 로드 (애플리케이션 시작 시)
+
+    첫 로드는 인코딩 파일을 내려받을 수 있으므로 이벤트 루프를 막지 않도록 합니다.
+
+    Returns:
+        bool: tiktoken으로 정확한 토큰 수를 셀 수 있는지 여부
+    """
+    return await asyncio.to_thread(_get_encoding) is not None
+
+
+def _load_in_background():
+    global _loader
+
+    with _loader_lock:
+        if _loader is None:
+            _loader = threading.Thread(target=_get_encoding, name="tiktoken-load", daemon=True)
+            _loader.start()
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 기반 근사 토큰 수 (ASCII 약 4자당 1토큰, 한글 등은 1자당 약 1토큰)"""
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """텍스트의 토큰 수
+
+    tiktoken(cl100k_base)이 있으면 정확히 세고, 없으면 근사치를 반환합니다.
+    인코딩을 아직 로드하지 않았으면 기다리지 않고 백그라운드 로드를 시작한 뒤
+    근사치를 반환합니다 (시작 시 ``load_encoding()``으로 미리 로드).
+    """
+    if not text:
+        return 0
+    encoding = _encoding
+    if not encoding:
+        if encoding is None:
+            _load_in_background()
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
@@ -4,6 +4,7 @@ from .base import BaseLLMProvider, BaseEmbeddingProvider
 from .openai_provider import OpenAIProvider, OpenAIEmbeddingProvider
 from .anthropic_provider import AnthropicProvider
 from .google_provider import GoogleProvider
+from .local_provider import LocalEmbeddingProvider
 from .factory import get_llm_provider, get_embedding_provider, get_available_providers
 
 __all__ = [
@@ -13,6 +14,7 @@ __all__ = [
     "OpenAIEmbeddingProvider", 
     "AnthropicProvider",
     "GoogleProvider",
+    "LocalEmbeddingProvider",
     "OllamaProvider",
     "get_llm_provider",
     "get_embedding_provider",
@@ -1,15 +1,18 @@
 """LLM 프로바이더 기본 클래스"""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, AsyncIterator
+from typing import Any, Dict, List, Optional, AsyncIterator, Type
 from langchain_core.language_models import BaseChatModel
 from langchain_core.embeddings import Embeddings
+from pydantic import BaseModel
+
+from ai.parsers import astream_json
 
 
 class BaseLLMProvider(ABC):
     """LLM 프로바이더 기본 추상 클래스"""
     
-    def __init__(self, api_key: str = None, model_name: str = None, **kwargs):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, **kwargs):
         self.api_key = api_key
         self.model_name = model_name
         self.kwargs = kwargs
@@ -30,7 +33,7 @@ class BaseLLMProvider(ABC):
         pass
     
     @abstractmethod
-    async def stream_chat_completion(
+    def stream_chat_completion(
         self, 
         messages: List[Dict[str, str]], 
         **kwargs
@@ -38,6 +41,25 @@ class BaseLLMProvider(ABC):
         """스트리밍 채팅 완성"""
         pass
     
+    async def stream_json(
+        self,
+        messages: List[Dict[str, str]],
+        schema: Optional[Type[BaseModel]] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """JSON 응답을 스트리밍하며 최상위 필드가 완성될 때마다 이벤트 반환
+        
+        Args:
+            messages: 대화 메시지
+            schema: 마지막에 전체 값을 검증할 Pydantic 모델
+            **kwargs: 모델 설정
+        
+        Yields:
+            Dict[str, Any]: ``field`` 이벤트(name, value, partial)와 마지막 ``final`` 이벤트(value)
+        """
+        async for event in astream_json(self.stream_chat_completion(messages, **kwargs), schema):
+            yield event
+    
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -54,7 +76,7 @@ class BaseLLMProvider(ABC):
 class BaseEmbeddingProvider(ABC):
     """임베딩 프로바이더 기본 추상 클래스"""
     
-    def __init__(self, api_key: str, model_name: str = None, **kwargs):
+    def __init__(self, api_key: Optional[str], model_name: Optional[str] = None, **kwargs):
         self.api_key = api_key
         self.model_name = model_name
         self.kwargs = kwargs
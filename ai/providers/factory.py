@@ -6,13 +6,14 @@ from .openai_provider import OpenAIProvider, OpenAIEmbeddingProvider
 from .anthropic_provider import AnthropicProvider
 from .google_provider import GoogleProvider
 from .ollama_provider import OllamaProvider
+from .local_provider import LOCAL_MODEL_DIMENSIONS, get_local_embedding_provider
 from core.settings import settings
 
 
 def get_llm_provider(
-    provider_name: str = None,
-    api_key: str = None,
-    model_name: str = None,
+    provider_name: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
     **kwargs
 ) -> BaseLLMProvider:
     """LLM 프로바이더 인스턴스 반환
@@ -38,23 +39,26 @@ def get_llm_provider(
 
 
 def get_embedding_provider(
-    provider_name: str = None,
-    api_key: str = None,
-    model_name: str = None,
+    provider_name: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
     **kwargs
 ) -> BaseEmbeddingProvider:
     """임베딩 프로바이더 인스턴스 반환
     
     Args:
-        provider_name: 프로바이더 이름 (현재는 openai만 지원)
+        provider_name: 프로바이더 이름 (openai, local)
         api_key: API 키
         model_name: 모델 이름
         **kwargs: 추가 설정
     """
-    provider_name = provider_name or "openai"
+    provider_name = provider_name or settings.EMBEDDING_PROVIDER or "openai"
     
     if provider_name.lower() == "openai":
         return OpenAIEmbeddingProvider(api_key=api_key, model_name=model_name, **kwargs)
+    elif provider_name.lower() == "local":
+        # 모델을 한 번만 로드하도록 공유 인스턴스 사용
+        return get_local_embedding_provider(model_name=model_name, **kwargs)
     else:
         raise ValueError(f"지원하지 않는 임베딩 프로바이더: {provider_name}")
 
@@ -94,4 +98,12 @@ def get_available_providers() -> dict:
             "models": ollama_provider.available_models
         }
     
+    # 로컬 임베딩 (네트워크 불필요)
+    if settings.EMBEDDING_PROVIDER == "local":
+        providers["local"] = {
+            "name": "Local",
+            "models": [],
+            "embedding_models": list(LOCAL_MODEL_DIMENSIONS)
+        }
+    
     return providers 
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Google 프로바이더 구현"""
 
-from typing import AsyncIterator, Dict, List
+from typing import AsyncIterator, Dict, List, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.language_models import BaseChatModel
 
@@ -11,7 +11,7 @@ from core.settings import settings
 class GoogleProvider(BaseLLMProvider):
     """Google Gemini 프로바이더"""
     
-    def __init__(self, api_key: str = None, model_name: str = None, **kwargs):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, **kwargs):
         super().__init__(
             api_key=api_key or settings.GOOGLE_API_KEY,
             model_name=model_name or "gemini-pro",
@@ -0,0 +1,189 @@
+"""로컬(CPU) 임베딩 프로바이더 구현"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from .base import BaseEmbeddingProvider
+from core.settings import settings
+
+
+class LocalEmbeddings(Embeddings):
+    """로컬 임베딩 프로바이더를 감싼 Langchain Embeddings 어댑터"""
+
+    def __init__(self, provider: "LocalEmbeddingProvider"):
+        self.provider = provider
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.provider.encode(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.provider.encode([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.provider.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.provider.embed_text(text)
+
+
+class LocalEmbeddingProvider(BaseEmbeddingProvider):
+    """sentence-transformers 모델을 CPU에서 실행하는 로컬 임베딩 프로바이더
+
+    - 모델은 ``load`` 또는 첫 임베딩 요청 시 스레드에서 로드합니다.
+    - 추론은 전용 스레드에서 실행되어 이벤트 루프를 막지 않습니다
+      (PyTorch 연산 중에는 GIL이 해제됨).
+    - 쿼리는 문서와 별도의 스레드에서 추론하므로 대량 수집 중에도
+      문서 배치 뒤에서 기다리지 않습니다.
+    - 동시에 들어온 쿼리 임베딩 요청은 하나의 배치로 묶어 벡터화 추론합니다.
+    """
+
+    def __init__(
+        self, model_name: Optional[str] = None, batch_size: Optional[int] = None, **kwargs
+    ):
+        super().__init__(
+            api_key=None,
+            model_name=model_name or settings.LOCAL_EMBEDDING_MODEL,
+            **kwargs
+        )
+        self.batch_size = batch_size or settings.LOCAL_EMBEDDING_BATCH_SIZE
+        self._model: Any = None
+        self._model_lock = threading.Lock()
+        # 문서 배치와 쿼리는 각각 한 스레드에서 순서대로 실행 (모델은 공유)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="local-embedding")
+        self._query_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="local-embedding-query"
+        )
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _load_model(self):
+        """모델 로드 (최초 1회)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer  # type: ignore[import-not-found]
+                    except ImportError:
+                        raise ImportError(
+                            "로컬 임베딩에는 sentence-transformers 패키지가 필요합니다."
+                        )
+                    self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model
+
+    async def load(self):
+        """모델을 스레드에서 미리 로드 (이벤트 루프를 막지 않음)"""
+        if self._model is None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._load_model)
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        """텍스트 목록을 정규화된 벡터로 변환 (동기, 블로킹)"""
+        model = self._load_model()
+        vectors = model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    def get_embeddings(self, **kwargs) -> Embeddings:
+        """로컬 임베딩 모델 반환"""
+        return LocalEmbeddings(self)
+
+    async def embed_text(self, text: str, **kwargs) -> List[float]:
+        """텍스트 임베딩 (동시 요청은 배치로 묶어 처리)"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+
+        return await future
+
+    async def embed_documents(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """문서들 임베딩"""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.encode, texts)
+
+    async def _flush_pending(self):
+        """대기 중인 쿼리들을 배치 단위로 임베딩"""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch = self._pending[: self.batch_size]
+            self._pending = self._pending[self.batch_size:]
+
+            try:
+                vectors = await loop.run_in_executor(
+                    self._query_executor, self.encode, [text for text, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+    @property
+    def provider_name(self) -> str:
+        return "local"
+
+    @property
+    def available_models(self) -> List[str]:
+        return list(LOCAL_MODEL_DIMENSIONS)
+
+    @property
+    def embedding_dimension(self) -> int:
+        """임베딩 벡터 차원
+
+        Raises:
+            RuntimeError: 알 수 없는 모델을 로드하기 전에 이벤트 루프에서 호출한 경우
+        """
+        if self.model_name in LOCAL_MODEL_DIMENSIONS:
+            return LOCAL_MODEL_DIMENSIONS[self.model_name]
+        if self._model is None and _in_event_loop():
+            # 모델 로드(수 초)가 이벤트 루프를 막지 않도록 load()를 먼저 호출해야 함
+            raise RuntimeError(
+                f"'{self.model_name}' 모델의 임베딩 차원을 알 수 없습니다. "
+                "먼저 await load()로 모델을 로드하세요."
+            )
+        return self._load_model().get_sentence_embedding_dimension()
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+# 알려진 모델의 임베딩 차원 (모델을 로드하지 않고 벡터 저장소를 만들 수 있도록)
+LOCAL_MODEL_DIMENSIONS: Dict[str, int] = {
+    "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2": 384,
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "jhgan/ko-sroberta-multitask": 768,
+}
+
+
+# 모델별 공유 인스턴스 (모델을 한 번만 메모리에 올림)
+_local_providers: Dict[str, LocalEmbeddingProvider] = {}
+
+
+def get_local_embedding_provider(model_name: Optional[str] = None, **kwargs: Any) -> LocalEmbeddingProvider:
+    """로컬 임베딩 프로바이더 공유 인스턴스 반환"""
+    model_name = model_name or settings.LOCAL_EMBEDDING_MODEL
+
+    if model_name not in _local_providers:
+        _local_providers[model_name] = LocalEmbeddingProvider(model_name=model_name, **kwargs)
+
+    return _local_providers[model_name]
@@ -1,6 +1,6 @@
 """OpenAI 프로바이더 구현"""
 
-from typing import AsyncIterator, Dict, List
+from typing import AsyncIterator, Dict, List, Optional
 from langchain_ollama import ChatOllama
 from langchain_core.language_models import BaseChatModel
 from langchain_core.embeddings import Embeddings
@@ -12,7 +12,7 @@ from core.settings import settings
 class OllamaProvider(BaseLLMProvider):
     """Ollama LLM 프로바이더"""
     
-    def __init__(self, model_name: str = None, **kwargs):
+    def __init__(self, model_name: Optional[str] = None, **kwargs):
         super().__init__(
             model_name=model_name or settings.DEFAULT_LLM_MODEL,
             **kwargs
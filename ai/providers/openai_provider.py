@@ -1,6 +1,6 @@
 """OpenAI 프로바이더 구현"""
 
-from typing import AsyncIterator, Dict, List
+from typing import AsyncIterator, Dict, List, Optional
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.language_models import BaseChatModel
 from langchain_core.embeddings import Embeddings
@@ -12,7 +12,7 @@ from core.settings import settings
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI LLM 프로바이더"""
     
-    def __init__(self, api_key: str = None, model_name: str = None, **kwargs):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, **kwargs):
         super().__init__(
             api_key=api_key or settings.OPENAI_API_KEY,
             model_name=model_name or settings.DEFAULT_LLM_MODEL,
@@ -97,7 +97,7 @@ class OpenAIProvider(BaseLLMProvider):
 class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
     """OpenAI 임베딩 프로바이더"""
     
-    def __init__(self, api_key: str = None, model_name: str = None, **kwargs):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, **kwargs):
         super().__init__(
             api_key=api_key or settings.OPENAI_API_KEY,
             model_name=model_name or settings.DEFAULT_EMBEDDING_MODEL,
@@ -0,0 +1,23 @@
+"""지식 검색 모듈 (BM25 + 벡터 하이브리드 검색, 재순위화)"""
+
+from .bitmap import Bitmap
+from .bm25 import BM25Index
+from .filters import FilterExpression, MetadataIndex, tenant_filter
+from .fusion import reciprocal_rank_fusion
+from .knowledge_base import KnowledgeBase, get_knowledge_base
+from .rerank import CrossEncoderReranker, get_reranker
+from .tokenizer import tokenize
+
+__all__ = [
+    "Bitmap",
+    "BM25Index",
+    "CrossEncoderReranker",
+    "FilterExpression",
+    "KnowledgeBase",
+    "MetadataIndex",
+    "get_knowledge_base",
+    "get_reranker",
+    "reciprocal_rank_fusion",
+    "tenant_filter",
+    "tokenize",
+]
@@ -0,0 +1,172 @@
+"""Roaring 방식 압축 비트맵"""
+
+from typing import Dict, Iterable, Iterator
+
+import numpy as np
+
+# 컨테이너 하나가 담당하는 ID 범위 (하위 16비트)
+CONTAINER_BITS = 16
+CONTAINER_SIZE = 1 << CONTAINER_BITS
+# 원소 수가 이 값을 넘으면 정렬 배열 대신 비트맵 컨테이너 사용 (8KB 기준 손익분기점)
+ARRAY_LIMIT = 4096
+
+
+def _to_dense(container: np.ndarray) -> np.ndarray:
+    if container.dtype == np.bool_:
+        return container
+    dense = np.zeros(CONTAINER_SIZE, dtype=np.bool_)
+    dense[container] = True
+    return dense
+
+
+def _optimize(container: np.ndarray) -> np.ndarray:
+    """원소 수에 맞는 컨테이너 형태로 변환"""
+    if container.dtype == np.bool_:
+        if np.count_nonzero(container) <= ARRAY_LIMIT:
+            return np.flatnonzero(container).astype(np.uint16)
+        return container
+    if len(container) > ARRAY_LIMIT:
+        return _to_dense(container)
+    return container
+
+
+class Bitmap:
+    """Roaring 방식 압축 비트맵
+
+    정수 ID를 상위 16비트(컨테이너 키)와 하위 16비트로 나누고, 컨테이너는 원소 수에 따라
+    정렬된 uint16 배열(희소) 또는 65536 길이 불리언 배열(밀집)로 보관합니다.
+    """
+
+    __slots__ = ("_containers",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._containers: Dict[int, np.ndarray] = {}
+        self.add_many(ids)
+
+    def __len__(self) -> int:
+        return sum(
+            int(np.count_nonzero(c)) if c.dtype == np.bool_ else len(c)
+            for c in self._containers.values()
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._containers)
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._containers):
+            base = key << CONTAINER_BITS
+            container = self._containers[key]
+            lows = np.flatnonzero(container) if container.dtype == np.bool_ else container
+            for low in lows:
+                yield base + int(low)
+
+    def __contains__(self, doc_id: int) -> bool:
+        container = self._containers.get(doc_id >> CONTAINER_BITS)
+        if container is None:
+            return False
+        low = doc_id & (CONTAINER_SIZE - 1)
+        if container.dtype == np.bool_:
+            return bool(container[low])
+        index = np.searchsorted(container, low)
+        return bool(index < len(container) and container[index] == low)
+
+    def add_many(self, ids: Iterable[int]):
+        """ID 일괄 추가"""
+        values = np.fromiter(ids, dtype=np.int64)
+        if len(values) == 0:
+            return
+
+        keys = values >> CONTAINER_BITS
+        for key in np.unique(keys):
+            lows = (values[keys == key] & (CONTAINER_SIZE - 1)).astype(np.uint16)
+            current = self._containers.get(int(key))
+            if current is None:
+                merged = np.unique(lows)
+            elif current.dtype == np.bool_:
+                current[lows] = True
+                merged = current
+            else:
+                merged = np.union1d(current, lows).astype(np.uint16)
+            self._containers[int(key)] = _optimize(merged)
+
+    def add(self, doc_id: int):
+        """ID 추가"""
+        self.add_many((doc_id,))
+
+    def discard(self, doc_id: int):
+        """ID 제거"""
+        key = doc_id >> CONTAINER_BITS
+        container = self._containers.get(key)
+        if container is None:
+            return
+
+        low = doc_id & (CONTAINER_SIZE - 1)
+        if container.dtype == np.bool_:
+            container[low] = False
+            updated = container
+        else:
+            updated = container[container != low]
+
+        updated = _optimize(updated)
+        if len(updated) == 0 or (
+            updated.dtype == np.bool_ and not updated.any()
+        ):
+            del self._containers[key]
+        else:
+            self._containers[key] = updated
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for key in self._containers.keys() & other._containers.keys():
+            a, b = self._containers[key], other._containers[key]
+            if a.dtype == np.bool_ and b.dtype == np.bool_:
+                merged = a & b
+            elif a.dtype == np.bool_:
+                merged = b[a[b]]
+            elif b.dtype == np.bool_:
+                merged = a[b[a]]
+            else:
+                merged = np.intersect1d(a, b, assume_unique=True).astype(np.uint16)
+
+            merged = _optimize(merged)
+            if np.count_nonzero(merged) if merged.dtype == np.bool_ else len(merged):
+                result._containers[key] = merged
+        return result
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        result = Bitmap()
+        for key in self._containers.keys() | other._containers.keys():
+            a, b = self._containers.get(key), other._containers.get(key)
+            if b is None:
+                merged = self._containers[key].copy()
+            elif a is None:
+                merged = b.copy()
+            elif a.dtype == np.bool_ or b.dtype == np.bool_:
+                merged = _optimize(_to_dense(a) | _to_dense(b))
+            else:
+                merged = _optimize(np.union1d(a, b).astype(np.uint16))
+            result._containers[key] = merged
+        return result
+
+    @classmethod
+    def union(cls, bitmaps: Iterable["Bitmap"]) -> "Bitmap":
+        """여러 비트맵의 합집합"""
+        result = cls()
+        for bitmap in bitmaps:
+            result = result | bitmap
+        return result
+
+    def to_mask(self, size: int) -> np.ndarray:
+        """길이 size의 불리언 마스크로 변환 (벡터 스캔에 직접 사용)"""
+        mask = np.zeros(size, dtype=np.bool_)
+        for key, container in self._containers.items():
+            base = key << CONTAINER_BITS
+            if base >= size:
+                continue
+            if container.dtype == np.bool_:
+                stop = min(base + CONTAINER_SIZE, size)
+                mask[base:stop] = container[: stop - base]
+            else:
+                positions = base + container.astype(np.int64)
+                mask[positions[positions < size]] = True
+        return mask
@@ -0,0 +1,151 @@
+"""역색인 기반 BM25 키워드 검색 엔진"""
+
+import math
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ai.embeddings.vector_store import top_indices
+from .tokenizer import tokenize
+
+
+class _Postings:
+    """용어별 포스팅 목록 (문서 ID / 용어 빈도를 압축 배열로 보관)"""
+
+    __slots__ = ("doc_ids", "term_freqs")
+
+    def __init__(self):
+        self.doc_ids = array("I")
+        self.term_freqs = array("H")
+
+
+class BM25Index:
+    """증분 업데이트를 지원하는 BM25 역색인
+
+    문서 ID는 벡터 스토어 행 ID와 같은 정수를 사용하며, 삭제는 툼스톤으로 처리합니다.
+
+    Args:
+        k1: 용어 빈도 포화 계수
+        b: 문서 길이 정규화 계수
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, _Postings] = {}
+        self._doc_lengths = array("I")
+        self._deleted: Set[int] = set()
+        self._total_length = 0
+        self._doc_count = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._doc_count
+
+    def add(self, doc_id: int, text: str):
+        """문서 추가"""
+        term_counts = Counter(tokenize(text))
+        length = sum(term_counts.values())
+
+        with self._lock:
+            if doc_id < len(self._doc_lengths):
+                raise ValueError(f"이미 색인된 문서 ID입니다: {doc_id}")
+
+            # 다른 인덱스에만 추가된 ID가 있으면 빈 문서로 채움
+            while len(self._doc_lengths) < doc_id:
+                self._doc_lengths.append(0)
+                self._deleted.add(len(self._doc_lengths) - 1)
+            self._doc_lengths.append(length)
+
+            for term, count in term_counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = _Postings()
+                postings.doc_ids.append(doc_id)
+                postings.term_freqs.append(min(count, 65535))
+
+            self._total_length += length
+            self._doc_count += 1
+
+    def delete(self, doc_id: int):
+        """문서 삭제 (툼스톤 처리)"""
+        with self._lock:
+            if doc_id >= len(self._doc_lengths) or doc_id in self._deleted:
+                return
+            self._deleted.add(doc_id)
+            self._total_length -= self._doc_lengths[doc_id]
+            self._doc_count -= 1
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        mask: Optional[np.ndarray] = None,
+    ) -> List[Tuple[int, float]]:
+        """쿼리와 가장 관련 있는 (문서 ID, BM25 점수) 목록
+
+        Args:
+            query: 검색어
+            top_k: 반환할 결과 수
+            mask: 검색 대상 문서 마스크 (메타데이터 필터, None이면 전체)
+        """
+        terms = set(tokenize(query))
+        if not terms or top_k <= 0:
+            return []
+
+        # 잠금 안에서는 필요한 배열만 복사하고 점수 계산은 잠금 밖에서 수행
+        # (이벤트 루프에서 호출되는 add가 큰 검색을 기다리지 않도록)
+        with self._lock:
+            doc_count = self._doc_count
+            if doc_count == 0:
+                return []
+
+            total_length = self._total_length
+            doc_lengths = np.array(self._doc_lengths, dtype=np.float32)
+            deleted = list(self._deleted)
+            term_postings = [
+                (
+                    np.array(postings.doc_ids, dtype=np.int64),
+                    np.array(postings.term_freqs, dtype=np.float32),
+                )
+                for postings in map(self._postings.get, terms)
+                if postings is not None
+            ]
+
+        avg_length = total_length / doc_count
+        length_norm = self.k1 * (1.0 - self.b + self.b * doc_lengths / avg_length)
+        scores = np.zeros(len(doc_lengths), dtype=np.float32)
+        live = None
+        if deleted:
+            live = np.ones(len(doc_lengths), dtype=np.bool_)
+            live[deleted] = False
+
+        for doc_ids, term_freqs in term_postings:
+            # 삭제된 문서는 문서 빈도에서 제외 (idf가 음수가 되지 않도록)
+            df = len(doc_ids) if live is None else int(live[doc_ids].sum())
+            if df == 0:
+                continue
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+            scores[doc_ids] += (
+                idf * term_freqs * (self.k1 + 1.0)
+                / (term_freqs + length_norm[doc_ids])
+            )
+
+        if live is not None:
+            scores[~live] = 0.0
+
+        if mask is not None:
+            allowed = np.zeros(len(scores), dtype=np.bool_)
+            size = min(len(mask), len(scores))
+            allowed[:size] = mask[:size]
+            scores[~allowed] = 0.0
+
+        matched = np.flatnonzero(scores > 0)
+        if len(matched) == 0:
+            return []
+
+        order = matched[top_indices(scores[matched], top_k)]
+        return [(int(i), float(scores[i])) for i in order]
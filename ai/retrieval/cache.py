@@ -0,0 +1,57 @@
+"""검색 캐시 (쿼리 임베딩, 검색 결과)"""
+
+import json
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (소문자, 공백 정리)"""
+    return " ".join(query.lower().split())
+
+
+def filters_key(filters: Optional[Sequence[Any]]) -> Tuple:
+    """필터 표현식을 해시 가능한 키로 변환 (순서 무관)"""
+    if not filters:
+        return ()
+    return tuple(sorted(
+        (f.field, f.op, json.dumps(f.value, sort_keys=True, default=str))
+        for f in filters
+    ))
+
+
+class LRUCache:
+    """최근 사용 순서로 제거하는 고정 크기 캐시
+
+    Args:
+        maxsize: 최대 항목 수 (0이면 캐시하지 않음)
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
@@ -0,0 +1,144 @@
+"""청크 메타데이터 비트맵 인덱스"""
+
+import bisect
+from datetime import date, datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from .bitmap import Bitmap
+
+# 값 일치로 필터링하는 필드
+KEYWORD_FIELDS = ("tenant", "source", "document_type")
+# 범위로 필터링하는 날짜 필드
+DATE_FIELD = "date"
+FILTER_FIELDS = KEYWORD_FIELDS + (DATE_FIELD,)
+KEYWORD_OPS = ("eq", "in")
+DATE_OPS = ("eq", "gte", "lte", "between")
+
+
+class FilterExpression(NamedTuple):
+    """서버에서 만드는 필터 표현식 (MetadataFilter 스키마와 같은 속성)"""
+
+    field: str
+    op: str
+    value: Any
+
+
+def tenant_filter(tenant: Optional[str]) -> FilterExpression:
+    """호출자 테넌트의 청크만 허용하는 필터 (None이면 테넌트 없이 색인된 청크)"""
+    return FilterExpression("tenant", "eq", tenant)
+
+
+def to_date(value: Any) -> date:
+    """date / datetime / ISO 문자열을 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+class MetadataIndex:
+    """필드 값별 비트맵 인덱스
+
+    필터 표현식을 비트맵 AND/OR로 평가해 허용 청크 집합을 만들고,
+    검색기는 이 집합을 top-k 이전 스캔 단계의 마스크로 사용합니다.
+    값 필드는 값이 없는 청크도 None 값으로 색인합니다 (테넌트 없는 청크 필터용).
+    날짜는 일 단위 버킷으로 색인하고 범위 조건은 버킷 비트맵의 합집합으로 계산합니다.
+    """
+
+    def __init__(self):
+        self._keywords: Dict[str, Dict[Any, Bitmap]] = {
+            field: {} for field in KEYWORD_FIELDS
+        }
+        self._dates: Dict[date, Bitmap] = {}
+        self._sorted_dates: List[date] = []
+
+    def add(self, chunk_id: int, metadata: Dict[str, Any]):
+        """청크 메타데이터 색인"""
+        for field in KEYWORD_FIELDS:
+            self._keywords[field].setdefault(metadata.get(field), Bitmap()).add(chunk_id)
+
+        value = metadata.get(DATE_FIELD)
+        if value is not None:
+            day = to_date(value)
+            if day not in self._dates:
+                self._dates[day] = Bitmap()
+                bisect.insort(self._sorted_dates, day)
+            self._dates[day].add(chunk_id)
+
+    def remove(self, chunk_id: int, metadata: Dict[str, Any]):
+        """청크 메타데이터 색인 제거"""
+        for field in KEYWORD_FIELDS:
+            bitmap = self._keywords[field].get(metadata.get(field))
+            if bitmap is not None:
+                bitmap.discard(chunk_id)
+
+        value = metadata.get(DATE_FIELD)
+        if value is not None:
+            bitmap = self._dates.get(to_date(value))
+            if bitmap is not None:
+                bitmap.discard(chunk_id)
+
+    def evaluate(self, filters: Sequence[Any]) -> Optional[Bitmap]:
+        """필터 표현식 목록을 AND 결합해 허용 청크 비트맵 반환
+
+        Args:
+            filters: field / op / value 속성을 가진 필터 (MetadataFilter 스키마)
+
+        Returns:
+            Optional[Bitmap]: 허용 청크 집합 (필터가 없으면 None)
+
+        Raises:
+            ValueError: 지원하지 않는 필드/연산자 또는 연산자에 맞지 않는 값
+        """
+        result: Optional[Bitmap] = None
+
+        for expression in filters:
+            try:
+                bitmap = self._evaluate_one(expression.field, expression.op, expression.value)
+            except (TypeError, IndexError) as e:
+                raise ValueError(
+                    f"잘못된 필터 값: {expression.field} {expression.op} {expression.value!r}"
+                ) from e
+            result = bitmap if result is None else result & bitmap
+            if not result:
+                break
+
+        return result
+
+    def _evaluate_one(self, field: str, op: str, value: Any) -> Bitmap:
+        if field in KEYWORD_FIELDS:
+            values = self._keywords[field]
+            if op == "eq":
+                return values.get(value) or Bitmap()
+            if op == "in":
+                if isinstance(value, (str, bytes)):
+                    raise TypeError("in 연산자에는 목록이 필요합니다")
+                return Bitmap.union(values[v] for v in value if v in values)
+            raise ValueError(f"'{field}' 필드에서 지원하지 않는 연산자: {op}")
+
+        if field == DATE_FIELD:
+            if op == "eq":
+                start = end = to_date(value)
+            elif op == "gte":
+                start, end = to_date(value), None
+            elif op == "lte":
+                start, end = None, to_date(value)
+            elif op == "between":
+                if isinstance(value, (str, bytes)) or len(value) != 2:
+                    raise TypeError("between 연산자에는 [시작일, 종료일]이 필요합니다")
+                start, end = to_date(value[0]), to_date(value[1])
+            else:
+                raise ValueError(f"'{field}' 필드에서 지원하지 않는 연산자: {op}")
+            return self._date_range(start, end)
+
+        raise ValueError(f"지원하지 않는 필터 필드: {field}")
+
+    def _date_range(self, start: Optional[date], end: Optional[date]) -> Bitmap:
+        low = 0 if start is None else bisect.bisect_left(self._sorted_dates, start)
+        high = (
+            len(self._sorted_dates)
+            if end is None
+            else bisect.bisect_right(self._sorted_dates, end)
+        )
+        return Bitmap.union(self._dates[day] for day in self._sorted_dates[low:high])
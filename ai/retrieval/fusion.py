@@ -0,0 +1,31 @@
+"""검색 결과 병합 (Reciprocal Rank Fusion)"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[Sequence[int]],
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[int, float]]:
+    """여러 검색 결과 순위를 RRF 점수로 병합
+
+    score(d) = Σ weight_i / (k + rank_i(d)), rank는 1부터 시작합니다.
+    점수 척도가 다른 검색기(BM25, 코사인 유사도)를 정규화 없이 합칠 수 있습니다.
+
+    Args:
+        ranked_lists: 검색기별 문서 ID 순위 목록
+        k: 하위 순위 영향도를 조절하는 상수
+        weights: 검색기별 가중치 (기본값: 모두 1.0)
+
+    Returns:
+        List[Tuple[int, float]]: RRF 점수 내림차순 (문서 ID, 점수) 목록
+    """
+    weights = weights or [1.0] * len(ranked_lists)
+    fused: Dict[int, float] = {}
+
+    for ranked, weight in zip(ranked_lists, weights):
+        for rank, doc_id in enumerate(ranked, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + weight / (k + rank)
+
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
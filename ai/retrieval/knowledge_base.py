@@ -0,0 +1,267 @@
+"""하이브리드 지식 베이스 (벡터 + BM25)"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from ai.embeddings import VectorStore, get_vector_store
+from ai.providers import get_embedding_provider
+from ai.providers.base import BaseEmbeddingProvider
+from core.settings import settings
+from .bm25 import BM25Index
+from .cache import LRUCache, filters_key, normalize_query
+from .filters import MetadataIndex
+from .fusion import reciprocal_rank_fusion
+from .rerank import CrossEncoderReranker, get_reranker
+
+SEARCH_MODES = ("vector", "keyword", "hybrid")
+
+
+class KnowledgeBase:
+    """벡터 인덱스와 BM25 역색인을 같은 청크 ID로 함께 관리하는 지식 베이스
+
+    하이브리드 검색은 두 검색기를 동시에 실행하고 RRF로 병합하므로
+    지연 시간은 두 검색기의 합이 아니라 더 느린 쪽에 맞춰집니다.
+    """
+
+    def __init__(
+        self,
+        embedding_provider: BaseEmbeddingProvider,
+        vector_store: Optional[VectorStore] = None,
+        keyword_index: Optional[BM25Index] = None,
+        reranker: Optional[CrossEncoderReranker] = None,
+    ):
+        self.embedding_provider = embedding_provider
+        self.vector_store = (
+            vector_store if vector_store is not None else get_vector_store(embedding_provider)
+        )
+        self.keyword_index = keyword_index if keyword_index is not None else BM25Index()
+        self._reranker = reranker
+        self.metadata_index = MetadataIndex()
+        self.chunks: List[Optional[Dict[str, Any]]] = []
+        # 문서 ID별 남은 청크 수
+        self._documents: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+        # 색인이 바뀔 때마다 증가 (검색 결과 캐시 무효화 기준)
+        self.version = 0
+        self.embedding_cache = LRUCache(settings.SEARCH_EMBEDDING_CACHE_SIZE)
+        self.result_cache = LRUCache(settings.SEARCH_RESULT_CACHE_SIZE)
+        self._result_cache_version = 0
+
+    def __len__(self) -> int:
+        return len(self.chunks) - self.chunks.count(None)
+
+    def document_ids(self) -> Set[str]:
+        """색인된 청크가 남아 있는 문서 ID"""
+        return set(self._documents)
+
+    def has_document(self, document_id: Optional[str]) -> bool:
+        """문서의 청크가 색인되어 있는지 확인"""
+        return document_id in self._documents
+
+    async def add_texts(
+        self,
+        texts: Sequence[str],
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> List[int]:
+        """청크 추가 후 할당된 청크 ID 반환
+
+        Args:
+            texts: 청크 텍스트 목록
+            metadatas: 청크별 메타데이터
+            embeddings: 미리 계산된 임베딩 (없으면 프로바이더로 생성)
+        """
+        if not texts:
+            return []
+
+        metadatas = metadatas or [{} for _ in texts]
+        if embeddings is None:
+            embeddings = await self.embedding_provider.embed_documents(list(texts))
+
+        async with self._lock:
+            # 양자화 재보정 시 기존 코드를 다시 인코딩하므로 스레드에서 실행
+            ids = await asyncio.to_thread(self.vector_store.add, embeddings)
+            for chunk_id, text, metadata in zip(ids, texts, metadatas):
+                self.chunks.append({"content": text, "metadata": dict(metadata)})
+                self.keyword_index.add(chunk_id, text)
+                self.metadata_index.add(chunk_id, metadata)
+                document_id = metadata.get("document_id")
+                if document_id is not None:
+                    self._documents[document_id] = self._documents.get(document_id, 0) + 1
+            self.version += 1
+
+        return ids
+
+    async def delete(self, ids: Sequence[int]):
+        """청크 삭제"""
+        async with self._lock:
+            self.vector_store.delete(ids)
+            for chunk_id in ids:
+                chunk = self.chunks[chunk_id]
+                if chunk is None:
+                    continue
+                self.keyword_index.delete(chunk_id)
+                self.metadata_index.remove(chunk_id, chunk["metadata"])
+                self.chunks[chunk_id] = None
+                document_id = chunk["metadata"].get("document_id")
+                if document_id in self._documents:
+                    self._documents[document_id] -= 1
+                    if not self._documents[document_id]:
+                        del self._documents[document_id]
+            self.version += 1
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        mode: str = "hybrid",
+        threshold: float = 0.0,
+        filters: Optional[Sequence[Any]] = None,
+        rerank: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """지식 베이스 검색
+
+        Args:
+            query: 검색어
+            top_k: 반환할 결과 수
+            mode: 검색 방식 (vector, keyword, hybrid)
+            threshold: 벡터 유사도 임계값 (키워드 결과에는 적용하지 않음)
+            filters: 메타데이터 필터 표현식 (AND 결합, 스캔 단계에서 마스크로 적용)
+            rerank: 상위 후보를 크로스 인코더로 재정렬할지 여부
+
+        Returns:
+            List[Dict[str, Any]]: 점수 내림차순 검색 결과
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"지원하지 않는 검색 방식: {mode}")
+        if not self.chunks:
+            return []
+
+        # 색인 버전이 바뀌었으면 이전 결과는 모두 무효
+        if self._result_cache_version != self.version:
+            self.result_cache.clear()
+            self._result_cache_version = self.version
+
+        cache_key = (
+            normalize_query(query), top_k, mode, threshold, filters_key(filters), rerank, self.version
+        )
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return [dict(result) for result in cached]
+
+        results, cacheable = await self._search(query, top_k, mode, threshold, filters, rerank)
+        # 검색 중 색인이 바뀌었으면 캐시하지 않음
+        if cacheable and cache_key[-1] == self.version:
+            self.result_cache.set(cache_key, [dict(result) for result in results])
+        return results
+
+    async def _search(
+        self,
+        query: str,
+        top_k: int,
+        mode: str,
+        threshold: float,
+        filters: Optional[Sequence[Any]],
+        rerank: bool,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """캐시를 거치지 않는 실제 검색 (결과와 캐시 가능 여부 반환)"""
+        # 필터는 top-k 이후가 아니라 스캔 단계에서 적용해야 재현율이 유지됨
+        mask = None
+        if filters:
+            allowed = self.metadata_index.evaluate(filters)
+            if not allowed:
+                return [], True
+            mask = allowed.to_mask(len(self.chunks))
+
+        # 재순위화하면 top_k보다 넉넉한 후보를 뽑아 다시 정렬
+        final_k = top_k
+        if rerank:
+            top_k = max(top_k, settings.RERANK_CANDIDATES)
+
+        candidate_k = max(top_k, settings.SEARCH_CANDIDATE_K)
+        vector_hits: List = []
+        keyword_hits: List = []
+
+        if mode == "vector":
+            vector_hits = await self._vector_search(query, top_k, mask)
+        elif mode == "keyword":
+            keyword_hits = await asyncio.to_thread(
+                self.keyword_index.search, query, top_k, mask
+            )
+        else:
+            vector_hits, keyword_hits = await asyncio.gather(
+                self._vector_search(query, candidate_k, mask),
+                asyncio.to_thread(self.keyword_index.search, query, candidate_k, mask),
+            )
+
+        vector_hits = [(i, s) for i, s in vector_hits if s >= threshold]
+        vector_scores = dict(vector_hits)
+        keyword_scores = dict(keyword_hits)
+
+        if mode == "hybrid":
+            ranked = reciprocal_rank_fusion(
+                [[i for i, _ in vector_hits], [i for i, _ in keyword_hits]],
+                k=settings.HYBRID_RRF_K,
+            )
+        else:
+            ranked = vector_hits or keyword_hits
+
+        results = []
+        for chunk_id, score in ranked:
+            chunk = self.chunks[chunk_id]
+            if chunk is None:
+                continue
+            results.append({
+                "id": chunk_id,
+                "content": chunk["content"],
+                "score": score,
+                "vector_score": vector_scores.get(chunk_id),
+                "keyword_score": keyword_scores.get(chunk_id),
+                "source": chunk["metadata"].get("source"),
+                "metadata": chunk["metadata"],
+            })
+            if len(results) >= top_k:
+                break
+
+        if rerank and results:
+            # 예산 초과로 1차 순서를 쓴 결과는 캐시하지 않음
+            results, reranked = await self.reranker.rerank(query, results, final_k)
+            return results, reranked
+
+        return results, True
+
+    @property
+    def reranker(self) -> CrossEncoderReranker:
+        """재순위화기 (첫 사용 시 전역 인스턴스 사용)"""
+        if self._reranker is None:
+            self._reranker = get_reranker()
+        return self._reranker
+
+    async def _vector_search(
+        self, query: str, top_k: int, mask: Optional[np.ndarray] = None
+    ) -> List:
+        """쿼리 임베딩 후 벡터 스캔 (스캔은 스레드에서 실행)"""
+        key = normalize_query(query)
+        embedding = self.embedding_cache.get(key)
+        if embedding is None:
+            embedding = await self.embedding_provider.embed_text(query)
+            self.embedding_cache.set(key, embedding)
+        return await asyncio.to_thread(self.vector_store.search, embedding, top_k, mask)
+
+
+# 전역 지식 베이스 인스턴스 (첫 사용 시 생성)
+_knowledge_base: Optional[KnowledgeBase] = None
+
+
+def get_knowledge_base() -> KnowledgeBase:
+    """지식 베이스 인스턴스 반환"""
+    global _knowledge_base
+
+    if _knowledge_base is None:
+        _knowledge_base = KnowledgeBase(get_embedding_provider())
+
+    return _knowledge_base
@@ -0,0 +1,180 @@
+"""크로스 인코더 재순위화"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from core.settings import settings
+from .cache import normalize_query
+
+
+def query_hash(query: str) -> str:
+    """정규화한 쿼리의 해시 (캐시 키용)"""
+    return hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+
+
+class CrossEncoderReranker:
+    """(쿼리, 청크) 쌍을 로컬 크로스 인코더로 채점해 1차 검색 결과를 재정렬
+
+    - 점수는 (쿼리 해시, 청크 ID)로 LRU 캐시하므로 반복 쿼리는 새 쌍만 채점합니다.
+    - 쌍당 채점 시간을 이동 평균으로 추정해, 예산을 넘길 것 같으면 채점하지 않고
+      1차 검색 순서를 그대로 반환합니다. 채점 중 예산을 넘겨도 마찬가지이며,
+      이때 백그라운드에서 끝난 점수는 캐시에 남아 다음 요청에 쓰입니다.
+    - 건너뛸 때도 예산 안에 들어갈 만큼의 쌍은 백그라운드에서 채점해(한 번에 하나)
+      추정치를 갱신하므로, 일시적으로 느려진 뒤에도 재순위화가 다시 켜집니다.
+
+    Args:
+        model_name: 크로스 인코더 모델 이름
+        batch_size: 추론 배치 크기
+        budget_ms: 재순위화 지연 예산(ms)
+        cache_size: 캐시할 최대 점수 수
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        budget_ms: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ):
+        self.model_name = model_name or settings.RERANK_MODEL
+        self.batch_size = batch_size or settings.RERANK_BATCH_SIZE
+        self.budget = (budget_ms or settings.RERANK_BUDGET_MS) / 1000
+        self.cache_size = cache_size or settings.RERANK_CACHE_SIZE
+
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+        self._cache: "OrderedDict[Tuple[str, int], float]" = OrderedDict()
+        self._seconds_per_pair: Optional[float] = None
+        self._sampling: Optional[asyncio.Future] = None
+
+    def _load_model(self):
+        """모델 로드 (최초 1회)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import CrossEncoder  # type: ignore[import-not-found]
+                    except ImportError:
+                        raise ImportError("재순위화에는 sentence-transformers 패키지가 필요합니다.")
+                    self._model = CrossEncoder(self.model_name, device="cpu")
+        return self._model
+
+    def _score(self, query: str, texts: List[str]) -> List[float]:
+        """(쿼리, 텍스트) 쌍 배치 채점 (동기, 블로킹)"""
+        model = self._load_model()
+        started = time.perf_counter()
+        scores = model.predict(
+            [(query, text) for text in texts],
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+        self._observe((time.perf_counter() - started) / len(texts))
+        return scores.tolist()
+
+    def _observe(self, seconds_per_pair: float):
+        if self._seconds_per_pair is None:
+            self._seconds_per_pair = seconds_per_pair
+        else:
+            self._seconds_per_pair = 0.8 * self._seconds_per_pair + 0.2 * seconds_per_pair
+
+    async def rerank(
+        self,
+        query: str,
+        results: Sequence[Dict[str, Any]],
+        top_k: int,
+        budget: Optional[float] = None,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """검색 결과 재정렬
+
+        Args:
+            query: 검색어
+            results: 1차 검색 결과 (``id``, ``content`` 포함)
+            top_k: 반환할 결과 수
+            budget: 지연 예산(초, 기본값: 설정값)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: 결과와 재정렬 여부 (False면 1차 순서)
+        """
+        budget = self.budget if budget is None else budget
+        key = query_hash(query)
+        missing = [result for result in results if (key, result["id"]) not in self._cache]
+
+        if missing:
+            if (
+                self._seconds_per_pair is not None
+                and self._seconds_per_pair * len(missing) > budget
+            ):
+                self._sample(key, query, missing, budget)
+                return list(results[:top_k]), False
+
+            future = self._submit(key, query, missing)
+            try:
+                await asyncio.wait_for(asyncio.shield(future), timeout=budget)
+            except asyncio.TimeoutError:
+                return list(results[:top_k]), False
+            except Exception as e:
+                logger.warning(f"재순위화 실패, 1차 검색 순서 사용: {e}")
+                return list(results[:top_k]), False
+
+        reranked = []
+        for result in results:
+            score = self._cache.get((key, result["id"]))
+            if score is None:
+                return list(results[:top_k]), False
+            self._cache.move_to_end((key, result["id"]))
+            reranked.append({**result, "rerank_score": score})
+
+        reranked.sort(key=lambda result: result["rerank_score"], reverse=True)
+        return reranked[:top_k], True
+
+    def _submit(
+        self, key: str, query: str, missing: Sequence[Dict[str, Any]]
+    ) -> asyncio.Future:
+        """채점 작업 제출 (예산 초과로 포기해도 계산이 끝나면 점수를 캐시에 남김)"""
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._score, query, [result["content"] for result in missing]
+        )
+        ids = [result["id"] for result in missing]
+        future.add_done_callback(lambda f: self._store(key, ids, f))
+        return future
+
+    def _sample(
+        self, key: str, query: str, missing: Sequence[Dict[str, Any]], budget: float
+    ):
+        """예산 안에 들어갈 만큼(최소 1쌍)만 백그라운드에서 채점해 추정치 갱신"""
+        if self._sampling is not None and not self._sampling.done():
+            return
+        count = max(1, int(budget / self._seconds_per_pair)) if self._seconds_per_pair else 1
+        self._sampling = self._submit(key, query, missing[:count])
+
+    def _store(self, key: str, ids: List[int], future: asyncio.Future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        for chunk_id, score in zip(ids, future.result()):
+            self._cache[(key, chunk_id)] = score
+            self._cache.move_to_end((key, chunk_id))
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+# 전역 재순위화기 인스턴스
+_reranker: Optional[CrossEncoderReranker] = None
+
+
+def get_reranker() -> CrossEncoderReranker:
+    """재순위화기 인스턴스 반환"""
+    global _reranker
+
+    if _reranker is None:
+        _reranker = CrossEncoderReranker()
+
+    return _reranker
@@ -0,0 +1,54 @@
+"""키워드 검색용 한국어 토크나이저"""
+
+import re
+from typing import List
+
+# 한글 어절 또는 영숫자 토큰 (AB-1234, v2.1 같은 제품 코드 포함)
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+(?:[-_./][a-z0-9]+)*")
+_CODE_SEPARATORS = re.compile(r"[-_./]")
+
+# 어절 끝에서 떼어낼 조사/어미 (긴 것부터 매칭)
+JOSA_SUFFIXES = sorted(
+    [
+        "은", "는", "이", "가", "을", "를", "의", "에", "도", "만", "와", "과", "로",
+        "으로", "에서", "에게", "께서", "까지", "부터", "보다", "처럼", "마다", "이나",
+        "이랑", "하고", "한테", "에서는", "으로는", "에게서", "이다", "입니다", "였다",
+        "했다", "하다", "합니다", "했습니다", "된다", "됩니다",
+    ],
+    key=len,
+    reverse=True,
+)
+
+
+def strip_josa(word: str) -> str:
+    """한글 어절에서 조사/어미 제거 (어간이 한 글자 이상 남는 경우만)"""
+    for suffix in JOSA_SUFFIXES:
+        if len(word) > len(suffix) and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 검색 토큰 목록으로 변환
+
+    - 한글: 조사를 제거한 어간과 글자 bigram (복합명사 부분 일치용)
+    - 영숫자: 소문자 토큰, 제품 코드는 원형/구분자 제거형/구성 요소를 모두 포함
+    """
+    tokens: List[str] = []
+
+    for match in _TOKEN_PATTERN.finditer(text.lower()):
+        word = match.group()
+
+        if "가" <= word[0] <= "힣":
+            stem = strip_josa(word)
+            tokens.append(stem)
+            if len(stem) > 2:
+                tokens.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+        else:
+            tokens.append(word)
+            parts = _CODE_SEPARATORS.split(word)
+            if len(parts) > 1:
+                tokens.append("".join(parts))
+                tokens.extend(part for part in parts if part)
+
+    return tokens
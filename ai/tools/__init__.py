@@ -0,0 +1,18 @@
+"""에이전트 도구 모듈 (로컬 Python 도구 + MCP 도구)"""
+
+from .base import Tool, ToolError, signature_schema, tool
+from .builtin import BUILTIN_TOOLS, current_tenant
+from .registry import ToolRegistry, get_available_tools, get_tool_registry, mcp_tool_name
+
+__all__ = [
+    "BUILTIN_TOOLS",
+    "Tool",
+    "ToolError",
+    "ToolRegistry",
+    "current_tenant",
+    "get_available_tools",
+    "get_tool_registry",
+    "mcp_tool_name",
+    "signature_schema",
+    "tool",
+]
@@ -0,0 +1,137 @@
+"""에이전트 도구 정의"""
+
+import asyncio
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Union, get_args, get_origin, get_type_hints
+
+from ai.mcp.schema import Validator, compile_schema
+
+_JSON_TYPES: Dict[Any, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    dict: "object",
+    list: "array",
+}
+
+
+class ToolError(Exception):
+    """도구 실행 실패 (메시지는 LLM에 그대로 전달)"""
+
+
+class Tool(NamedTuple):
+    """LLM이 호출할 수 있는 도구
+
+    Attributes:
+        name: 도구 이름 (LLM API 제약상 영문/숫자/_/- 64자 이하)
+        description: 도구 설명
+        parameters: 인자 JSON Schema
+        func: 키워드 인자로 호출하는 비동기 함수
+        source: ``local`` 또는 ``mcp:<서버>``
+        validate: 컴파일된 인자 검증기
+    """
+
+    name: str
+    description: str
+    parameters: Dict[str, Any]
+    func: Callable[..., Awaitable[Any]]
+    source: str = "local"
+    validate: Optional[Validator] = None
+
+    def schema(self) -> Dict[str, Any]:
+        """``bind_tools``에 넘길 함수 정의 (OpenAI 형식)"""
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters or {"type": "object", "properties": {}},
+            },
+        }
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+            "source": self.source,
+        }
+
+    async def invoke(self, arguments: Optional[Dict[str, Any]] = None) -> str:
+        """인자를 검증하고 실행한 결과를 LLM에 넘길 문자열로 반환
+
+        Raises:
+            MCPToolValidationError: 인자가 스키마에 맞지 않는 경우
+            ToolError: 도구가 실패를 보고한 경우
+        """
+        arguments = arguments or {}
+        if self.validate is not None:
+            self.validate(arguments)
+        result = await self.func(**arguments)
+        if isinstance(result, str):
+            return result
+        return json.dumps(result, ensure_ascii=False, default=str)
+
+
+def _json_type(annotation: Any) -> Optional[str]:
+    if get_origin(annotation) is Union:
+        annotation = next((arg for arg in get_args(annotation) if arg is not type(None)), None)
+    return _JSON_TYPES.get(get_origin(annotation) or annotation)
+
+
+def signature_schema(func: Callable) -> Dict[str, Any]:
+    """함수 시그니처의 타입 힌트로 인자 JSON Schema 생성 (기본값이 없는 인자는 필수)"""
+    hints = get_type_hints(func)
+    properties: Dict[str, Any] = {}
+    required = []
+    for name, parameter in inspect.signature(func).parameters.items():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        json_type = _json_type(hints.get(name))
+        properties[name] = {"type": json_type} if json_type else {}
+        if parameter.default is parameter.empty:
+            required.append(name)
+        else:
+            properties[name]["default"] = parameter.default
+
+    schema: Dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = required
+    return schema
+
+
+def tool(
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+) -> Callable[[Callable], Tool]:
+    """Python 함수를 로컬 도구로 만드는 데코레이터
+
+    동기 함수는 스레드에서 실행하므로 이벤트 루프를 막지 않습니다.
+
+    Args:
+        name: 도구 이름 (기본값: 함수 이름)
+        description: 도구 설명 (기본값: 독스트링 첫 줄)
+        parameters: 인자 JSON Schema (기본값: 타입 힌트에서 생성)
+    """
+
+    def decorator(func: Callable) -> Tool:
+        if inspect.iscoroutinefunction(func):
+            run = func
+        else:
+            async def run(**kwargs):
+                return await asyncio.to_thread(func, **kwargs)
+
+        schema = parameters or signature_schema(func)
+        doc = inspect.getdoc(func) or ""
+        return Tool(
+            name=name or func.__name__,
+            description=description or doc.split("\n", 1)[0],
+            parameters=schema,
+            func=run,
+            validate=compile_schema(schema, name or func.__name__),
+        )
+
+    return decorator
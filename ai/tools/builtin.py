@@ -0,0 +1,39 @@
+"""기본 제공 로컬 도구"""
+
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from core.settings import settings
+from .base import tool
+
+# 도구를 실행하는 요청의 테넌트 (에이전트 엔드포인트가 설정, 없으면 공용 문서만 검색)
+current_tenant: ContextVar[Optional[str]] = ContextVar("current_tenant", default=None)
+
+# LLM이 요청할 수 있는 최대 검색 결과 수
+MAX_SEARCH_RESULTS = 20
+
+
+@tool()
+def current_datetime() -> str:
+    """현재 서버 시간(ISO 8601, 시간대 포함)을 반환합니다."""
+    return datetime.now().astimezone().isoformat(timespec="seconds")
+
+
+@tool()
+async def search_knowledge(query: str, top_k: int = 5) -> str:
+    """지식 베이스에서 질의와 관련된 문서 내용을 검색합니다."""
+    from ai.prompts import build_context
+    from ai.retrieval import get_knowledge_base, tenant_filter
+
+    results = await get_knowledge_base().search(
+        query,
+        top_k=min(max(top_k, 1), MAX_SEARCH_RESULTS),
+        filters=[tenant_filter(current_tenant.get())],
+    )
+    if not results:
+        return "검색 결과가 없습니다."
+    return build_context(results, settings.RAG_CONTEXT_MAX_TOKENS).text
+
+
+BUILTIN_TOOLS = [current_datetime, search_knowledge]
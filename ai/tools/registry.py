@@ -0,0 +1,138 @@
+"""로컬 도구와 MCP 도구 레지스트리"""
+
+import asyncio
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from ai.mcp import get_mcp_manager, tool_error_message
+from ai.mcp.schema import ToolSpec
+from core.settings import settings
+from .base import Tool, ToolError
+from .builtin import BUILTIN_TOOLS
+
+# MCP 도구 이름 구분자 (<서버>__<도구>)
+MCP_SEPARATOR = "__"
+MAX_TOOL_NAME_LENGTH = 64
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+def mcp_tool_name(server: str, name: str) -> str:
+    """LLM API 이름 규칙에 맞춘 MCP 도구 이름"""
+    return _INVALID_NAME_CHARS.sub("_", f"{server}{MCP_SEPARATOR}{name}")[:MAX_TOOL_NAME_LENGTH]
+
+
+def _mcp_tool(server: str, spec: ToolSpec) -> Tool:
+    async def call(**arguments):
+        result = await get_mcp_manager().call_tool(server, spec.name, arguments)
+        if result.get("isError"):
+            raise ToolError(tool_error_message(result))
+        texts = [
+            item.get("text", "")
+            for item in result.get("content") or []
+            if item.get("type") == "text"
+        ]
+        return "\n".join(texts) if texts else result
+
+    # 인자 검증은 MCP 풀이 캐시된 스키마로 수행
+    return Tool(
+        name=mcp_tool_name(server, spec.name),
+        description=spec.description,
+        parameters=spec.input_schema,
+        func=call,
+        source=f"mcp:{server}",
+    )
+
+
+class ToolRegistry:
+    """에이전트가 사용할 도구 목록
+
+    로컬 도구는 등록한 그대로, MCP 도구는 서버별 캐시된 도구 목록에서
+    ``<서버>__<도구>`` 이름으로 만듭니다.
+
+    Args:
+        tools: 처음 등록할 로컬 도구
+    """
+
+    def __init__(self, tools: Sequence[Tool] = ()):
+        self._local: Dict[str, Tool] = {}
+        for item in tools:
+            self.register(item)
+
+    def register(self, tool: Tool):
+        """로컬 도구 등록 (같은 이름이면 교체)"""
+        self._local[tool.name] = tool
+
+    def local_tools(self) -> List[Tool]:
+        return list(self._local.values())
+
+    def cached_tools(self) -> List[Tool]:
+        """로컬 도구와 이미 도구 목록을 받은 MCP 서버의 도구 (서버를 시작하지 않음)"""
+        tools = self.local_tools()
+        if settings.MCP_ENABLED:
+            manager = get_mcp_manager()
+            for server in manager.allowed_servers:
+                specs = manager.pool(server).tools or {}
+                tools.extend(_mcp_tool(server, spec) for spec in specs.values())
+        return tools
+
+    async def tools(
+        self,
+        names: Optional[Sequence[str]] = None,
+        servers: Optional[Sequence[str]] = None,
+    ) -> List[Tool]:
+        """사용할 도구 목록 (필요한 MCP 서버의 도구 목록을 동시에 조회)
+
+        Args:
+            names: 포함할 도구 이름 (기본값: 전체)
+            servers: 도구를 가져올 MCP 서버 (기본값: 허용된 전체 서버)
+        """
+        tools = self.local_tools()
+        if settings.MCP_ENABLED:
+            manager = get_mcp_manager()
+            servers = manager.allowed_servers if servers is None else list(servers)
+            if names is not None:
+                # 이름으로 고른 도구가 없는 서버는 시작하지 않음
+                servers = [
+                    server for server in servers
+                    if any(name.startswith(mcp_tool_name(server, "")) for name in names)
+                ]
+            catalogs = await asyncio.gather(
+                *(manager.pool(server).list_tools() for server in servers),
+                return_exceptions=True,
+            )
+            for server, catalog in zip(servers, catalogs):
+                if isinstance(catalog, BaseException):
+                    logger.warning(f"MCP 서버 '{server}' 도구 목록을 가져오지 못해 제외: {catalog}")
+                    continue
+                specs = manager.pool(server).tools or {}
+                tools.extend(_mcp_tool(server, spec) for spec in specs.values())
+
+        if names is not None:
+            wanted = set(names)
+            tools = [item for item in tools if item.name in wanted]
+        return tools
+
+
+# 전역 도구 레지스트리 인스턴스
+_tool_registry: Optional[ToolRegistry] = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """도구 레지스트리 인스턴스 반환 (기본 제공 도구 등록)"""
+    global _tool_registry
+
+    if _tool_registry is None:
+        _tool_registry = ToolRegistry(BUILTIN_TOOLS)
+
+    return _tool_registry
+
+
+def get_available_tools() -> List[Dict[str, Any]]:
+    """사용 가능한 도구 정보 목록
+
+    MCP 도구는 이미 도구 목록을 받은 서버의 것만 포함합니다.
+    """
+    return [item.info() for item in get_tool_registry().cached_tools()]
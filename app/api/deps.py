@@ -1,21 +1,36 @@
 """API 의존성 주입 함수들"""
 
-from typing import Optional
+import hashlib
+from typing import AsyncIterator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_async_db
+from core.database import get_async_db, get_async_read_db
 from core.security import create_credentials_exception, verify_token
 
 # Bearer 토큰 보안 스키마
 security = HTTPBearer()
 
 
-async def get_db() -> AsyncSession:
-    """비동기 데이터베이스 세션 의존성"""
-    async for session in get_async_db():
+def _client_key(request: Request) -> Optional[str]:
+    """읽기 복제본 고정(read-your-writes)용 클라이언트 키 (인증 토큰 해시, 없으면 IP)"""
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+    return request.client.host if request.client else None
+
+
+async def get_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """비동기 데이터베이스 세션 의존성 (주 DB)"""
+    async for session in get_async_db(_client_key(request)):
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """읽기 전용 엔드포인트용 세션 의존성 (복제본 사용, 쓰기는 주 DB로)"""
+    async for session in get_async_read_db(_client_key(request)):
         yield session
 
 
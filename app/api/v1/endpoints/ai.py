@@ -1,14 +1,55 @@
 """AI 관련 엔드포인트"""
 
-from typing import Any, Optional
+import asyncio
+import json
+import os
+import time
+from datetime import date
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ai.documents import (
+    AnalysisCache,
+    DocumentTooLargeError,
+    IngestionPipeline,
+    get_analysis_cache,
+    get_document_type,
+    get_parsing_service,
+    is_parseable_document,
+    is_text_document,
+    iter_file,
+    iter_queue,
+    spool_upload,
+    stream_text,
+    tee_stream,
+)
+from ai.chains import SummarizeChain, get_agent_chain, get_summarize_chain
+from ai.mcp import (
+    MCPError,
+    MCPServerNotAllowedError,
+    MCPToolValidationError,
+    ToolCallOutcome,
+    get_mcp_manager,
+    tool_error_message,
+)
+from ai.prompts import build_context
 from ai.providers import get_available_providers, get_llm_provider
-from app.api.deps import get_current_user_optional, get_db
+from ai.retrieval import get_knowledge_base, tenant_filter
+from app.api.deps import get_current_user, get_current_user_optional, get_db
 from core.logging import log_ai_event, log_mcp_event
 from core.settings import settings
+from ai.tools import current_tenant, get_tool_registry
+from schemas.ai import (
+    AgentRequest,
+    DocumentAnalysisResponse,
+    KnowledgeSearchRequest,
+    KnowledgeSearchResponse,
+    MCPBatchRequest,
+    MCPToolResponse,
+)
 
 router = APIRouter()
 
@@ -93,10 +134,88 @@ async def chat_with_ai(
     }
 
 
-@router.post("/analyze-document")
+@router.post("/agent")
+async def run_agent(
+    request: AgentRequest,
+    current_user: str = Depends(get_current_user),
+) -> Any:
+    """
+    도구 호출 에이전트 (인증 필요)
+
+    LLM이 한 턴에 요청한 도구 호출(로컬 도구, 허용된 MCP 서버의 도구)을 동시에 실행하며,
+    도구 호출 요청과 결과, 최종 답변을 NDJSON 이벤트로 스트리밍합니다.
+    """
+    if not (
+        settings.OPENAI_API_KEY
+        or settings.ANTHROPIC_API_KEY
+        or settings.GOOGLE_API_KEY
+        or settings.OLLAMA_HOST
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI 서비스가 설정되지 않았습니다",
+        )
+
+    log_ai_event(
+        "agent_request",
+        user=current_user,
+        provider=request.provider,
+        model=request.model,
+        tools=request.tools,
+        message_length=len(request.message),
+    )
+
+    # 도구를 지정하지 않으면 MCP 서버를 새로 시작하지 않음 (이미 시작된 서버의 도구만)
+    registry = get_tool_registry()
+    if request.tools is None:
+        tools = registry.cached_tools()
+    else:
+        tools = await registry.tools(names=request.tools)
+    try:
+        agent = get_agent_chain(
+            provider_name=request.provider,
+            model_name=request.model,
+            system_message=request.system_message,
+            tools=tools,
+            max_steps=request.max_steps,
+            step_timeout=request.step_timeout,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        _agent_events(agent.astream([{"role": "user", "content": request.message}]), current_user),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _agent_events(events: AsyncIterator[Dict[str, Any]], user: Optional[str]) -> AsyncIterator[str]:
+    """에이전트 이벤트를 NDJSON으로 전달 (도구는 요청 사용자의 테넌트로 실행)"""
+    current_tenant.set(user)
+    try:
+        async for event in events:
+            if event["type"] == "final":
+                log_ai_event(
+                    "agent_response",
+                    user=user,
+                    steps=event["steps"],
+                    tool_calls=event["tool_calls"],
+                    response_length=len(event["content"]),
+                )
+            yield _ndjson(event)
+    except Exception as e:
+        # 이미 응답이 시작되었으므로 오류도 이벤트로 전달
+        yield _ndjson({"type": "error", "detail": str(e)})
+
+
+@router.post("/analyze-document", response_model=DocumentAnalysisResponse)
 async def analyze_document(
     file: UploadFile = File(...),
     analysis_type: str = "summary",
+    language: str = "ko",
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    stream: bool = False,
     current_user: Optional[str] = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
@@ -104,6 +223,8 @@ async def analyze_document(
     문서 분석
 
     업로드된 문서를 AI로 분석 (요약, 키워드 추출 등)
+    같은 내용/조건의 분석은 캐시된 결과를 반환하고,
+    stream=true이면 부분 요약을 NDJSON 이벤트로 스트리밍
     """
     if not (settings.OPENAI_API_KEY or settings.ANTHROPIC_API_KEY):
         raise HTTPException(
@@ -118,65 +239,288 @@ async def analyze_document(
             detail=f"파일 크기가 너무 큽니다. 최대 {settings.MAX_FILE_SIZE} bytes",
         )
 
-    # 파일 내용 읽기
-    content = await file.read()
+    is_text = is_text_document(file.filename, file.content_type)
+    if not (is_text or is_parseable_document(file.filename)):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"지원하지 않는 문서 형식입니다: {file.filename}",
+        )
+
+    start_time = time.time()
+    provider = provider or settings.DEFAULT_PROVIDER
+    model = model or settings.DEFAULT_LLM_MODEL
+
+    # 업로드를 디스크에 저장하면서 내용 해시 계산
+    # (응답 스트리밍/프로세스 풀 파싱 중에는 업로드 파일이 이미 닫혀 있음)
+    upload = await spool_upload(file, settings.DOCUMENT_PARSER_WORK_DIR)
 
     log_ai_event(
         "document_analysis",
         user=current_user,
         file_name=file.filename,
-        file_size=len(content),
+        file_size=upload.size,
         analysis_type=analysis_type,
     )
 
-    # 실제로는 문서 처리 및 AI 분석
-    analysis_result = f"{file.filename} 파일의 {analysis_type} 분석 결과입니다."
-
-    return {
-        "file_name": file.filename,
-        "file_size": len(content),
-        "analysis_type": analysis_type,
-        "result": analysis_result,
-        "confidence": 0.95,
+    cache = get_analysis_cache() if settings.ANALYSIS_CACHE_ENABLED else None
+    cache_key = AnalysisCache.make_key(
+        upload.sha256, analysis_type, language, provider, model, tenant=current_user
+    )
+    cached = await cache.get(cache_key) if cache is not None else None
+    if (
+        cached is not None
+        and cached.get("chunks_indexed")
+        and not get_knowledge_base().has_document(cached.get("document_id"))
+    ):
+        # 재시작 등으로 색인이 사라진 문서는 다시 분석하고 색인
+        cached = None
+
+    if cached is not None:
+        _discard(upload.path)
+        log_ai_event("document_analysis_cached", user=current_user, content_hash=upload.sha256)
+        response = DocumentAnalysisResponse(
+            **{**cached, "file_name": file.filename, "file_size": upload.size, "cached": True}
+        )
+        if stream:
+            return StreamingResponse(
+                iter([_ndjson({"type": "result", "result": response.model_dump(mode="json")})]),
+                media_type="application/x-ndjson",
+            )
+        return response
+
+    # 텍스트 스트림(업로드 파일을 소비하며 삭제)을 만들기 전에 체인부터 준비
+    try:
+        summarize_chain = (
+            get_summarize_chain(provider_name=provider, model_name=model)
+            if analysis_type == "summary" else None
+        )
+    except ValueError as e:
+        _discard(upload.path)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if is_text:
+        text_stream = stream_text(iter_file(upload.path, remove=True))
+    else:
+        # PDF/DOCX/이미지는 프로세스 풀에서 파싱
+        text_stream = get_parsing_service().stream_text(upload.path)
+
+    metadata = {
+        "source": file.filename,
+        "document_type": get_document_type(file.filename),
+        "tenant": current_user,
+        "date": date.today().isoformat(),
     }
+    pipeline = IngestionPipeline()
+
+    def build_response(ingestion: Dict[str, Any], summary: Optional[str]) -> DocumentAnalysisResponse:
+        log_ai_event(
+            "document_ingested",
+            user=current_user,
+            document_id=ingestion["document_id"],
+            chunks=ingestion["chunks"],
+            duplicates=len(ingestion["duplicates"]),
+        )
+
+        if summary is not None:
+            analysis_result = summary
+        else:
+            # 요약 외 분석 유형은 아직 미구현
+            analysis_result = f"{file.filename} 파일의 {analysis_type} 분석 결과입니다."
+
+        return DocumentAnalysisResponse(
+            file_name=file.filename or "",
+            file_size=upload.size,
+            analysis_type=analysis_type,
+            language=language,
+            result=analysis_result,
+            summary=summary,
+            keywords=None,
+            sentiment=None,
+            confidence=0.95,
+            processing_time=time.time() - start_time,
+            document_id=ingestion["document_id"],
+            chunks_indexed=ingestion["chunks"],
+            duplicate_chunks=ingestion["duplicates"],
+            cached=False,
+        )
 
+    async def store(response: DocumentAnalysisResponse):
+        # 실제 LLM 분석 결과만 캐시
+        if cache is not None and response.summary is not None:
+            await cache.set(
+                cache_key,
+                response.model_dump(mode="json", exclude={"cached"}),
+                content_hash=upload.sha256,
+                analysis_type=analysis_type,
+                language=language,
+                provider=provider,
+                model=model,
+            )
+
+    if stream:
+        return StreamingResponse(
+            _analysis_events(
+                pipeline, summarize_chain, text_stream, metadata, build_response, store,
+                upload.path,
+            ),
+            media_type="application/x-ndjson",
+        )
 
-@router.post("/search")
+    # 텍스트 추출, 청킹/임베딩/색인, 요약을 동시에 진행
+    try:
+        ingestion, summary = await _ingest_and_summarize(
+            pipeline, summarize_chain, text_stream, metadata
+        )
+    except TimeoutError as e:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e))
+    except DocumentTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    finally:
+        # 스트림을 열기 전에 실패했으면 업로드 파일이 남아 있음
+        _discard(upload.path)
+
+    response = build_response(ingestion, summary)
+    await store(response)
+    return response
+
+
+def _ndjson(event: Dict[str, Any]) -> str:
+    return json.dumps(event, ensure_ascii=False) + "\n"
+
+
+def _discard(path: str):
+    """임시 업로드 파일 삭제 (이미 삭제됐으면 무시)"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+async def _ingest_and_summarize(
+    pipeline: IngestionPipeline,
+    summarize_chain: Optional[SummarizeChain],
+    text_stream: AsyncIterator[str],
+    metadata: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """텍스트 스트림 하나를 수집 파이프라인과 요약 체인에 동시에 흘려보내기"""
+    if summarize_chain is None:
+        return await pipeline.run(text_stream, metadata=metadata), None
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.INGEST_QUEUE_SIZE)
+    try:
+        async with asyncio.TaskGroup() as group:
+            ingestion = group.create_task(
+                pipeline.run(tee_stream(text_stream, queue), metadata=metadata)
+            )
+            summary = group.create_task(summarize_chain.ainvoke(iter_queue(queue)))
+    except ExceptionGroup as e:
+        raise e.exceptions[0]
+
+    return ingestion.result(), summary.result()
+
+
+async def _analysis_events(
+    pipeline: IngestionPipeline,
+    summarize_chain: Optional[SummarizeChain],
+    text_stream: AsyncIterator[str],
+    metadata: Dict[str, Any],
+    build_response: Callable[[Dict[str, Any], Optional[str]], DocumentAnalysisResponse],
+    store: Callable[[DocumentAnalysisResponse], Awaitable[None]],
+    upload_path: str,
+) -> AsyncIterator[str]:
+    """부분 요약 이벤트를 스트리밍하고 마지막에 전체 분석 결과 전달"""
+    try:
+        summary = None
+        if summarize_chain is None:
+            ingestion = await pipeline.run(text_stream, metadata=metadata)
+        else:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=settings.INGEST_QUEUE_SIZE)
+            async with asyncio.TaskGroup() as group:
+                ingestion_task = group.create_task(
+                    pipeline.run(tee_stream(text_stream, queue), metadata=metadata)
+                )
+                async for event in summarize_chain.astream(iter_queue(queue)):
+                    if event["type"] == "final":
+                        summary = event["summary"]
+                    yield _ndjson(event)
+            ingestion = ingestion_task.result()
+
+        response = build_response(ingestion, summary)
+        await store(response)
+        yield _ndjson({"type": "result", "result": response.model_dump(mode="json")})
+    except Exception as e:
+        # 이미 응답이 시작되었으므로 오류도 이벤트로 전달
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
+        yield _ndjson({"type": "error", "detail": str(e)})
+    finally:
+        _discard(upload_path)
+
+
+@router.post("/search", response_model=KnowledgeSearchResponse)
 async def search_knowledge(
-    query: str,
-    limit: int = 5,
+    request: KnowledgeSearchRequest,
     current_user: Optional[str] = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     지식 베이스 검색
 
-    RAG (Retrieval-Augmented Generation)를 사용한 지식 검색
+    벡터 검색과 BM25 키워드 검색을 동시에 실행하고 RRF로 병합하는 하이브리드 검색
     """
-    if not (settings.OPENAI_API_KEY or settings.ANTHROPIC_API_KEY):
+    # 로컬 임베딩을 사용하면 외부 API 키 없이 검색 가능
+    if settings.EMBEDDING_PROVIDER != "local" and not (
+        settings.OPENAI_API_KEY or settings.ANTHROPIC_API_KEY
+    ):
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="AI 서비스가 설정되지 않았습니다",
         )
 
-    log_ai_event("knowledge_search", user=current_user, query=query, limit=limit)
-
-    # 실제로는 벡터 검색 및 RAG 구현
-    search_results = [
-        {
-            "title": f"검색 결과 {i+1}",
-            "content": f"'{query}'에 대한 {i+1}번째 검색 결과입니다.",
-            "score": 0.9 - (i * 0.1),
-            "source": f"document_{i+1}.pdf",
-        }
-        for i in range(min(limit, 3))
-    ]
+    log_ai_event(
+        "knowledge_search",
+        user=current_user,
+        query=request.query,
+        limit=request.top_k,
+        mode=request.mode,
+        filters=[f.model_dump(mode="json") for f in request.filters],
+        rerank=request.rerank,
+    )
 
-    return {
-        "query": query,
-        "results": search_results,
-        "total_found": len(search_results),
-    }
+    start_time = time.time()
+    knowledge_base = get_knowledge_base()
+
+    try:
+        search_results = await knowledge_base.search(
+            request.query,
+            top_k=request.top_k,
+            mode=request.mode,
+            threshold=request.threshold,
+            # 다른 테넌트가 색인한 청크는 요청 필터와 관계없이 제외
+            filters=[*request.filters, tenant_filter(current_user)],
+            rerank=request.rerank,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    context = None
+    if request.context_tokens:
+        packed = build_context(search_results, request.context_tokens)
+        context = {"text": packed.text, **packed.report()}
+
+    if not request.include_metadata:
+        for result in search_results:
+            result.pop("metadata", None)
+
+    return KnowledgeSearchResponse(
+        query=request.query,
+        results=search_results,
+        total_results=len(search_results),
+        search_time=time.time() - start_time,
+        context=context,
+    )
 
 
 @router.get("/models")
@@ -219,7 +563,7 @@ async def get_mcp_servers(
     current_user: Optional[str] = Depends(get_current_user_optional),
 ) -> Any:
     """
-    MCP 서버 목록 조회
+    MCP 서버 목록 조회 (실행 명령, 설정 경로, 프로세스 ID는 인증된 사용자에게만)
     """
     if not settings.MCP_ENABLED:
         raise HTTPException(
@@ -229,27 +573,55 @@ async def get_mcp_servers(
 
     log_mcp_event("list_servers", user=current_user)
 
-    # 실제로는 MCP 서버 설정 파일 읽기
+    authenticated = current_user is not None
     return {
         "mcp_enabled": settings.MCP_ENABLED,
-        "config_path": settings.MCP_SERVERS_CONFIG_PATH,
-        "servers": [
-            {"name": "filesystem", "status": "available"},
-            {"name": "brave-search", "status": "available"},
-            {"name": "github", "status": "available"},
-        ],
+        "config_path": settings.MCP_SERVERS_CONFIG_PATH if authenticated else None,
+        "servers": get_mcp_manager().list_servers(detailed=authenticated),
     }
 
 
+@router.get("/mcp/servers/{server}/tools")
+async def get_mcp_tools(
+    server: str,
+    current_user: str = Depends(get_current_user),
+) -> Any:
+    """
+    MCP 서버의 도구 목록 조회 (캐시된 목록, 인증 필요)
+
+    캐시가 비어 있으면 서버 프로세스를 시작하므로 인증된 사용자만 호출할 수 있습니다.
+    """
+    if not settings.MCP_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="MCP 서비스가 비활성화되어 있습니다",
+        )
+
+    log_mcp_event("list_tools", user=current_user, server=server)
+
+    try:
+        tools = await get_mcp_manager().list_tools(server)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.args[0])
+    except MCPServerNotAllowedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except MCPError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+
+    return {"server": server, "tools": tools, "total_tools": len(tools)}
+
+
 @router.post("/mcp/call-tool")
 async def call_mcp_tool(
     server: str,
     tool: str,
     arguments: dict,
-    current_user: Optional[str] = Depends(get_current_user_optional),
+    current_user: str = Depends(get_current_user),
 ) -> Any:
     """
-    MCP 도구 호출
+    MCP 도구 호출 (인증 필요, MCP_ALLOWED_SERVERS의 서버만)
+
+    서버별 상주 프로세스 풀의 세션으로 호출하며, 동시 호출은 요청 ID로 다중화됩니다.
     """
     if not settings.MCP_ENABLED:
         raise HTTPException(
@@ -261,13 +633,116 @@ async def call_mcp_tool(
         "tool_call", user=current_user, server=server, tool=tool, arguments=arguments
     )
 
-    # 실제로는 MCP 클라이언트를 사용한 도구 호출
-    result = f"MCP 서버 '{server}'의 도구 '{tool}' 호출 결과"
+    manager = get_mcp_manager()
+    start_time = time.time()
+    try:
+        result = await manager.call_tool(server, tool, arguments)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.args[0])
+    except MCPServerNotAllowedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except MCPToolValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"MCP 도구 '{tool}' 호출 시간이 초과되었습니다",
+        )
+    except MCPError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
 
+    is_error = bool(result.get("isError"))
     return {
         "server": server,
         "tool": tool,
         "arguments": arguments,
         "result": result,
-        "success": True,
+        "success": not is_error,
+        "error_message": tool_error_message(result) if is_error else None,
+        "execution_time": time.time() - start_time,
     }
+
+
+@router.post("/mcp/call-tools")
+async def call_mcp_tools(
+    request: MCPBatchRequest,
+    current_user: str = Depends(get_current_user),
+) -> Any:
+    """
+    MCP 도구 일괄 호출 (인증 필요, MCP_ALLOWED_SERVERS의 서버만)
+
+    여러 서버의 도구 호출을 서버별·전체 동시 실행 수 제한 안에서 동시에 실행하고,
+    끝나는 순서대로 NDJSON으로 스트리밍합니다. 각 줄의 ``index``는 요청 목록에서의
+    위치이며, 마지막 줄은 ``{"type": "done", ...}`` 요약입니다.
+    """
+    if not settings.MCP_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="MCP 서비스가 비활성화되어 있습니다",
+        )
+
+    missing = [index for index, call in enumerate(request.calls) if not call.server_name]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"server_name이 없는 호출이 있습니다: {missing}",
+        )
+
+    log_mcp_event(
+        "tool_batch",
+        user=current_user,
+        calls=[f"{call.server_name}/{call.tool_name}" for call in request.calls],
+    )
+
+    calls = [
+        {"server": call.server_name, "tool": call.tool_name, "arguments": call.parameters}
+        for call in request.calls
+    ]
+    return StreamingResponse(
+        _batch_events(calls),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _batch_events(calls: List[Dict[str, Any]]) -> AsyncIterator[str]:
+    """일괄 호출 결과를 끝나는 순서대로 NDJSON 이벤트로 전달"""
+    start_time = time.time()
+    succeeded = 0
+    async for outcome in get_mcp_manager().call_batch(calls):
+        response = _tool_response(outcome)
+        succeeded += response.success
+        yield _ndjson({
+            "type": "result",
+            "index": outcome.position,
+            "server_name": outcome.server,
+            **response.model_dump(mode="json"),
+        })
+
+    yield _ndjson({
+        "type": "done",
+        "total": len(calls),
+        "succeeded": succeeded,
+        "failed": len(calls) - succeeded,
+        "execution_time": time.time() - start_time,
+    })
+
+
+def _tool_response(outcome: ToolCallOutcome) -> MCPToolResponse:
+    """일괄 호출 결과를 단건 응답 형식으로 변환 (예외는 실패 결과로)"""
+    error, result = outcome.error, outcome.result
+    if error is None:
+        error_message = tool_error_message(result) if result and result.get("isError") else None
+    elif isinstance(error, KeyError):
+        error_message = error.args[0]
+    elif isinstance(error, asyncio.TimeoutError):
+        error_message = f"MCP 도구 '{outcome.tool}' 호출 시간이 초과되었습니다"
+    else:
+        error_message = str(error) or type(error).__name__
+
+    return MCPToolResponse(
+        tool_name=outcome.tool,
+        result=outcome.result,
+        success=error_message is None,
+        error_message=error_message,
+        execution_time=outcome.execution_time,
+    )
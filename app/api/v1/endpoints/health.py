@@ -1,12 +1,12 @@
 """헬스체크 관련 엔드포인트"""
 
-from typing import Any
+from typing import Any, Dict
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
-from core.database import check_db_connection
+from core.database import check_db_connection, get_replica_router
 from core.settings import settings
 
 router = APIRouter()
@@ -31,18 +31,19 @@ async def detailed_health_check(
     """
     상세 헬스체크 (데이터베이스, 외부 서비스 포함)
     """
+    checks: Dict[str, Any] = {}
     health_status = {
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "timestamp": "2024-01-01T00:00:00Z",  # 실제로는 현재 시간
-        "checks": {},
+        "checks": checks,
     }
 
     # 데이터베이스 연결 확인
     try:
         db_healthy = await check_db_connection()
-        health_status["checks"]["database"] = {
+        checks["database"] = {
             "status": "healthy" if db_healthy else "unhealthy",
             "message": (
                 "Database connection successful"
@@ -51,12 +52,17 @@ async def detailed_health_check(
             ),
         }
     except Exception as e:
-        health_status["checks"]["database"] = {
+        checks["database"] = {
             "status": "unhealthy",
             "message": f"Database check failed: {str(e)}",
         }
         health_status["status"] = "unhealthy"
 
+    # 읽기 복제본 상태
+    replica_router = get_replica_router()
+    if replica_router is not None:
+        checks["database_replicas"] = replica_router.status()
+
     # AI 서비스 확인
     ai_services = []
     if settings.OPENAI_API_KEY:
@@ -66,14 +72,14 @@ async def detailed_health_check(
     if settings.GOOGLE_API_KEY:
         ai_services.append("Google")
 
-    health_status["checks"]["ai_services"] = {
+    checks["ai_services"] = {
         "status": "configured" if ai_services else "not_configured",
         "available_services": ai_services,
         "message": f"{len(ai_services)} AI service(s) configured",
     }
 
     # MCP 서비스 확인
-    health_status["checks"]["mcp"] = {
+    checks["mcp"] = {
         "status": "enabled" if settings.MCP_ENABLED else "disabled",
         "config_path": (
             settings.MCP_SERVERS_CONFIG_PATH if settings.MCP_ENABLED else None
@@ -86,7 +92,7 @@ async def detailed_health_check(
     }
 
     # Redis 연결 확인 (향후 구현)
-    health_status["checks"]["redis"] = {
+    checks["redis"] = {
         "status": "not_implemented",
         "message": "Redis health check not implemented yet",
     }
@@ -5,7 +5,7 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, get_current_user, get_db
+from app.api.deps import get_current_active_user, get_current_user, get_db, get_read_db
 
 router = APIRouter()
 
@@ -13,7 +13,7 @@ router = APIRouter()
 @router.get("/me")
 async def get_current_user_info(
     current_user: str = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
     """
     현재 사용자 정보 조회
@@ -57,7 +57,7 @@ async def get_users(
     skip: int = 0,
     limit: int = 100,
     current_user: str = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
     """
     사용자 목록 조회 (관리자 권한 필요)
@@ -88,7 +88,7 @@ async def get_users(
 async def get_user_by_username(
     username: str,
     current_user: str = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Any:
     """
     특정 사용자 정보 조회
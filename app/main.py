@@ -10,8 +10,13 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from loguru import logger
 
+from ai.documents import get_parsing_service
+from ai.mcp import get_mcp_manager
+from ai.prompts import get_prompt_store, load_encoding
+from ai.providers.local_provider import get_local_embedding_provider
 from app.api.v1.api import api_router
-from core.database import check_db_connection, create_tables
+from core.database import check_db_connection, create_tables, dispose_db, get_replica_router, init_db
+from core.pool_metrics import get_pool_advisor, pool_metrics
 from core.logging import log_request, log_response, setup_logging
 from core.settings import settings
 
@@ -25,7 +30,8 @@ async def lifespan(app: FastAPI):
     # 시작 시
     logger.info("🚀 FastAPI 애플리케이션 시작")
 
-    # 데이터베이스 연결 확인
+    # 데이터베이스 엔진 생성 및 연결 확인
+    init_db()
     if await check_db_connection():
         logger.info("✅ 데이터베이스 연결 성공")
 
@@ -36,14 +42,43 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠️ 데이터베이스 연결 실패 - 데이터베이스 없이 실행")
 
+    # 읽기 복제본 헬스 체크 시작
+    replica_router = get_replica_router()
+    if replica_router is not None:
+        await replica_router.start()
+        healthy = sum(replica.healthy for replica in replica_router.replicas)
+        logger.info(f"📚 읽기 복제본 {healthy}/{len(replica_router.replicas)}개 사용 가능")
+
+    # 커넥션 풀 크기 권장 (설정은 바꾸지 않고 로그로만)
+    if settings.DB_POOL_ADVISORY:
+        get_pool_advisor().start()
+
     # AI 서비스 초기화
     if settings.USE_AI_SERVICE:
         logger.info("🧠 AI 서비스 사용")
         logger.info(f"💻 AI 프로바이더 : {settings.DEFAULT_PROVIDER}")
         logger.info(f"🔮 AI 모델 : {settings.DEFAULT_LLM_MODEL}")
 
+        # 토큰 수 계산용 인코딩은 요청 처리 중이 아니라 시작 시 스레드에서 로드
+        if not await load_encoding():
+            logger.info("🔢 tiktoken 없이 근사 토큰 수 사용")
+
+        # 커스텀 프롬프트 로드 및 변경 감시
+        prompt_store = get_prompt_store()
+        await prompt_store.start()
+        logger.info(f"📝 프롬프트 버전 : {prompt_store.version}")
+
+        # 로컬 임베딩 모델은 요청 처리 중이 아니라 시작 시 스레드에서 로드
+        if settings.EMBEDDING_PROVIDER == "local":
+            try:
+                await get_local_embedding_provider().load()
+                logger.info(f"🧮 로컬 임베딩 모델 : {settings.LOCAL_EMBEDDING_MODEL}")
+            except ImportError as e:
+                logger.warning(f"⚠️ 로컬 임베딩 모델 로드 실패: {e}")
+
         if settings.MCP_ENABLED:
             logger.info("🤖 MCP 서비스 초기화")
+            await get_mcp_manager().start()
 
         if (
             settings.OPENAI_API_KEY
@@ -60,6 +95,12 @@ async def lifespan(app: FastAPI):
     yield
 
     # 종료 시
+    if settings.USE_AI_SERVICE and settings.MCP_ENABLED:
+        await get_mcp_manager().shutdown()
+    await get_prompt_store().stop()
+    await get_parsing_service().shutdown()
+    await get_pool_advisor().stop()
+    await dispose_db()
     logger.info("🛑 FastAPI 애플리케이션 종료")
 
 
@@ -172,6 +213,9 @@ async def metrics():
         "version": settings.APP_VERSION,
         "debug": settings.DEBUG,
         "log_level": settings.LOG_LEVEL,
+        "database_pools": pool_metrics(
+            settings.DB_POOL_WAIT_TARGET_MS if settings.DB_POOL_ADVISORY else None
+        ),
     }
 
 
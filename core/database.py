@@ -1,20 +1,30 @@
 """Database configuration and session management."""
 
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from core.pool_metrics import MonitoredAsyncAdaptedQueuePool, MonitoredQueuePool, instrument_engine
+from core.replicas import Replica, ReplicaRouter, RoutingSession, replica_names
 from core.settings import settings
 
-# 동기 엔진 및 세션
-engine = None
-SessionLocal = None
+# 엔진은 처음 필요할 때 생성 (init_db, get_sync_engine)
+_init_lock = threading.Lock()
+
+# 동기 엔진 및 세션 (스크립트/마이그레이션용)
+engine: Optional[Engine] = None
+SessionLocal: Optional["sessionmaker[Session]"] = None
 
 # 비동기 엔진 및 세션
-async_engine = None
-AsyncSessionLocal = None
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional["async_sessionmaker[AsyncSession]"] = None
+
+# 읽기 복제본 라우터 (DB_REPLICA_HOSTS 설정 시)
+replica_router: Optional[ReplicaRouter] = None
 
 # Base 클래스
 Base = declarative_base()
@@ -33,7 +43,7 @@ def build_database_url(
     """데이터베이스 URL 생성"""
     if db_type.lower() == "sqlite":
         if sqlite_path:
-            return f"sqlite{'aiosqlite' if is_async else ''}:///{sqlite_path}"
+            return f"sqlite{'+aiosqlite' if is_async else ''}:///{sqlite_path}"
         else:
             raise ValueError("SQLite requires database path")
     
@@ -122,59 +132,154 @@ def get_database_urls():
     return database_url, async_database_url, test_database_url, test_async_database_url
 
 
-def init_db():
-    """데이터베이스 초기화"""
-    global engine, SessionLocal, async_engine, AsyncSessionLocal
-    
-    database_url, async_database_url, _, _ = get_database_urls()
-    
-    # 동기 엔진 설정
-    engine_kwargs = {
+def _engine_kwargs(is_async: bool = True) -> Dict[str, Any]:
+    """엔진 공통 설정 (SQLite가 아닌 경우에만 커넥션 풀 설정)"""
+    engine_kwargs: Dict[str, Any] = {
         "echo": settings.DB_ECHO,
     }
     
-    # SQLite가 아닌 경우에만 커넥션 풀 설정
     if settings.DB_TYPE.lower() != "sqlite":
         engine_kwargs.update({
             "pool_pre_ping": settings.DB_POOL_PRE_PING,
             "pool_size": settings.DB_POOL_SIZE,
             "max_overflow": settings.DB_MAX_OVERFLOW,
         })
+        if settings.DB_POOL_METRICS:
+            # 체크아웃 대기 시간 기록용 풀
+            engine_kwargs["poolclass"] = (
+                MonitoredAsyncAdaptedQueuePool if is_async else MonitoredQueuePool
+            )
     
-    engine = create_engine(database_url, **engine_kwargs)
+    return engine_kwargs
+
+
+def _create_async_engine(name: str, url: str) -> AsyncEngine:
+    """비동기 엔진 생성 (설정 시 풀 지표 수집)"""
+    engine_ = create_async_engine(url, **_engine_kwargs())
+    if settings.DB_POOL_METRICS:
+        instrument_engine(name, engine_.sync_engine)
+    return engine_
+
+
+def _create_replica_router() -> Optional[ReplicaRouter]:
+    """DB_REPLICA_HOSTS의 복제본 엔진으로 라우터 생성 (설정이 없으면 None)"""
+    hosts = replica_names(settings.DB_REPLICA_HOSTS)
+    if not hosts or settings.DB_TYPE.lower() == "sqlite":
+        return None
     
-    SessionLocal = sessionmaker(
-        autocommit=False,
-        autoflush=False,
-        bind=engine
+    replicas = []
+    for host in hosts:
+        name, _, port = host.partition(":")
+        url = build_database_url(
+            settings.DB_TYPE,
+            name,
+            int(port) if port else settings.DB_PORT,
+            settings.DB_NAME,
+            settings.DB_USER,
+            settings.DB_PASSWORD,
+            is_async=True
+        )
+        replicas.append(Replica(host, _create_async_engine(f"replica:{host}", url)))
+    
+    return ReplicaRouter(
+        replicas,
+        strategy=settings.DB_REPLICA_STRATEGY,
+        sticky_window=settings.DB_READ_YOUR_WRITES_WINDOW,
+        health_interval=settings.DB_REPLICA_HEALTH_INTERVAL,
     )
+
+
+def init_db() -> AsyncEngine:
+    """비동기 데이터베이스 엔진 초기화 (이미 초기화되었으면 기존 엔진 반환)
     
-    # 비동기 엔진 설정
-    async_engine_kwargs = {
-        "echo": settings.DB_ECHO,
-    }
+    요청 처리에는 비동기 엔진만 쓰므로 동기 엔진은 만들지 않습니다.
+    동기 엔진이 필요하면 ``get_sync_engine()``을 사용하세요.
+    복제본이 설정되어 있으면 세션은 읽기를 복제본으로 보낼 수 있는
+    ``RoutingSession``을 사용합니다.
+    """
+    global async_engine, AsyncSessionLocal, replica_router
     
-    if settings.DB_TYPE.lower() != "sqlite":
-        async_engine_kwargs.update({
-            "pool_pre_ping": settings.DB_POOL_PRE_PING,
-            "pool_size": settings.DB_POOL_SIZE,
-            "max_overflow": settings.DB_MAX_OVERFLOW,
-        })
+    if async_engine is not None:
+        return async_engine
     
-    async_engine = create_async_engine(async_database_url, **async_engine_kwargs)
+    with _init_lock:
+        if async_engine is None:
+            _, async_database_url, _, _ = get_database_urls()
+            engine_ = _create_async_engine("primary", async_database_url)
+            router = _create_replica_router()
+            session_kwargs: Dict[str, Any] = {}
+            if router is not None:
+                session_kwargs = {"sync_session_class": RoutingSession, "info": {"router": router}}
+            AsyncSessionLocal = async_sessionmaker(
+                bind=engine_,
+                class_=AsyncSession,
+                autoflush=False,
+                **session_kwargs,
+            )
+            replica_router = router
+            async_engine = engine_
     
-    AsyncSessionLocal = sessionmaker(
-        bind=async_engine,
-        class_=AsyncSession,
-        autocommit=False,
-        autoflush=False,
-    )
+    return async_engine
+
+
+def get_replica_router() -> Optional[ReplicaRouter]:
+    """읽기 복제본 라우터 반환 (복제본이 없으면 None)"""
+    init_db()
+    return replica_router
+
+
+def get_sync_engine() -> Engine:
+    """동기 엔진 반환 (스크립트/마이그레이션용, 첫 호출 때 생성)"""
+    global engine, SessionLocal
+    
+    if engine is not None:
+        return engine
+    
+    with _init_lock:
+        if engine is None:
+            database_url, _, _, _ = get_database_urls()
+            engine_ = create_engine(database_url, **_engine_kwargs(is_async=False))
+            if settings.DB_POOL_METRICS:
+                instrument_engine("sync", engine_)
+            SessionLocal = sessionmaker(
+                autoflush=False,
+                bind=engine_,
+            )
+            engine = engine_
+    
+    return engine
+
+
+async def dispose_db():
+    """엔진의 커넥션 풀 정리 (애플리케이션 종료 시)"""
+    global engine, SessionLocal, async_engine, AsyncSessionLocal, replica_router
+    
+    if replica_router is not None:
+        await replica_router.close()
+        replica_router = None
+    
+    if async_engine is not None:
+        await async_engine.dispose()
+        async_engine = None
+        AsyncSessionLocal = None
+    
+    if engine is not None:
+        engine.dispose()
+        engine = None
+        SessionLocal = None
+
+
+def _async_sessions() -> "async_sessionmaker[AsyncSession]":
+    """비동기 세션 팩토리 반환 (첫 호출 때 엔진 초기화)"""
+    init_db()
+    assert AsyncSessionLocal is not None
+    return AsyncSessionLocal
 
 
 def get_db():
     """동기 데이터베이스 세션 의존성"""
-    if SessionLocal is None:
-        raise RuntimeError("Database not initialized. Call init_db() first.")
+    get_sync_engine()
+    assert SessionLocal is not None
     
     db = SessionLocal()
     try:
@@ -183,30 +288,58 @@ def get_db():
         db.close()
 
 
-async def get_async_db():
-    """비동기 데이터베이스 세션 의존성"""
-    if AsyncSessionLocal is None:
-        raise RuntimeError("Async database not initialized. Call init_db() first.")
+async def get_async_db(sticky_key: Optional[str] = None):
+    """비동기 데이터베이스 세션 의존성 (주 DB)
+    
+    Args:
+        sticky_key: 클라이언트 식별 키 (쓰기를 커밋하면 이 키의 읽기를 잠시 주 DB로)
+    """
+    sessions = _async_sessions()
+    
+    if replica_router is None:
+        async with sessions() as session:
+            yield session
+        return
     
-    async with AsyncSessionLocal() as session:
+    async with sessions(info={"sticky_key": sticky_key}) as session:
         yield session
 
 
+async def get_async_read_db(sticky_key: Optional[str] = None):
+    """읽기 위주 비동기 세션 의존성 (복제본에서 읽고, 쓰기는 주 DB로)
+    
+    복제본이 없거나 모두 비정상이거나, 같은 클라이언트가 방금 쓰기를 커밋했다면
+    주 DB 세션을 반환합니다.
+    
+    Args:
+        sticky_key: 클라이언트 식별 키
+    """
+    sessions = _async_sessions()
+    
+    if replica_router is None:
+        async with sessions() as session:
+            yield session
+        return
+    
+    replica = replica_router.choose(sticky_key)
+    async with sessions(info={"replica": replica, "sticky_key": sticky_key}) as session:
+        yield session
+
+
+def get_async_session() -> AsyncSession:
+    """비동기 세션 생성 (요청 의존성 밖의 백그라운드 작업용)"""
+    return _async_sessions()()
+
+
 async def create_tables():
     """테이블 생성 (개발용)"""
-    if async_engine is None:
-        raise RuntimeError("Async database not initialized. Call init_db() first.")
-    
-    async with async_engine.begin() as conn:
+    async with init_db().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
 async def drop_tables():
     """테이블 삭제 (테스트용)"""
-    if async_engine is None:
-        raise RuntimeError("Async database not initialized. Call init_db() first.")
-    
-    async with async_engine.begin() as conn:
+    async with init_db().begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
@@ -214,17 +347,11 @@ async def check_db_connection():
     """데이터베이스 연결 상태 확인"""
     from sqlalchemy import text
     try:
-        if AsyncSessionLocal is None:
-            return False
-        
-        async with AsyncSessionLocal() as session:
+        async with _async_sessions()() as session:
             await session.execute(text("SELECT 1"))
             return True
     except Exception as e:
         # 디버그용 임시 출력
         print(f"DEBUG: check_db_connection 에러: {e}")
         return False
-
-
-# 데이터베이스 초기화
-init_db() 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -0,0 +1,352 @@
+"""데이터베이스 커넥션 풀 계측 및 크기 권장"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.settings import settings
+
+# 권장값 계산에 필요한 최소 체크아웃 표본 수
+MIN_ADVICE_SAMPLES = 100
+
+# 관측한 동시 사용 수에 더하는 여유분
+ADVICE_HEADROOM = 1.2
+
+
+def _percentile(samples: Sequence[float], q: float) -> float:
+    """정렬된 표본의 분위수 (표본이 없으면 0)"""
+    if not samples:
+        return 0.0
+    return samples[min(int(len(samples) * q), len(samples) - 1)]
+
+
+class PoolMonitor:
+    """풀 이벤트로 수집하는 커넥션 풀 지표 (워커 프로세스별)
+
+    - 체크아웃 대기 시간: ``pool.connect()`` 시작부터 커넥션을 받을 때까지
+      (새 커넥션 생성과 pre-ping 포함), 타임아웃 횟수
+    - 사용 중 커넥션 수와 최대값, 체크아웃 시점의 동시 사용 수 분포
+    - 오버플로 사용 (pool_size를 넘은 체크아웃)
+    - 체크아웃 유지 시간, 종료된 커넥션의 수명
+
+    분포는 최근 ``samples``개 표본으로 계산합니다.
+
+    Args:
+        name: 풀 이름 (primary, replica:<host> 등)
+        pool_size: 설정된 풀 크기
+        max_overflow: 설정된 최대 오버플로
+        samples: 분포 계산에 쓸 최근 표본 수
+    """
+
+    def __init__(self, name: str, pool_size: int, max_overflow: int, samples: int = 1024):
+        self.name = name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=samples)
+        self._holds: Deque[float] = deque(maxlen=samples)
+        self._concurrency: Deque[int] = deque(maxlen=samples)
+        self._lifetimes: Deque[float] = deque(maxlen=samples)
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.closes = 0
+        self.started_at = time.time()
+
+    def attach(self, engine: Engine):
+        """동기 엔진(비동기 엔진은 ``sync_engine``)의 풀 이벤트 구독
+
+        풀이 ``MonitoredQueuePool`` 계열이면 체크아웃 대기 시간도 기록합니다.
+        """
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "close_detached", self._on_close_detached)
+        if isinstance(engine.pool, _TimedCheckout):
+            engine.pool.monitor = self
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self._waits.append(seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        connection_record.info["created_at"] = time.monotonic()
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.monotonic()
+        with self._lock:
+            self.in_use += 1
+            self.checkouts += 1
+            if self.in_use > self.peak_in_use:
+                self.peak_in_use = self.in_use
+            if self.in_use > self.pool_size:
+                self.overflow_checkouts += 1
+            self._concurrency.append(self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        with self._lock:
+            if checked_out_at is not None:
+                self.in_use = max(self.in_use - 1, 0)
+                self._holds.append(time.monotonic() - checked_out_at)
+
+    def _on_close(self, dbapi_connection, connection_record):
+        created_at = connection_record.info.pop("created_at", None)
+        with self._lock:
+            self.closes += 1
+            if created_at is not None:
+                self._lifetimes.append(time.monotonic() - created_at)
+
+    def _on_close_detached(self, dbapi_connection):
+        with self._lock:
+            self.closes += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 지표 (시간은 밀리초, 수명은 초)"""
+        with self._lock:
+            waits = sorted(self._waits)
+            holds = sorted(self._holds)
+            concurrency = sorted(self._concurrency)
+            lifetimes = sorted(self._lifetimes)
+            counters = {
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "closes": self.closes,
+            }
+
+        return {
+            "name": self.name,
+            "pid": os.getpid(),
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "uptime": time.time() - self.started_at,
+            **counters,
+            "open_connections": counters["connects"] - counters["closes"],
+            "concurrency": {
+                "p50": _percentile(concurrency, 0.5),
+                "p95": _percentile(concurrency, 0.95),
+                "p99": _percentile(concurrency, 0.99),
+            },
+            "checkout_wait_ms": {
+                "p50": _percentile(waits, 0.5) * 1000,
+                "p95": _percentile(waits, 0.95) * 1000,
+                "p99": _percentile(waits, 0.99) * 1000,
+                "max": (waits[-1] if waits else 0.0) * 1000,
+            },
+            "hold_ms": {
+                "p50": _percentile(holds, 0.5) * 1000,
+                "p95": _percentile(holds, 0.95) * 1000,
+            },
+            "connection_lifetime_s": {
+                "mean": sum(lifetimes) / len(lifetimes) if lifetimes else 0.0,
+                "max": lifetimes[-1] if lifetimes else 0.0,
+            },
+        }
+
+    def advise(self, wait_target_ms: float = 10.0) -> Dict[str, Any]:
+        """관측한 동시 사용 수로 풀 크기 권장 (설정을 바꾸지는 않음)
+
+        평소 부하(p95 동시 사용 수)는 pool_size로, 최대 동시 사용 수는 오버플로로
+        감당하도록 여유분을 더해 계산합니다. 풀이 가득 차 대기나 타임아웃이
+        발생했다면 실제 수요는 관측값보다 크므로 전체 한도를 늘리도록 권장합니다.
+
+        Args:
+            wait_target_ms: 허용할 p95 체크아웃 대기 시간(밀리초)
+        """
+        stats = self.snapshot()
+        current = {"pool_size": self.pool_size, "max_overflow": self.max_overflow}
+        attempts = stats["checkouts"] + stats["timeouts"]
+        if attempts < MIN_ADVICE_SAMPLES:
+            return {
+                "name": self.name,
+                "current": current,
+                "recommended": None,
+                "reasons": [f"체크아웃 표본 부족 ({attempts}/{MIN_ADVICE_SAMPLES})"],
+            }
+
+        capacity = self.pool_size + self.max_overflow
+        pool_size = max(1, math.ceil(stats["concurrency"]["p95"] * ADVICE_HEADROOM))
+        total = max(pool_size, math.ceil(stats["peak_in_use"] * ADVICE_HEADROOM))
+        reasons = []
+
+        saturated = stats["timeouts"] > 0 or stats["checkout_wait_ms"]["p95"] > wait_target_ms
+        if saturated and stats["peak_in_use"] >= capacity:
+            # 한도에 막혀 관측값이 실제 수요보다 작음
+            total = max(total, math.ceil(capacity * 1.5))
+            reasons.append(
+                f"풀 한도({capacity}) 도달, 대기 p95 {stats['checkout_wait_ms']['p95']:.1f}ms"
+                f", 타임아웃 {stats['timeouts']}회"
+            )
+        elif saturated:
+            reasons.append(
+                f"풀 한도 미만에서 대기 발생 (p95 {stats['checkout_wait_ms']['p95']:.1f}ms)"
+                ": 커넥션 생성이나 pre-ping이 느림"
+            )
+
+        if pool_size < self.pool_size:
+            reasons.append(
+                f"p95 동시 사용 {stats['concurrency']['p95']}개로 상시 커넥션 {self.pool_size}개 중 일부가 유휴"
+            )
+        elif pool_size > self.pool_size:
+            reasons.append(f"p95 동시 사용 {stats['concurrency']['p95']}개가 pool_size보다 큼")
+
+        return {
+            "name": self.name,
+            "current": current,
+            "recommended": {"pool_size": pool_size, "max_overflow": total - pool_size},
+            "reasons": reasons,
+        }
+
+
+class _TimedCheckout:
+    """``connect()`` 소요 시간을 모니터에 기록하는 풀 믹스인"""
+
+    monitor: Optional[PoolMonitor] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            if self.monitor is not None:
+                self.monitor.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.monitor is not None:
+            self.monitor.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # dispose() 후 새 풀에도 같은 모니터 연결 (이벤트는 SQLAlchemy가 복사)
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(_TimedCheckout, QueuePool):
+    """체크아웃 대기 시간을 기록하는 QueuePool"""
+
+
+class MonitoredAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool"""
+
+
+# 프로세스의 풀 모니터 (이름별)
+_monitors: Dict[str, PoolMonitor] = {}
+
+
+def instrument_engine(name: str, engine: Engine) -> Optional[PoolMonitor]:
+    """엔진 풀에 모니터 연결 (QueuePool 계열이 아니면 None)
+
+    Args:
+        name: 풀 이름
+        engine: 동기 엔진 (비동기 엔진은 ``sync_engine``)
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+
+    monitor = PoolMonitor(name, pool.size(), pool._max_overflow)
+    monitor.attach(engine)
+    _monitors[name] = monitor
+    return monitor
+
+
+def get_pool_monitors() -> List[PoolMonitor]:
+    """계측 중인 풀 모니터 목록"""
+    return list(_monitors.values())
+
+
+def pool_metrics(wait_target_ms: Optional[float] = None) -> List[Dict[str, Any]]:
+    """모든 풀의 지표 (wait_target_ms를 주면 크기 권장 포함)"""
+    metrics = []
+    for monitor in get_pool_monitors():
+        snapshot = monitor.snapshot()
+        if wait_target_ms is not None:
+            snapshot["advice"] = monitor.advise(wait_target_ms)
+        metrics.append(snapshot)
+    return metrics
+
+
+class PoolAdvisor:
+    """주기적으로 풀 크기 권장값을 로그로 남기는 작업 (설정은 바꾸지 않음)
+
+    Args:
+        interval: 권장 주기(초)
+        wait_target_ms: 허용할 p95 체크아웃 대기 시간(밀리초)
+    """
+
+    def __init__(self, interval: float, wait_target_ms: float):
+        self.interval = interval
+        self.wait_target_ms = wait_target_ms
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def report(self):
+        """현재 권장값 로그"""
+        for monitor in get_pool_monitors():
+            advice = monitor.advise(self.wait_target_ms)
+            recommended = advice["recommended"]
+            if recommended is None:
+                continue
+            if recommended == advice["current"]:
+                logger.info(f"DB 풀 '{monitor.name}' 크기 적정 ({advice['current']})")
+                continue
+            logger.warning(
+                f"DB 풀 '{monitor.name}' 권장 크기 {recommended} (현재 {advice['current']}, "
+                f"워커별): {'; '.join(advice['reasons'])}"
+            )
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.report()
+            except Exception as e:
+                logger.error(f"DB 풀 크기 권장 실패: {e}")
+
+
+# 전역 풀 크기 권장 작업 인스턴스
+_pool_advisor: Optional[PoolAdvisor] = None
+
+
+def get_pool_advisor() -> PoolAdvisor:
+    """풀 크기 권장 작업 인스턴스 반환"""
+    global _pool_advisor
+
+    if _pool_advisor is None:
+        _pool_advisor = PoolAdvisor(settings.DB_POOL_ADVISORY_INTERVAL, settings.DB_POOL_WAIT_TARGET_MS)
+
+    return _pool_advisor
@@ -0,0 +1,217 @@
+"""읽기 전용 복제본(read replica) 라우팅"""
+
+import asyncio
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+STRATEGIES = (ROUND_ROBIN, LEAST_CONNECTIONS)
+
+# 읽기로 보는 텍스트 SQL 시작 키워드
+_READ_PREFIXES = ("select", "show", "explain")
+
+
+class Replica:
+    """복제본 엔진과 헬스 상태"""
+
+    __slots__ = ("name", "engine", "healthy", "last_error", "checked_at")
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.last_error: Optional[str] = None
+        self.checked_at = 0.0
+
+    @property
+    def connections(self) -> int:
+        """체크아웃된 커넥션 수 (풀이 지원하지 않으면 0)"""
+        checkedout = getattr(self.engine.sync_engine.pool, "checkedout", None)
+        return checkedout() if checkedout else 0
+
+
+class ReplicaRouter:
+    """읽기 세션을 복제본으로, 쓰기를 주 DB로 보내는 라우터
+
+    - 읽기 세션은 시작할 때 정상 복제본 하나를 골라(라운드 로빈 또는 최소 연결)
+      세션이 끝날 때까지 같은 복제본을 씁니다.
+    - 쓰기를 커밋한 클라이언트(sticky key)는 ``sticky_window``초 동안 읽기도 주 DB로
+      보내 자신이 쓴 내용을 바로 읽을 수 있습니다. 이 기록은 워커 프로세스별입니다.
+    - 주기적으로 복제본에 ``SELECT 1``을 보내 실패한 복제본은 순환에서 빼고, 정상
+      복제본이 없으면 주 DB에서 읽습니다.
+
+    Args:
+        replicas: 복제본 목록
+        strategy: round_robin 또는 least_connections
+        sticky_window: 쓰기 후 주 DB에서 읽는 시간(초)
+        health_interval: 헬스 체크 주기(초)
+        health_timeout: 헬스 체크 제한 시간(초)
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        strategy: str = ROUND_ROBIN,
+        sticky_window: float = 5.0,
+        health_interval: float = 10.0,
+        health_timeout: float = 3.0,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"지원하지 않는 복제본 선택 방식: {strategy} ({', '.join(STRATEGIES)})")
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.sticky_window = sticky_window
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self._cycle = itertools.count()
+        self._writes: Dict[str, float] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+    def choose(self, sticky_key: Optional[str] = None) -> Optional[Replica]:
+        """읽기 세션에 쓸 복제본 (주 DB에서 읽어야 하면 None)"""
+        if sticky_key is not None:
+            until = self._writes.get(sticky_key)
+            if until is not None:
+                if until > time.monotonic():
+                    return None
+                del self._writes[sticky_key]
+
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        if self.strategy == LEAST_CONNECTIONS:
+            return min(healthy, key=lambda replica: replica.connections)
+        return healthy[next(self._cycle) % len(healthy)]
+
+    def mark_write(self, sticky_key: Optional[str]):
+        """쓰기 커밋 기록 (이후 sticky_window 동안 이 키의 읽기는 주 DB로)"""
+        if sticky_key is not None and self.sticky_window > 0:
+            self._writes[sticky_key] = time.monotonic() + self.sticky_window
+
+    async def check_health(self):
+        """모든 복제본에 동시에 헬스 체크"""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+        # 만료된 쓰기 기록 정리
+        now = time.monotonic()
+        self._writes = {key: until for key, until in self._writes.items() if until > now}
+
+    async def _check(self, replica: Replica):
+        async def ping():
+            async with replica.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        try:
+            # 연결 수립이 멈춘 경우도 제한 시간에 포함
+            await asyncio.wait_for(ping(), self.health_timeout)
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(f"DB 복제본 '{replica.name}' 제외: {e}")
+            replica.healthy = False
+            replica.last_error = str(e) or type(e).__name__
+        else:
+            if not replica.healthy:
+                logger.info(f"DB 복제본 '{replica.name}' 복구")
+            replica.healthy = True
+            replica.last_error = None
+        replica.checked_at = time.time()
+
+    async def start(self):
+        """첫 헬스 체크 후 주기적 체크 시작"""
+        await self.check_health()
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"DB 복제본 헬스 체크 실패: {e}")
+
+    async def close(self):
+        """헬스 체크 중지 및 복제본 커넥션 풀 정리"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        await asyncio.gather(*(replica.engine.dispose() for replica in self.replicas))
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "sticky_window": self.sticky_window,
+            "sticky_clients": len(self._writes),
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "connections": replica.connections,
+                    "last_error": replica.last_error,
+                }
+                for replica in self.replicas
+            ],
+        }
+
+
+def _is_write(clause: Any) -> bool:
+    if isinstance(clause, UpdateBase):
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().lower().startswith(_READ_PREFIXES)
+    return False
+
+
+class RoutingSession(Session):
+    """복제본에서 읽고 쓰기는 주 DB로 보내는 세션
+
+    ``info["replica"]``가 있는 세션만 복제본을 사용합니다. 세션에서 한 번이라도
+    쓰기(flush, INSERT/UPDATE/DELETE)를 하면 그 뒤의 읽기는 자신이 쓴 내용을
+    볼 수 있도록 주 DB로 보냅니다. 쓰기를 커밋하면 ``info["router"]``에
+    ``info["sticky_key"]``의 쓰기를 기록합니다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or _is_write(clause):
+            self.info["wrote"] = self.info["uncommitted_write"] = True
+        replica: Optional[Replica] = self.info.get("replica")
+        if replica is None or self.info.get("wrote"):
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        return replica.engine.sync_engine
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _after_flush(session: Session, flush_context):
+    session.info["wrote"] = session.info["uncommitted_write"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _after_commit(session: Session):
+    # 커밋된 쓰기가 있으면 이 클라이언트의 다음 읽기는 주 DB로
+    if session.info.pop("uncommitted_write", False):
+        router: Optional[ReplicaRouter] = session.info.get("router")
+        if router is not None:
+            router.mark_write(session.info.get("sticky_key"))
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _after_rollback(session: Session):
+    session.info.pop("uncommitted_write", None)
+
+
+def replica_names(hosts: str) -> List[str]:
+    """``host[:port]`` 쉼표 구분 문자열을 목록으로"""
+    return [host.strip() for host in hosts.split(",") if host.strip()]
@@ -49,6 +49,16 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = 20
     DB_POOL_PRE_PING: bool = True
     DB_ECHO: bool = False
+    DB_POOL_METRICS: bool = True  # 커넥션 풀 지표 수집 (/metrics)
+    DB_POOL_ADVISORY: bool = False  # 관측한 동시 사용 수로 풀 크기 권장 (로그, /metrics)
+    DB_POOL_ADVISORY_INTERVAL: float = 300.0  # 권장 로그 주기(초)
+    DB_POOL_WAIT_TARGET_MS: float = 10.0  # 허용할 p95 체크아웃 대기 시간(밀리초)
+    
+    # 읽기 복제본 설정 (주 DB와 같은 DB 이름/계정 사용)
+    DB_REPLICA_HOSTS: str = ""  # 쉼표로 구분한 host[:port] 목록 (비우면 사용 안 함)
+    DB_REPLICA_STRATEGY: str = "round_robin"  # round_robin, least_connections
+    DB_REPLICA_HEALTH_INTERVAL: float = 10.0  # 헬스 체크 주기(초)
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0  # 쓰기 후 같은 클라이언트의 읽기를 주 DB로 보내는 시간(초)
     
     # 테스트 데이터베이스 설정
     TEST_DB_TYPE: str = "postgresql"
@@ -84,18 +94,90 @@ class Settings(BaseSettings):
     LANGCHAIN_API_KEY: Optional[str] = None
     LANGCHAIN_PROJECT: str = "fastapi-boilerplate"
     
+    # 프롬프트 설정
+    PROMPT_FILES: str = ""  # 커스텀 프롬프트 파일 경로 (JSON/YAML, 쉼표로 구분, 뒤 파일 우선)
+    PROMPT_RELOAD_INTERVAL: float = 2.0  # 프롬프트 파일 변경 확인 주기(초, 0이면 감시 안 함)
+    
     # MCP 설정
     MCP_SERVERS_CONFIG_PATH: str = "./config/mcp_servers.json"
     MCP_ENABLED: bool = True
+    MCP_ALLOWED_SERVERS: str = ""  # 도구를 실행할 수 있는 서버 (쉼표로 구분, *는 전체, 비우면 없음)
+    MCP_POOL_SIZE: int = 1  # 서버별 최대 프로세스 수 (설정 파일의 poolSize가 우선)
+    MCP_IDLE_TIMEOUT: float = 300.0  # 유휴 프로세스 종료 시간(초, 0이면 유지, idleTimeout이 우선)
+    MCP_REQUEST_TIMEOUT: float = 30.0  # 도구 호출 제한 시간(초)
+    MCP_STARTUP_TIMEOUT: float = 30.0  # 서버 시작(initialize) 제한 시간(초)
+    MCP_TOOL_CACHE_MAX_ENTRIES: int = 1000  # 도구별 결과 캐시 기본 최대 항목 수 (cache.maxEntries가 우선)
+    MCP_BATCH_CONCURRENCY: int = 16  # 일괄 호출 전체 동시 실행 수
+    MCP_BATCH_SERVER_CONCURRENCY: int = 4  # 일괄 호출 서버별 동시 실행 수
     
     # 벡터 데이터베이스 설정
     PINECONE_API_KEY: Optional[str] = None
     WEAVIATE_URL: Optional[HttpUrl] = None
     CHROMADB_PERSIST_DIRECTORY: str = "./data/chromadb"
     
+    # 벡터 스토어 설정
+    VECTOR_QUANTIZATION: str = "int8"  # none, int8, binary
+    VECTOR_RESCORE_FACTOR: int = 4  # 재채점할 후보 수 = top_k * factor
+    VECTOR_STORE_DIR: Optional[str] = "./data/vectors"  # float32 원본 저장 위치 (None이면 근사 재채점)
+    
+    # 지식 검색 설정
+    SEARCH_CANDIDATE_K: int = 50  # 하이브리드 병합 전 검색기별 후보 수
+    HYBRID_RRF_K: int = 60  # Reciprocal Rank Fusion 상수
+    SEARCH_EMBEDDING_CACHE_SIZE: int = 10000  # 쿼리 → 임베딩 캐시 크기
+    SEARCH_RESULT_CACHE_SIZE: int = 2000  # 쿼리 → 검색 결과 캐시 크기 (색인 변경 시 무효화)
+    
+    # 재순위화(크로스 인코더) 설정
+    RERANK_MODEL: str = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"
+    RERANK_CANDIDATES: int = 20  # 재순위화할 1차 검색 후보 수
+    RERANK_BATCH_SIZE: int = 32  # 추론 배치 크기
+    RERANK_BUDGET_MS: int = 150  # 지연 예산 (초과 시 1차 검색 순서 사용)
+    RERANK_CACHE_SIZE: int = 10000  # (쿼리, 청크) 점수 캐시 크기
+    
+    # RAG 컨텍스트 설정
+    RAG_CONTEXT_MAX_TOKENS: int = 3000  # 프롬프트에 넣을 검색 컨텍스트 토큰 예산
+    
+    # 문서 수집 파이프라인 설정
+    INGEST_CHUNK_SIZE: int = 1000  # 청크 최대 문자 수
+    INGEST_CHUNK_OVERLAP: int = 200  # 인접 청크 간 겹치는 문자 수
+    INGEST_EMBED_BATCH_SIZE: int = 64  # 임베딩/색인 배치 크기
+    INGEST_QUEUE_SIZE: int = 4  # 스테이지 사이 큐에 쌓을 수 있는 배치 수
+    INGEST_EMBED_CONCURRENCY: int = 2  # 동시 임베딩 요청 수
+    
+    # 중복 청크 제거 설정 (MinHash/LSH)
+    DEDUP_ENABLED: bool = True
+    DEDUP_THRESHOLD: float = 0.85  # 중복으로 판정할 추정 Jaccard 유사도
+    DEDUP_NUM_PERM: int = 128  # MinHash 시그니처 길이
+    DEDUP_BANDS: int = 16  # LSH band 수 (NUM_PERM의 약수)
+    DEDUP_SHINGLE_SIZE: int = 5  # shingle 문자 수
+    
+    # 문서 파싱(프로세스 풀) 설정 - PDF/DOCX/이미지
+    DOCUMENT_PARSER_WORKERS: Optional[int] = None  # None이면 CPU 코어 수
+    DOCUMENT_PARSER_MAX_TASKS_PER_CHILD: int = 50  # 워커 재생성 주기 (작업 수)
+    DOCUMENT_PARSER_TIMEOUT: int = 120  # 작업별 제한 시간(초)
+    DOCUMENT_PARSER_MEMORY_LIMIT_MB: int = 1024  # 워커별 메모리 상한 (0이면 제한 없음)
+    DOCUMENT_PARSER_WORK_DIR: str = "./data/parsing"  # 업로드/추출 텍스트 임시 파일 위치
+    
+    # 문서 요약(맵-리듀스) 설정
+    SUMMARY_CHUNK_SIZE: int = 6000  # 맵 단계 청크 최대 문자 수
+    SUMMARY_CONCURRENCY: int = 8  # 동시 LLM 요청 수
+    SUMMARY_FAN_IN: int = 8  # 리듀스 단계에서 한 번에 합칠 요약 수
+    
+    # 도구 호출 에이전트 설정
+    AGENT_MAX_STEPS: int = 6  # 도구를 호출하는 최대 단계(LLM 왕복) 수
+    AGENT_STEP_TIMEOUT: float = 30.0  # 단계별 도구 실행 제한 시간(초)
+    AGENT_TOOL_CONCURRENCY: int = 8  # 단계별 동시 도구 실행 수
+    
+    # 문서 분석 결과 캐시 설정 (파일 내용 해시 기반, DB 저장)
+    ANALYSIS_CACHE_ENABLED: bool = True
+    ANALYSIS_CACHE_TTL: int = 604800  # 항목 유지 시간(초, 기본 7일)
+    ANALYSIS_CACHE_MAX_ENTRIES: int = 10000  # 최대 항목 수 (초과 시 LRU 제거)
+    
     # AI 모델 설정
     DEFAULT_LLM_MODEL: str = "gpt-4"
     DEFAULT_EMBEDDING_MODEL: str = "text-embedding-ada-002"
+    EMBEDDING_PROVIDER: str = "openai"  # openai, local
+    LOCAL_EMBEDDING_MODEL: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    LOCAL_EMBEDDING_BATCH_SIZE: int = 32  # 로컬 추론 배치 크기
     MAX_TOKENS: int = 4000
     TEMPERATURE: float = 0.7
     
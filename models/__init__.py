@@ -1,2 +1,4 @@
 """데이터 모델 정의"""
 from .user import User, UserCreate, UserUpdate
+from .chunk_signature import ChunkSignature
+from .analysis_cache import AnalysisCacheEntry
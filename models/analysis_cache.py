@@ -0,0 +1,37 @@
+"""문서 분석 결과 캐시 모델 정의"""
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class AnalysisCacheEntry(Base):
+    """문서 분석 결과 캐시 모델"""
+    
+    __tablename__ = "analysis_cache"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, index=True, nullable=False)
+    
+    # 캐시 키 구성 요소
+    content_hash = Column(String(64), index=True, nullable=False)
+    analysis_type = Column(String(50), nullable=False)
+    language = Column(String(10), nullable=False)
+    provider = Column(String(50), nullable=False)
+    model = Column(String(100), nullable=False)
+    
+    # 저장된 DocumentAnalysisResponse
+    response = Column(JSON, nullable=False)
+    
+    # 사용 정보 (만료/LRU 제거용)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_accessed_at = Column(DateTime(timezone=True), index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), index=True, nullable=False)
+    
+    def __repr__(self):
+        return (
+            f"<AnalysisCacheEntry(content_hash={self.content_hash}, "
+            f"analysis_type={self.analysis_type})>"
+        )
@@ -0,0 +1,38 @@
+"""청크 MinHash 시그니처 모델 정의"""
+
+from sqlalchemy import Column, DateTime, Float, Integer, LargeBinary, String, UniqueConstraint
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class ChunkSignature(Base):
+    """청크 MinHash 시그니처 모델 (중복 청크 탐지용)"""
+    
+    __tablename__ = "chunk_signatures"
+    __table_args__ = (
+        UniqueConstraint("document_id", "chunk_index", name="uq_chunk_signatures_chunk"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    document_id = Column(String(36), index=True, nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+    tenant = Column(String(255), index=True, nullable=True)
+    source = Column(String(255), nullable=True)
+    
+    # MinHash 시그니처 (uint32 * num_perm)
+    signature = Column(LargeBinary, nullable=False)
+    
+    # 중복 청크인 경우 원본 청크 참조
+    duplicate_of_document_id = Column(String(36), nullable=True)
+    duplicate_of_chunk_index = Column(Integer, nullable=True)
+    similarity = Column(Float, nullable=True)
+    
+    # 메타 정보
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return (
+            f"<ChunkSignature(document_id={self.document_id}, "
+            f"chunk_index={self.chunk_index})>"
+        )
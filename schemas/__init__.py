@@ -1,29 +1,20 @@
 """Pydantic 스키마 정의"""
 
-from .auth import Token, TokenData, LoginRequest, RegisterRequest
-from .ai import ChatRequest, ChatResponse, AIModel, AIProvider
-from .file import FileUploadResponse, FileInfo
-from .common import BaseResponse, ErrorResponse, PaginationParams
+from .ai import (
+    ChatRequest,
+    ChatResponse,
+    AIModel,
+    AIProvider,
+    KnowledgeSearchRequest,
+    KnowledgeSearchResponse,
+)
 
 __all__ = [
-    # 인증 관련
-    "Token",
-    "TokenData",
-    "LoginRequest",
-    "RegisterRequest",
-    
     # AI 관련
     "ChatRequest",
-    "ChatResponse", 
+    "ChatResponse",
     "AIModel",
     "AIProvider",
-    
-    # 파일 관련
-    "FileUploadResponse",
-    "FileInfo",
-    
-    # 공통
-    "BaseResponse",
-    "ErrorResponse",
-    "PaginationParams",
-] 
\ No newline at end of file
+    "KnowledgeSearchRequest",
+    "KnowledgeSearchResponse",
+]
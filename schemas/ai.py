@@ -1,8 +1,8 @@
 """AI 관련 Pydantic 스키마"""
 
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, Field, model_validator
 
 
 class ChatMessage(BaseModel):
@@ -26,6 +26,20 @@ class ChatRequest(BaseModel):
     system_message: Optional[str] = Field(None, description="시스템 메시지")
 
 
+class AgentRequest(BaseModel):
+    """도구 호출 에이전트 요청 스키마"""
+    
+    message: str = Field(..., description="사용자 메시지")
+    provider: Optional[str] = Field(None, description="AI 프로바이더")
+    model: Optional[str] = Field(None, description="AI 모델명")
+    system_message: Optional[str] = Field(None, description="시스템 메시지")
+    tools: Optional[List[str]] = Field(
+        None, description="사용할 도구 이름 (기본값: 로컬 도구와 이미 시작된 MCP 서버의 도구)"
+    )
+    max_steps: Optional[int] = Field(None, ge=1, le=20, description="도구를 호출하는 최대 단계 수")
+    step_timeout: Optional[float] = Field(None, gt=0, le=300, description="단계별 도구 실행 제한 시간(초)")
+
+
 class ChatResponse(BaseModel):
     """채팅 응답 스키마"""
     
@@ -58,6 +72,62 @@ class DocumentAnalysisResponse(BaseModel):
     language: str = Field(..., description="분석 언어")
     confidence: float = Field(..., description="분석 신뢰도")
     processing_time: float = Field(..., description="처리 시간(초)")
+    file_size: Optional[int] = Field(None, description="파일 크기(bytes)")
+    result: Optional[str] = Field(None, description="분석 결과")
+    document_id: Optional[str] = Field(None, description="색인된 문서 ID")
+    chunks_indexed: int = Field(0, description="색인된 청크 수")
+    duplicate_chunks: List[Dict[str, Any]] = Field(default_factory=list, description="중복으로 건너뛴 청크")
+    cached: bool = Field(False, description="캐시된 결과 여부")
+
+
+class MetadataFilter(BaseModel):
+    """메타데이터 필터 표현식 스키마"""
+    
+    field: Literal["tenant", "source", "document_type", "date"] = Field(..., description="필터 필드")
+    op: Literal["eq", "in", "gte", "lte", "between"] = Field(
+        "eq", description="연산자 (eq, in / 날짜: eq, gte, lte, between)"
+    )
+    value: Any = Field(..., description="비교 값 (in은 목록, between은 [시작일, 종료일])")
+
+    @model_validator(mode="after")
+    def check_value(self) -> "MetadataFilter":
+        """연산자별 값 형식 검증 (날짜 값은 date로 변환)"""
+        if self.field == "date":
+            if self.op == "in":
+                raise ValueError("date 필드는 in 연산자를 지원하지 않습니다 (between 사용)")
+            if self.op == "between":
+                if not isinstance(self.value, list) or len(self.value) != 2:
+                    raise ValueError("between 값은 [시작일, 종료일] 형식이어야 합니다")
+                self.value = [_to_date(item) for item in self.value]
+            else:
+                self.value = _to_date(self.value)
+            return self
+
+        if self.op == "eq":
+            if self.value is not None and not isinstance(self.value, str):
+                raise ValueError(f"{self.field} eq 값은 문자열이어야 합니다")
+        elif self.op == "in":
+            if not isinstance(self.value, list) or not 1 <= len(self.value) <= 100:
+                raise ValueError(f"{self.field} in 값은 1~100개의 목록이어야 합니다")
+            if not all(item is None or isinstance(item, str) for item in self.value):
+                raise ValueError(f"{self.field} in 값은 문자열 목록이어야 합니다")
+        else:
+            raise ValueError(f"{self.field} 필드는 {self.op} 연산자를 지원하지 않습니다 (eq, in)")
+        return self
+
+
+def _to_date(value: Any) -> date:
+    """날짜 필터 값(ISO 문자열 또는 date) 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"날짜는 YYYY-MM-DD 문자열이어야 합니다: {value!r}")
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        raise ValueError(f"날짜 형식이 올바르지 않습니다: {value!r}")
 
 
 class KnowledgeSearchRequest(BaseModel):
@@ -66,6 +136,12 @@ class KnowledgeSearchRequest(BaseModel):
     query: str = Field(..., description="검색 쿼리")
     top_k: int = Field(5, ge=1, le=20, description="검색 결과 수")
     threshold: float = Field(0.7, ge=0.0, le=1.0, description="유사도 임계값")
+    mode: str = Field("hybrid", description="검색 방식 (vector, keyword, hybrid)")
+    filters: List[MetadataFilter] = Field(default_factory=list, description="메타데이터 필터 (AND 결합)")
+    rerank: bool = Field(False, description="크로스 인코더 재순위화 여부")
+    context_tokens: Optional[int] = Field(
+        None, ge=1, description="지정하면 이 토큰 예산에 맞춘 RAG 컨텍스트를 함께 반환"
+    )
     provider: str = Field(default="openai", description="AI 프로바이더")
     include_metadata: bool = Field(True, description="메타데이터 포함 여부")
 
@@ -77,6 +153,7 @@ class KnowledgeSearchResponse(BaseModel):
     results: List[Dict[str, Any]] = Field(..., description="검색 결과")
     total_results: int = Field(..., description="전체 결과 수")
     search_time: float = Field(..., description="검색 시간(초)")
+    context: Optional[Dict[str, Any]] = Field(None, description="패킹된 RAG 컨텍스트와 포함 내역")
 
 
 class AIModel(BaseModel):
@@ -108,6 +185,12 @@ class MCPToolCall(BaseModel):
     server_name: Optional[str] = Field(None, description="MCP 서버명")
 
 
+class MCPBatchRequest(BaseModel):
+    """MCP 도구 일괄 호출 요청 스키마"""
+    
+    calls: List[MCPToolCall] = Field(..., min_length=1, max_length=100, description="도구 호출 목록")
+
+
 class MCPToolResponse(BaseModel):
     """MCP 도구 응답 스키마"""
     
@@ -0,0 +1,106 @@
+"""도구 호출 에이전트 체인 테스트"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+from ai.chains import agent_chain as agent_module
+from ai.chains import AgentChain
+from ai.tools import tool
+
+pytestmark = pytest.mark.unit
+
+
+class FakeToolCallingLLM:
+    """첫 턴에 slow/fast 도구를 함께 호출하고, 도구 결과를 받으면 그 내용으로 답하는 LLM"""
+
+    def bind_tools(self, tools):
+        self.bound = [item["function"]["name"] for item in tools]
+        return self
+
+    async def ainvoke(self, messages: List[BaseMessage]) -> AIMessage:
+        results = [message.content for message in messages if isinstance(message, ToolMessage)]
+        if results:
+            return AIMessage(content=" | ".join(results))
+        return AIMessage(content="", tool_calls=[
+            {"name": "slow", "args": {}, "id": "call_slow"},
+            {"name": "fast", "args": {}, "id": "call_fast"},
+        ])
+
+
+class FakeProvider:
+    def get_chat_model(self) -> FakeToolCallingLLM:
+        return FakeToolCallingLLM()
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    monkeypatch.setattr(agent_module, "get_llm_provider", lambda **kwargs: FakeProvider())
+    state = {"cancelled": False}
+
+    @tool()
+    async def slow() -> str:
+        """오래 걸리는 도구"""
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        return "slow"
+
+    @tool()
+    async def fast() -> str:
+        """바로 끝나는 도구"""
+        return "fast"
+
+    chain = AgentChain(system_message="test", tools=[slow, fast], step_timeout=0.2)
+    chain.state = state
+    return chain
+
+
+async def test_step_deadline_cancels_unfinished_tool_calls(chain):
+    started = time.perf_counter()
+    events = [event async for event in chain.astream([{"role": "user", "content": "hi"}])]
+    elapsed = time.perf_counter() - started
+
+    assert [event["type"] for event in events] == ["tool_calls", "tool_result", "tool_result", "final"]
+    fast, slow = events[1], events[2]
+    assert (fast["name"], fast["success"], fast["content"]) == ("fast", True, "fast")
+    assert slow["name"] == "slow" and not slow["success"]
+    assert "시간이 초과" in slow["content"]
+
+    # 도구 메시지는 요청 순서대로 다음 LLM 호출에 전달됨
+    assert events[-1]["content"].startswith("도구 실행 시간이 초과")
+    assert events[-1]["content"].endswith("| fast")
+    assert elapsed < 2
+    await asyncio.sleep(0)
+    assert chain.state["cancelled"]
+
+
+async def test_default_tools_do_not_start_mcp_servers(monkeypatch, tmp_path):
+    import json
+    import sys
+    from pathlib import Path
+
+    from ai.mcp import MCPManager
+    from ai.tools import ToolRegistry
+    from ai.tools import registry as registry_module
+
+    config = tmp_path / "mcp_servers.json"
+    fake_server = Path(__file__).parents[1] / "mcp" / "fake_server.py"
+    config.write_text(json.dumps({
+        "mcpServers": {"fake": {"command": sys.executable, "args": [str(fake_server)]}}
+    }))
+    manager = MCPManager(str(config), allowed_servers=["*"])
+    monkeypatch.setattr(registry_module, "get_mcp_manager", lambda: manager)
+    monkeypatch.setattr(agent_module, "get_tool_registry", lambda: ToolRegistry())
+    monkeypatch.setattr(agent_module, "get_llm_provider", lambda **kwargs: FakeProvider())
+
+    chain = AgentChain(system_message="test", step_timeout=0.2)
+    events = [event async for event in chain.astream([{"role": "user", "content": "hi"}])]
+
+    assert events[-1]["type"] == "final"
+    assert manager.pool("fake").status()["live_sessions"] == 0
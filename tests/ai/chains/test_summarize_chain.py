@@ -0,0 +1,75 @@
+"""맵-리듀스 요약 체인 테스트"""
+
+import asyncio
+import random
+import re
+from typing import List
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage
+
+from ai.chains import summarize_chain as summarize_module
+from ai.chains import SummarizeChain
+
+pytestmark = pytest.mark.unit
+
+_MARKER = re.compile(r"#\d+")
+
+
+class FakeLLM:
+    """입력에 포함된 #번호를 순서대로 묶어 돌려주는 LLM (임의 지연으로 완료 순서를 섞음)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, messages: List[BaseMessage]) -> AIMessage:
+        self.calls += 1
+        await asyncio.sleep(random.random() / 100)
+        return AIMessage(content=" ".join(_MARKER.findall(messages[-1].content)))
+
+
+class FakeProvider:
+    def __init__(self):
+        self.llm = FakeLLM()
+
+    def get_chat_model(self) -> FakeLLM:
+        return self.llm
+
+
+@pytest.fixture
+def chain(monkeypatch) -> SummarizeChain:
+    monkeypatch.setattr(summarize_module, "get_llm_provider", lambda **kwargs: FakeProvider())
+    return SummarizeChain(chunk_size=40, concurrency=4, fan_in=3)
+
+
+def test_group_respects_fan_in_and_size(chain):
+    groups = chain._group(["a" * 10] * 7)
+    assert groups == [["a" * 10] * 3, ["a" * 10] * 3, ["a" * 10]]
+
+    # 크기 상한을 넘어도 그룹당 최소 두 개는 묶어 단계마다 줄어들게 함
+    assert chain._group(["a" * 30, "b" * 30, "c" * 30]) == [["a" * 30, "b" * 30], ["c" * 30]]
+    assert chain._group(["x"]) == [["x"]]
+
+
+async def test_map_reduce_preserves_document_order(chain):
+    markers = [f"#{i:02d}" for i in range(20)]
+    text = "".join(f"{marker} {'본문 ' * 6}\n\n" for marker in markers)
+
+    async def pieces():
+        for start in range(0, len(text), 7):
+            yield text[start:start + 7]
+
+    events = [event async for event in chain.astream(pieces())]
+
+    partials = [event for event in events if event["type"] == "partial" and event["level"] == 0]
+    assert len(partials) == len(markers)
+
+    final = events[-1]
+    assert final["type"] == "final"
+    assert final["levels"] >= 2
+    assert _MARKER.findall(final["summary"]) == markers
+
+
+async def test_single_chunk_is_not_reduced(chain):
+    assert await chain.ainvoke("#01 짧은 문서") == "#01"
+    assert chain.llm.calls == 1
@@ -0,0 +1,119 @@
+"""MinHash 중복 청크 탐지 테스트"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from ai.documents import dedup as dedup_module
+from ai.documents.dedup import ChunkDeduplicator, get_deduplicator
+from ai.documents.pipeline import IngestionPipeline
+from ai.embeddings import VectorStore
+from ai.retrieval import KnowledgeBase
+from models.chunk_signature import ChunkSignature
+
+pytestmark = pytest.mark.unit
+
+TEXT = " ".join(
+    f"{i}번 문단은 벡터 검색과 키워드 검색을 함께 쓰는 하이브리드 검색 구성을 설명합니다."
+    for i in range(40)
+)
+
+
+@pytest.fixture
+async def database(tmp_path, monkeypatch):
+    """시그니처 저장용 sqlite 데이터베이스"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'dedup.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ChunkSignature.__table__.create)
+
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def session():
+        async with sessions() as db:
+            yield db
+
+    monkeypatch.setattr(dedup_module, "_session", session)
+    yield engine
+    await engine.dispose()
+
+
+def new_knowledge_base(embedding_provider) -> KnowledgeBase:
+    store = VectorStore(embedding_provider.embedding_dimension, "none")
+    return KnowledgeBase(embedding_provider, vector_store=store)
+
+
+async def ingest(knowledge_base, text=TEXT, deduplicator=None, **metadata):
+    async def stream():
+        yield text
+
+    pipeline = IngestionPipeline(
+        knowledge_base, chunk_size=200, chunk_overlap=0, batch_size=4,
+        deduplicator=deduplicator,
+    )
+    return await pipeline.run(stream(), metadata)
+
+
+async def test_reingested_document_is_all_duplicates(database, embedding_provider):
+    knowledge_base = new_knowledge_base(embedding_provider)
+    first = await ingest(knowledge_base, tenant="acme")
+    assert first["chunks"] > 1
+    assert not first["duplicates"]
+
+    second = await ingest(knowledge_base, tenant="acme")
+    assert second["chunks"] == 0
+    assert len(second["duplicates"]) == first["chunks"]
+    assert {d["duplicate_of"]["document_id"] for d in second["duplicates"]} == {first["document_id"]}
+
+
+async def test_restart_with_empty_index_does_not_flag_duplicates(database, embedding_provider):
+    await ingest(new_knowledge_base(embedding_provider), tenant="acme")
+
+    # 재시작: 메모리 지식 베이스가 비었으므로 저장된 시그니처를 원본으로 쓰면 안 됨
+    restarted = new_knowledge_base(embedding_provider)
+    result = await ingest(restarted, tenant="acme")
+    assert result["chunks"] > 0
+    assert not result["duplicates"]
+
+
+async def test_restart_restores_signatures_of_indexed_documents(database, embedding_provider):
+    knowledge_base = new_knowledge_base(embedding_provider)
+    first = await ingest(knowledge_base, tenant="acme")
+
+    # 재시작: 지식 베이스 내용은 그대로이고 탐지기만 새로 만들어짐
+    result = await ingest(knowledge_base, tenant="acme", deduplicator=ChunkDeduplicator())
+    assert result["chunks"] == 0
+    assert len(result["duplicates"]) == first["chunks"]
+
+
+async def test_duplicates_are_scoped_by_tenant(database, embedding_provider):
+    knowledge_base = new_knowledge_base(embedding_provider)
+    await ingest(knowledge_base, tenant="acme")
+
+    other = await ingest(knowledge_base, tenant="globex")
+    assert other["chunks"] > 0
+    assert not other["duplicates"]
+
+
+async def test_failed_indexing_does_not_register_signatures(database, embedding_provider, monkeypatch):
+    knowledge_base = new_knowledge_base(embedding_provider)
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("색인 실패")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(knowledge_base, "add_texts", fail)
+        with pytest.raises(RuntimeError):
+            await ingest(knowledge_base, tenant="acme")
+
+    assert not get_deduplicator(knowledge_base).indexes
+    result = await ingest(knowledge_base, tenant="acme")
+    assert result["chunks"] > 0
+    assert not result["duplicates"]
+
+
+async def test_repeated_chunks_within_a_document_are_detected(database, embedding_provider):
+    paragraph = "같은 문단이 한 문서 안에서 여러 번 반복되는 경우를 확인합니다. " * 5
+    result = await ingest(new_knowledge_base(embedding_provider), paragraph * 4, tenant="acme")
+    assert result["duplicates"]
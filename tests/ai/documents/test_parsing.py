@@ -0,0 +1,81 @@
+"""문서 파싱 프로세스 풀 테스트"""
+
+import signal
+import time
+
+import pytest
+
+from ai.documents import parsing
+from ai.documents.parsing import DocumentParseTimeoutError, DocumentParsingService, DocumentTooLargeError
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = DocumentParsingService(max_workers=1, timeout=1, work_dir=str(tmp_path))
+    yield service
+    if service._executor is not None:
+        service._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def test_reset_ignores_a_pool_that_was_already_replaced(service):
+    stale = service._get_executor()
+    service._reset_executor(stale)
+    current = service._get_executor()
+
+    # 같은 (이전) 풀에서 늦게 실패한 작업이 새 풀을 버리면 안 됨
+    service._reset_executor(stale)
+    assert service._executor is current
+
+
+def test_timeout_reset_kills_hung_workers(service):
+    executor = service._get_executor()
+    executor.submit(time.sleep, 60)
+    deadline = time.monotonic() + 30
+    while not executor._processes and time.monotonic() < deadline:
+        time.sleep(0.05)
+    processes = list(executor._processes.values())
+    assert processes
+
+    service._reset_executor(executor, terminate=True)
+
+    for process in processes:
+        process.join(timeout=10)
+        assert not process.is_alive()
+    assert service._executor is None
+
+
+def _slow_worker(path, output_dir, timeout):
+    # 워커 안에서 실제 SIGALRM 제한 시간이 동작하도록 함
+    signal.signal(signal.SIGALRM, parsing._on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    time.sleep(60)
+
+
+def _memory_hungry_worker(path, output_dir, timeout):
+    raise MemoryError
+
+
+def _echo_worker(path, output_dir, timeout):
+    return path
+
+
+async def test_worker_timeout_keeps_the_pool(service, monkeypatch):
+    executor = service._get_executor()
+    monkeypatch.setattr(parsing, "_parse_in_worker", _slow_worker)
+    with pytest.raises(DocumentParseTimeoutError):
+        await service.parse("slow.pdf")
+
+    # 한 문서의 시간 초과로 다른 사용자의 작업이 실패하면 안 됨
+    assert service._executor is executor
+    monkeypatch.setattr(parsing, "_parse_in_worker", _echo_worker)
+    assert await service.parse("next.pdf") == "next.pdf"
+
+
+async def test_worker_memory_error_is_reported_as_too_large(service, monkeypatch):
+    executor = service._get_executor()
+    monkeypatch.setattr(parsing, "_parse_in_worker", _memory_hungry_worker)
+    with pytest.raises(DocumentTooLargeError):
+        await service.parse("huge.pdf")
+    assert service._executor is executor
@@ -0,0 +1,124 @@
+"""양자화 벡터 스토어 테스트"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from ai.embeddings.quantization import MIN_CALIBRATION_SIZE
+from ai.embeddings.vector_store import VectorStore, evaluate_recall, top_indices
+
+pytestmark = pytest.mark.unit
+
+DIMENSION = 64
+
+
+@pytest.fixture
+def vectors() -> np.ndarray:
+    return np.random.default_rng(0).normal(size=(2000, DIMENSION)).astype(np.float32)
+
+
+def exact_top(vectors: np.ndarray, query: np.ndarray, k: int) -> list:
+    matrix = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return top_indices(matrix @ (query / np.linalg.norm(query)), k).tolist()
+
+
+@pytest.mark.parametrize("storage", [False, True])
+def test_int8_search_matches_exact_search(vectors, tmp_path, storage):
+    store = VectorStore(DIMENSION, "int8", storage_dir=str(tmp_path) if storage else None)
+    store.add(vectors)
+
+    queries = vectors[:50] + 0.05
+    assert evaluate_recall(store, vectors, queries, top_k=10) >= 0.95
+
+    # 원본으로 재채점하면 점수도 정확한 코사인 유사도
+    if storage:
+        query = queries[0]
+        ids = [row_id for row_id, _ in store.search(query, top_k=10)]
+        assert ids == exact_top(vectors, query, 10)
+
+
+def test_float_store_is_exact(vectors):
+    store = VectorStore(DIMENSION, "none")
+    store.add(vectors)
+
+    query = vectors[7]
+    results = store.search(query, top_k=5)
+    assert [row_id for row_id, _ in results] == exact_top(vectors, query, 5)
+    assert results[0] == (7, pytest.approx(1.0, abs=1e-5))
+
+
+def test_deleted_and_masked_rows_are_skipped(vectors):
+    store = VectorStore(DIMENSION, "int8")
+    store.add(vectors[:100])
+
+    store.delete([3])
+    assert 3 not in {row_id for row_id, _ in store.search(vectors[3], top_k=10)}
+
+    mask = np.zeros(100, dtype=np.bool_)
+    mask[[10, 20, 30]] = True
+    assert {row_id for row_id, _ in store.search(vectors[10], top_k=10, mask=mask)} == {10, 20, 30}
+
+
+def test_small_batches_are_recalibrated(vectors):
+    store = VectorStore(DIMENSION, "int8")
+    for start in range(0, len(vectors), 10):
+        store.add(vectors[start:start + 10])
+
+    # 첫 배치(10행)의 [-1, 1] 기본 범위에 머무르지 않고 충분한 표본으로 다시 보정
+    assert store.quantizer.fitted_rows >= MIN_CALIBRATION_SIZE
+    assert store.quantizer.scale.max() < 2.0 / 255.0
+    assert evaluate_recall(store, vectors, vectors[:50] + 0.05, top_k=10) >= 0.95
+
+
+def test_out_of_range_values_trigger_refit(vectors):
+    store = VectorStore(DIMENSION, "int8")
+    store.add(vectors[:MIN_CALIBRATION_SIZE])
+    fitted = store.quantizer
+
+    outlier = np.zeros((1, DIMENSION), dtype=np.float32)
+    outlier[0, 0] = 1.0
+    store.add(outlier)
+    store.add(vectors[MIN_CALIBRATION_SIZE:2 * MIN_CALIBRATION_SIZE])
+
+    assert store.quantizer is not fitted
+    assert store.quantizer.covers(outlier)
+    assert store.search(outlier[0], top_k=1)[0][0] == MIN_CALIBRATION_SIZE
+
+
+def test_originals_file_is_not_left_on_disk(vectors, tmp_path):
+    store = VectorStore(DIMENSION, "int8", storage_dir=str(tmp_path))
+    store.add(vectors)
+    assert list(tmp_path.iterdir()) == []
+    store.close()
+
+
+def test_search_is_safe_during_concurrent_writes(vectors, tmp_path):
+    store = VectorStore(DIMENSION, "int8", storage_dir=str(tmp_path))
+    store.add(vectors[:5])
+    errors: list = []
+    stop = threading.Event()
+
+    def search():
+        while not stop.is_set():
+            try:
+                store.search(vectors[0], top_k=5, mask=np.ones(10, dtype=np.bool_))
+                store.search(vectors[1], top_k=5)
+            except Exception as e:  # pragma: no cover - 실패 시 보고용
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=search) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for start in range(5, len(vectors), 7):
+            store.add(vectors[start:start + 7])
+            store.delete([start])
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+    assert errors == []
+    assert len(store) == len(vectors)
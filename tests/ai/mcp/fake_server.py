@@ -0,0 +1,69 @@
+"""테스트용 최소 MCP stdio 서버
+
+도구 호출은 요청마다 스레드에서 처리하므로 응답이 요청 순서와 다르게 나갑니다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+TOOLS = [
+    {
+        "name": "sleep",
+        "description": "seconds만큼 기다린 뒤 tag 반환",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"seconds": {"type": "number"}, "tag": {"type": "string"}},
+            "required": ["seconds", "tag"],
+        },
+    },
+    {"name": "crash", "description": "프로세스 종료", "inputSchema": {"type": "object"}},
+]
+
+_write_lock = threading.Lock()
+
+
+def send(message):
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def call_tool(request_id, name, arguments):
+    if name == "crash":
+        os._exit(1)
+    time.sleep(arguments["seconds"])
+    send({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {"content": [{"type": "text", "text": arguments["tag"]}], "pid": os.getpid()},
+    })
+
+
+def main():
+    for line in sys.stdin:
+        message = json.loads(line)
+        method, request_id = message.get("method"), message.get("id")
+        if request_id is None:
+            continue
+        if method == "initialize":
+            send({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "result": {"serverInfo": {"name": "fake"}, "capabilities": {"tools": {}}},
+            })
+        elif method == "tools/list":
+            send({"jsonrpc": "2.0", "id": request_id, "result": {"tools": TOOLS}})
+        elif method == "tools/call":
+            params = message["params"]
+            threading.Thread(
+                target=call_tool, args=(request_id, params["name"], params["arguments"]), daemon=True
+            ).start()
+        else:
+            send({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32601, "message": method}})
+
+
+if __name__ == "__main__":
+    main()
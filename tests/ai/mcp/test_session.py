@@ -0,0 +1,114 @@
+"""MCP stdio 세션 다중화 테스트 (가짜 stdio 서버 사용)"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ai.mcp import (
+    MCPConnectionError,
+    MCPManager,
+    MCPServerConfig,
+    MCPServerNotAllowedError,
+    MCPServerPool,
+    MCPToolValidationError,
+)
+
+pytestmark = pytest.mark.integration
+
+FAKE_SERVER = str(Path(__file__).with_name("fake_server.py"))
+
+
+def fake_config(**kwargs) -> MCPServerConfig:
+    return MCPServerConfig(name="fake", command=sys.executable, args=[FAKE_SERVER], **kwargs)
+
+
+@pytest.fixture
+async def pool():
+    pool = MCPServerPool(fake_config(pool_size=1, request_timeout=5, startup_timeout=10))
+    yield pool
+    await pool.close()
+
+
+async def test_concurrent_calls_share_one_process(pool):
+    delays = {"a": 0.5, "b": 0.1, "c": 0.3, "d": 0.2, "e": 0.4}
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        pool.call_tool("sleep", {"seconds": seconds, "tag": tag}) for tag, seconds in delays.items()
+    ))
+    elapsed = time.perf_counter() - started
+
+    # 응답은 끝나는 순서대로 오지만 요청 ID로 각 호출자에게 돌아감
+    assert [result["content"][0]["text"] for result in results] == list(delays)
+    assert len({result["pid"] for result in results}) == 1
+    assert pool.status()["live_sessions"] == 1
+    assert elapsed < sum(delays.values())
+
+
+async def test_invalid_arguments_are_rejected_before_sending(pool):
+    await pool.list_tools()
+    with pytest.raises(MCPToolValidationError):
+        await pool.call_tool("sleep", {"seconds": "soon", "tag": "x"})
+    with pytest.raises(MCPToolValidationError):
+        await pool.call_tool("missing", {})
+
+
+async def test_crash_fails_in_flight_calls_and_restarts(pool):
+    slow = asyncio.create_task(pool.call_tool("sleep", {"seconds": 5, "tag": "slow"}))
+    await asyncio.sleep(0.2)
+
+    with pytest.raises(MCPConnectionError):
+        await pool.call_tool("crash", {})
+    with pytest.raises(MCPConnectionError):
+        await slow
+
+    result = await pool.call_tool("sleep", {"seconds": 0, "tag": "again"})
+    assert result["content"][0]["text"] == "again"
+    assert pool.restarts == 1
+
+
+async def test_manager_only_starts_allowed_servers(tmp_path):
+    config = tmp_path / "mcp_servers.json"
+    config.write_text(json.dumps({
+        "mcpServers": {
+            "fake": {"command": sys.executable, "args": [FAKE_SERVER]},
+            "other": {"command": sys.executable, "args": [FAKE_SERVER]},
+        }
+    }))
+    manager = MCPManager(str(config), allowed_servers=["fake"])
+    try:
+        assert manager.allowed_servers == ["fake"]
+        with pytest.raises(MCPServerNotAllowedError):
+            await manager.call_tool("other", "sleep", {"seconds": 0, "tag": "x"})
+        assert manager.pool("fake").status()["live_sessions"] == 0
+
+        result = await manager.call_tool("fake", "sleep", {"seconds": 0, "tag": "ok"})
+        assert result["content"][0]["text"] == "ok"
+    finally:
+        await manager.shutdown()
+
+
+async def test_batch_yields_outcomes_as_they_finish(tmp_path):
+    config = tmp_path / "mcp_servers.json"
+    config.write_text(json.dumps({
+        "mcpServers": {"fake": {"command": sys.executable, "args": [FAKE_SERVER], "poolSize": 2}}
+    }))
+    manager = MCPManager(str(config), allowed_servers=["*"])
+    calls = [
+        {"server": "fake", "tool": "sleep", "arguments": {"seconds": 0.4, "tag": "slow"}},
+        {"server": "missing", "tool": "sleep", "arguments": {}},
+        {"server": "fake", "tool": "sleep", "arguments": {"seconds": 0.05, "tag": "fast"}},
+    ]
+    try:
+        outcomes = [outcome async for outcome in manager.call_batch(calls)]
+    finally:
+        await manager.shutdown()
+
+    assert [outcome.position for outcome in outcomes] == [1, 2, 0]
+    assert isinstance(outcomes[0].error, KeyError)
+    assert outcomes[1].result["content"][0]["text"] == "fast"
+    assert outcomes[2].result["content"][0]["text"] == "slow"
@@ -0,0 +1,105 @@
+"""증분 JSON 파서 테스트"""
+
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from ai.parsers import JSONStreamError, StreamingJSONParser, astream_json
+
+pytestmark = pytest.mark.unit
+
+DOCUMENT = (
+    '```json\n{"title": "검색 \\"요약\\"", "path": "a\\\\b\\/c\\n", '
+    '"emoji": "\\ud83d\\ude00", "hangul": "\\uD55C", "count": -12.5e2, '
+    '"ok": true, "none": null, "tags": ["x", {"y": [1, 2]}], "empty": {}}\n```'
+)
+
+
+def parse_in_chunks(text, size):
+    parser = StreamingJSONParser()
+    fields = []
+    for start in range(0, len(text), size):
+        fields.extend(parser.feed(text[start:start + size]))
+    return parser.close(), fields
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, len(DOCUMENT)])
+def test_chunk_boundaries_match_json_loads(size):
+    expected = json.loads(DOCUMENT[DOCUMENT.index("{"):DOCUMENT.rindex("}") + 1])
+    value, fields = parse_in_chunks(DOCUMENT, size)
+    assert value == expected
+    assert fields == list(expected.items())
+
+
+def test_fields_are_emitted_as_soon_as_complete():
+    parser = StreamingJSONParser()
+    assert parser.feed('{"a": "한') == []
+    assert parser.feed('글", "b": 1') == [("a", "한글")]
+    # 숫자는 구분자가 와야 완성됨
+    assert parser.feed("0") == []
+    assert parser.feed("}") == [("b", 10)]
+    assert parser.done
+
+
+def test_top_level_array_yields_elements():
+    value, fields = parse_in_chunks('[1, "two", [3]]', 1)
+    assert value == [1, "two", [3]]
+    assert fields == [(0, 1), (1, "two"), (2, [3])]
+
+
+def test_trailing_text_is_ignored():
+    parser = StreamingJSONParser()
+    parser.feed('설명입니다. {"a": 1} 이후 텍스트 {"b": 2}')
+    assert parser.close() == {"a": 1}
+
+
+@pytest.mark.parametrize("text", ['{"a": "\\ud800"}', '{"a": "\\udc00x"}', '{"a": "\\ud83dx\\ude00"}'])
+def test_lone_surrogate_is_kept_like_json_loads(text):
+    value, _ = parse_in_chunks(text, 1)
+    assert value == json.loads(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": tru}',
+        '{"a": NaN}',
+        '{"a": 01}',
+        '{"a": "\\x"}',
+        '{"a": "\\u12g4"}',
+        '{"a" 1}',
+        '{"a": 1,}',
+        '{1: 2}',
+        "[1 2]",
+        "[,]",
+    ],
+)
+def test_invalid_json_raises_stream_error(text):
+    with pytest.raises(JSONStreamError):
+        parse_in_chunks(text, 1)
+
+
+@pytest.mark.parametrize("text", ['{"a": 1', "설명만 있음"])
+def test_incomplete_stream_raises_on_close(text):
+    parser = StreamingJSONParser()
+    parser.feed(text)
+    with pytest.raises(JSONStreamError):
+        parser.close()
+
+
+class Answer(BaseModel):
+    answer: str
+    score: float
+
+
+async def test_astream_json_events_and_validation():
+    async def chunks():
+        yield '{"answer": "'
+        yield [{"type": "text", "text": '네"'}]  # 블록 목록 형식
+        yield ', "score": 0.9}'
+
+    events = [event async for event in astream_json(chunks(), Answer)]
+    assert [event["type"] for event in events] == ["field", "field", "final"]
+    assert events[0]["partial"] == {"answer": "네"}
+    assert events[-1]["value"] == Answer(answer="네", score=0.9)
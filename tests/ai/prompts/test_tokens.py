@@ -0,0 +1,52 @@
+"""토큰 수 계산 테스트"""
+
+import threading
+
+import pytest
+
+from ai.prompts import tokens
+from ai.prompts.tokens import count_tokens, estimate_tokens, load_encoding
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def unloaded(monkeypatch):
+    monkeypatch.setattr(tokens, "_encoding", None)
+    monkeypatch.setattr(tokens, "_loader", None)
+
+
+def test_count_tokens_does_not_wait_for_encoding(unloaded, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_load():
+        # 인코딩 파일 다운로드 흉내
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(tokens, "_get_encoding", slow_load)
+    try:
+        assert count_tokens("hello world") == estimate_tokens("hello world")
+        assert started.wait(5)
+    finally:
+        release.set()
+        tokens._loader.join(5)
+
+
+async def test_load_encoding_runs_in_thread(unloaded, monkeypatch):
+    loop_thread = threading.current_thread()
+    load_threads = []
+
+    class Encoding:
+        def encode(self, text, disallowed_special=()):
+            return text.split()
+
+    def load():
+        load_threads.append(threading.current_thread())
+        tokens._encoding = Encoding()
+        return tokens._encoding
+
+    monkeypatch.setattr(tokens, "_get_encoding", load)
+    assert await load_encoding()
+    assert load_threads and load_threads[0] is not loop_thread
+    assert count_tokens("a b c") == 3
@@ -0,0 +1,45 @@
+"""로컬 임베딩 프로바이더 테스트 (모델 없이 encode를 대체)"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from ai.providers.local_provider import LocalEmbeddingProvider
+
+pytestmark = pytest.mark.unit
+
+
+class SlowDocumentProvider(LocalEmbeddingProvider):
+    """문서 배치는 느리고 쿼리는 빠른 가짜 추론"""
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        if texts[0].startswith("doc"):
+            time.sleep(0.5)
+        return [[float(len(text))] for text in texts]
+
+
+async def test_query_is_not_queued_behind_document_batch():
+    provider = SlowDocumentProvider(model_name="fake")
+    documents = asyncio.create_task(provider.embed_documents(["doc"] * 8))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    assert await provider.embed_text("query") == [5.0]
+    assert time.perf_counter() - started < 0.3
+    assert not documents.done()
+    await documents
+
+
+async def test_unknown_model_dimension_does_not_load_on_event_loop():
+    provider = LocalEmbeddingProvider(model_name="unknown/model")
+    with pytest.raises(RuntimeError):
+        provider.embedding_dimension
+    assert provider._model is None
+
+
+def test_known_model_dimension_without_loading():
+    provider = LocalEmbeddingProvider(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    assert provider.embedding_dimension == 384
+    assert provider._model is None
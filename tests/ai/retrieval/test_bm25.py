@@ -0,0 +1,53 @@
+"""BM25 역색인 테스트"""
+
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ai.retrieval import bm25 as bm25_module
+from ai.retrieval.bm25 import BM25Index
+
+pytestmark = pytest.mark.unit
+
+
+def test_deleted_documents_are_not_returned():
+    index = BM25Index()
+    index.add(0, "환불 정책 안내")
+    index.add(1, "환불 절차")
+    index.add(2, "배송 안내")
+    index.delete(0)
+
+    assert [doc_id for doc_id, _ in index.search("환불")] == [1]
+    assert len(index) == 2
+
+
+def test_add_does_not_wait_for_scoring(monkeypatch):
+    index = BM25Index()
+    index.add(0, "환불 정책")
+    scoring, release = threading.Event(), threading.Event()
+
+    class SlowMath:
+        """점수 계산 도중 멈추는 math 모듈"""
+
+        @staticmethod
+        def log(value):
+            scoring.set()
+            release.wait(5)
+            return math.log(value)
+
+    monkeypatch.setattr(bm25_module, "math", SlowMath)
+    with ThreadPoolExecutor(1) as pool:
+        search = pool.submit(index.search, "환불")
+        try:
+            assert scoring.wait(5)
+            # 검색이 점수를 계산하는 동안에도 추가는 잠금을 기다리지 않음
+            adder = threading.Thread(target=index.add, args=(1, "배송 정책"))
+            adder.start()
+            adder.join(1)
+            assert not adder.is_alive()
+        finally:
+            release.set()
+        assert [doc_id for doc_id, _ in search.result()] == [0]
+    assert len(index) == 2
@@ -0,0 +1,104 @@
+"""메타데이터 비트맵 필터 테스트"""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from ai.retrieval import FilterExpression, MetadataIndex, tenant_filter
+from schemas.ai import MetadataFilter
+
+pytestmark = pytest.mark.unit
+
+CHUNKS = [
+    {"tenant": "acme", "source": "a.pdf", "document_type": "pdf", "date": "2024-01-01"},
+    {"tenant": "acme", "source": "b.txt", "document_type": "txt", "date": "2024-02-15"},
+    {"tenant": "globex", "source": "c.pdf", "document_type": "pdf", "date": "2024-03-31"},
+    {"source": "d.md", "document_type": "md", "date": "2024-04-01"},
+]
+
+
+@pytest.fixture
+def index() -> MetadataIndex:
+    index = MetadataIndex()
+    for chunk_id, metadata in enumerate(CHUNKS):
+        index.add(chunk_id, metadata)
+    return index
+
+
+def ids(index: MetadataIndex, *filters) -> list:
+    return sorted(index.evaluate(filters))
+
+
+@pytest.mark.parametrize(
+    "field, op, value, expected",
+    [
+        ("tenant", "eq", "acme", [0, 1]),
+        ("document_type", "in", ["pdf", "md"], [0, 2, 3]),
+        ("source", "eq", "없음", []),
+        ("date", "eq", "2024-02-15", [1]),
+        ("date", "gte", "2024-03-01", [2, 3]),
+        ("date", "lte", "2024-02-15", [0, 1]),
+        ("date", "between", ["2024-01-15", "2024-03-31"], [1, 2]),
+    ],
+)
+def test_filter_ops(index, field, op, value, expected):
+    assert ids(index, MetadataFilter(field=field, op=op, value=value)) == expected
+
+
+def test_filters_are_anded(index):
+    filters = [
+        MetadataFilter(field="document_type", op="eq", value="pdf"),
+        MetadataFilter(field="date", op="gte", value="2024-02-01"),
+    ]
+    assert ids(index, *filters) == [2]
+
+
+def test_tenant_filter_matches_untenanted_chunks_for_anonymous(index):
+    assert ids(index, tenant_filter("acme")) == [0, 1]
+    assert ids(index, tenant_filter(None)) == [3]
+
+
+def test_removed_chunks_leave_the_index(index):
+    index.remove(0, CHUNKS[0])
+    assert ids(index, tenant_filter("acme")) == [1]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        FilterExpression("tenant", "eq", ["acme"]),
+        FilterExpression("tenant", "in", "acme"),
+        FilterExpression("date", "between", ["2024-01-01"]),
+        FilterExpression("date", "gte", "어제"),
+        FilterExpression("source", "gte", "a"),
+        FilterExpression("owner", "eq", "x"),
+    ],
+)
+def test_malformed_expressions_raise_value_error(index, expression):
+    with pytest.raises(ValueError):
+        index.evaluate([expression])
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"field": "owner", "value": "x"},
+        {"field": "tenant", "op": "like", "value": "x"},
+        {"field": "tenant", "value": {"a": 1}},
+        {"field": "tenant", "op": "in", "value": "acme"},
+        {"field": "tenant", "op": "in", "value": []},
+        {"field": "source", "op": "gte", "value": "a"},
+        {"field": "date", "value": "2024-13-01"},
+        {"field": "date", "op": "between", "value": ["2024-01-01"]},
+        {"field": "date", "op": "in", "value": ["2024-01-01"]},
+    ],
+)
+def test_schema_rejects_malformed_filters(payload):
+    with pytest.raises(ValidationError):
+        MetadataFilter(**payload)
+
+
+def test_schema_parses_dates():
+    expression = MetadataFilter(field="date", op="between", value=["2024-01-01", "2024-01-31T10:00:00"])
+    assert expression.value == [date(2024, 1, 1), date(2024, 1, 31)]
@@ -0,0 +1,81 @@
+"""BM25 / RRF 하이브리드 검색 테스트"""
+
+import numpy as np
+import pytest
+
+from ai.retrieval import BM25Index, reciprocal_rank_fusion, tokenize
+
+pytestmark = pytest.mark.unit
+
+
+def test_tokenize_strips_josa_and_expands_codes():
+    tokens = tokenize("제품코드는 AB-1234 입니다")
+    assert "제품코드" in tokens
+    assert "코드" in tokens  # 복합명사 bigram
+    assert {"ab-1234", "ab1234", "ab", "1234"} <= set(tokens)
+
+
+def test_bm25_ranks_term_frequency_and_rarity():
+    index = BM25Index()
+    index.add(0, "배송 조회 방법")
+    index.add(1, "환불 규정 안내 환불 절차 환불 기간")
+    index.add(2, "환불 문의")
+    index.add(3, "회원 가입 안내")
+
+    ids = [doc_id for doc_id, _ in index.search("환불", top_k=10)]
+    assert ids == [1, 2]
+    assert index.search("없는단어", top_k=10) == []
+
+
+def test_bm25_delete_and_mask():
+    index = BM25Index()
+    for doc_id, text in enumerate(["환불 안내", "환불 규정", "환불 절차"]):
+        index.add(doc_id, text)
+
+    index.delete(1)
+    assert {doc_id for doc_id, _ in index.search("환불")} == {0, 2}
+
+    mask = np.array([False, True, True])
+    assert [doc_id for doc_id, _ in index.search("환불", mask=mask)] == [2]
+
+
+def test_bm25_rejects_duplicate_ids():
+    index = BM25Index()
+    index.add(0, "a")
+    with pytest.raises(ValueError):
+        index.add(0, "b")
+
+
+def test_rrf_rewards_agreement_between_retrievers():
+    fused = reciprocal_rank_fusion([[1, 2, 3], [3, 1, 4]], k=60)
+    ids = [doc_id for doc_id, _ in fused]
+    assert ids[:2] == [1, 3]
+    assert set(ids) == {1, 2, 3, 4}
+    assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+
+def test_rrf_weights():
+    fused = reciprocal_rank_fusion([[1], [2]], k=0, weights=[1.0, 3.0])
+    assert fused == [(2, 3.0), (1, 1.0)]
+
+
+async def test_hybrid_search_finds_exact_code_and_semantic_match(knowledge_base):
+    await knowledge_base.add_texts(
+        [
+            "AB-1234 모델의 보증 기간은 2년입니다",
+            "환불은 구매 후 7일 이내에 가능합니다",
+            "배송은 평균 3일이 걸립니다",
+        ],
+        [{"source": "a"}, {"source": "b"}, {"source": "c"}],
+    )
+
+    results = await knowledge_base.search("AB1234 보증", top_k=2, mode="hybrid")
+    assert results[0]["id"] == 0
+    assert results[0]["keyword_score"] is not None
+
+    keyword = await knowledge_base.search("환불", top_k=1, mode="keyword")
+    assert [result["source"] for result in keyword] == ["b"]
+
+    await knowledge_base.delete([0])
+    results = await knowledge_base.search("AB1234 보증", top_k=3)
+    assert 0 not in [result["id"] for result in results]
@@ -0,0 +1,58 @@
+"""크로스 인코더 재순위화 예산 테스트 (모델 없이 채점 시간을 조절)"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from ai.retrieval.rerank import CrossEncoderReranker
+
+pytestmark = pytest.mark.unit
+
+
+class FakeCrossEncoder:
+    def __init__(self, seconds_per_pair: float):
+        self.seconds_per_pair = seconds_per_pair
+
+    def predict(self, pairs, **kwargs):
+        time.sleep(self.seconds_per_pair * len(pairs))
+        return np.array([float(len(text)) for _, text in pairs])
+
+
+@pytest.fixture
+def model():
+    return FakeCrossEncoder(0.02)
+
+
+@pytest.fixture
+def reranker(model):
+    reranker = CrossEncoderReranker(model_name="fake", budget_ms=100)
+    reranker._model = model
+    return reranker
+
+
+def results(count: int):
+    return [{"id": i, "content": "x" * (i + 1)} for i in range(count)]
+
+
+async def test_reranks_within_budget(reranker):
+    reranked, applied = await reranker.rerank("query", results(3), top_k=2)
+    assert applied
+    assert [result["id"] for result in reranked] == [2, 1]
+
+
+async def test_reranking_recovers_after_a_slow_period(reranker, model):
+    # 느린 구간: 예산을 넘겨 1차 순서로 대체되고 추정치가 커짐
+    reranked, applied = await reranker.rerank("slow", results(20), top_k=5)
+    assert not applied
+    assert [result["id"] for result in reranked] == [0, 1, 2, 3, 4]
+
+    # 모델이 다시 빨라지면 건너뛰는 동안의 표본 채점으로 추정치가 줄어 재순위화가 다시 켜짐
+    model.seconds_per_pair = 0.001
+    for attempt in range(50):
+        _, applied = await reranker.rerank(f"query {attempt}", results(20), top_k=5)
+        if applied:
+            break
+        await asyncio.sleep(0.02)
+    assert applied
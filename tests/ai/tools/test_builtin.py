@@ -0,0 +1,46 @@
+"""기본 제공 도구 테스트"""
+
+import asyncio
+
+import pytest
+
+from ai.tools import current_tenant
+from ai.tools.builtin import MAX_SEARCH_RESULTS, search_knowledge
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def knowledge_base(knowledge_base, monkeypatch):
+    import ai.retrieval
+
+    await knowledge_base.add_texts(
+        [f"{tenant} 환불 정책 {i}" for tenant in ("acme", "globex") for i in range(30)],
+        [{"tenant": tenant} for tenant in ("acme", "globex") for _ in range(30)],
+    )
+    monkeypatch.setattr(ai.retrieval, "get_knowledge_base", lambda: knowledge_base)
+    return knowledge_base
+
+
+async def test_search_knowledge_is_scoped_to_callers_tenant(knowledge_base, monkeypatch):
+    searched = []
+    search = knowledge_base.search
+
+    async def spy(query, **kwargs):
+        results = await search(query, **kwargs)
+        searched.append(results)
+        return results
+
+    monkeypatch.setattr(knowledge_base, "search", spy)
+
+    async def run_as(tenant):
+        current_tenant.set(tenant)
+        return await search_knowledge.invoke({"query": "환불 정책", "top_k": 1000})
+
+    await asyncio.create_task(run_as("acme"))
+    assert searched[-1]
+    assert len(searched[-1]) <= MAX_SEARCH_RESULTS
+    assert all(result["metadata"]["tenant"] == "acme" for result in searched[-1])
+
+    # 테넌트가 없으면 공용 문서만 (여기서는 없음)
+    assert await asyncio.create_task(run_as(None)) == "검색 결과가 없습니다."
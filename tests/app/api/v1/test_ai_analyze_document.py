@@ -0,0 +1,122 @@
+"""문서 분석 엔드포인트 테스트"""
+
+import pytest
+
+from ai.documents import pipeline as pipeline_module
+from ai.embeddings import VectorStore
+from ai.retrieval import KnowledgeBase
+from app.api.v1.endpoints import ai as ai_endpoints
+from core.settings import settings
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(autouse=True)
+def work_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    monkeypatch.setattr(settings, "ANALYSIS_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "DOCUMENT_PARSER_WORK_DIR", str(tmp_path))
+    return tmp_path
+
+
+def analyze(client, **params):
+    return client.post(
+        "/api/v1/ai/analyze-document",
+        params=params,
+        files={"file": ("notes.txt", "문서 내용".encode(), "text/plain")},
+    )
+
+
+def test_unknown_provider_is_400_and_upload_removed(client, work_dir):
+    response = analyze(client, provider="unknown")
+    assert response.status_code == 400
+    assert list(work_dir.iterdir()) == []
+
+
+def test_upload_removed_when_ingestion_fails_before_reading(client, work_dir, monkeypatch):
+    class FailingPipeline:
+        async def run(self, text_stream, metadata):
+            raise ValueError("색인 실패")
+
+    monkeypatch.setattr(ai_endpoints, "IngestionPipeline", FailingPipeline)
+
+    response = analyze(client)
+    assert response.status_code == 422
+    assert list(work_dir.iterdir()) == []
+
+    response = analyze(client, analysis_type="keywords", stream=True)
+    assert '"type": "error"' in response.text
+    assert list(work_dir.iterdir()) == []
+
+
+class MemoryAnalysisCache:
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, cache_key):
+        return self.entries.get(cache_key)
+
+    async def set(self, cache_key, response, **kwargs):
+        self.entries[cache_key] = response
+
+
+class EchoSummarizeChain:
+    async def ainvoke(self, text_stream):
+        return "".join([piece async for piece in text_stream])
+
+
+@pytest.fixture
+def analysis_cache(monkeypatch):
+    cache = MemoryAnalysisCache()
+    monkeypatch.setattr(settings, "ANALYSIS_CACHE_ENABLED", True)
+    monkeypatch.setattr(ai_endpoints, "get_analysis_cache", lambda: cache)
+    # 요약 결과만 캐시되므로 LLM 없이 요약하는 체인 사용
+    monkeypatch.setattr(ai_endpoints, "get_summarize_chain", lambda **kwargs: EchoSummarizeChain())
+    return cache
+
+
+@pytest.fixture
+def use_knowledge_base(monkeypatch):
+    """엔드포인트와 수집 파이프라인이 함께 쓰는 지식 베이스 교체"""
+
+    def use(knowledge_base):
+        monkeypatch.setattr(ai_endpoints, "get_knowledge_base", lambda: knowledge_base)
+        monkeypatch.setattr(pipeline_module, "get_knowledge_base", lambda: knowledge_base)
+
+    return use
+
+
+def test_cached_analysis_is_scoped_by_tenant(
+    client, analysis_cache, knowledge_base, use_knowledge_base
+):
+    use_knowledge_base(knowledge_base)
+
+    client.user = "acme"
+    first = analyze(client).json()
+    assert not first["cached"] and first["chunks_indexed"] > 0
+    again = analyze(client).json()
+    assert again["cached"] and again["document_id"] == first["document_id"]
+
+    # 같은 파일이라도 다른 테넌트는 자신의 문서로 색인됨
+    client.user = "globex"
+    other = analyze(client).json()
+    assert not other["cached"] and other["document_id"] != first["document_id"]
+    assert knowledge_base.document_ids() == {first["document_id"], other["document_id"]}
+
+
+def test_cached_analysis_is_reindexed_when_document_is_gone(
+    client, analysis_cache, knowledge_base, use_knowledge_base, embedding_provider
+):
+    use_knowledge_base(knowledge_base)
+    client.user = "acme"
+    first = analyze(client).json()
+
+    # 재시작: 메모리 지식 베이스가 비어 있음
+    restarted = KnowledgeBase(
+        embedding_provider, vector_store=VectorStore(embedding_provider.embedding_dimension, "none")
+    )
+    use_knowledge_base(restarted)
+    response = analyze(client).json()
+    assert not response["cached"]
+    assert restarted.has_document(response["document_id"])
+    assert response["document_id"] != first["document_id"]
@@ -0,0 +1,72 @@
+"""MCP 도구 호출 엔드포인트 인증/허용 목록 테스트"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from ai.mcp import MCPManager
+from app.api.v1.endpoints import ai as ai_endpoints
+
+pytestmark = pytest.mark.integration
+
+FAKE_SERVER = str(Path(__file__).parents[3] / "ai" / "mcp" / "fake_server.py")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    config = tmp_path / "mcp_servers.json"
+    config.write_text(json.dumps({
+        "mcpServers": {
+            name: {"command": sys.executable, "args": [FAKE_SERVER]} for name in ("fake", "other")
+        }
+    }))
+    manager = MCPManager(str(config), allowed_servers=["fake"])
+    monkeypatch.setattr(ai_endpoints, "get_mcp_manager", lambda: manager)
+    return manager
+
+
+def call_tool(client, server: str):
+    return client.post(
+        "/api/v1/ai/mcp/call-tool",
+        params={"server": server, "tool": "sleep"},
+        json={"seconds": 0, "tag": "ok"},
+    )
+
+
+def test_tool_endpoints_require_authentication(client, manager):
+    assert call_tool(client, "fake").status_code == 401
+    response = client.post(
+        "/api/v1/ai/mcp/call-tools",
+        json={"calls": [{"server_name": "fake", "tool_name": "sleep", "parameters": {}}]},
+    )
+    assert response.status_code == 401
+    assert client.post("/api/v1/ai/agent", json={"message": "hi"}).status_code == 401
+    assert manager.pool("fake").status()["live_sessions"] == 0
+
+
+def test_servers_outside_allowlist_are_forbidden(client, manager):
+    client.user = "acme"
+    response = call_tool(client, "other")
+    assert response.status_code == 403
+    assert "MCP_ALLOWED_SERVERS" in response.json()["detail"]
+    assert manager.pool("fake").status()["live_sessions"] == 0
+
+    response = client.get("/api/v1/ai/mcp/servers")
+    allowed = {server["name"]: server["allowed"] for server in response.json()["servers"]}
+    assert allowed == {"fake": True, "other": False}
+
+
+def test_anonymous_callers_cannot_start_servers_or_see_commands(client, manager):
+    assert client.get("/api/v1/ai/mcp/servers/fake/tools").status_code == 401
+    assert manager.pool("fake").status()["live_sessions"] == 0
+
+    body = client.get("/api/v1/ai/mcp/servers").json()
+    assert body["config_path"] is None
+    assert all("command" not in server and "pids" not in server for server in body["servers"])
+
+    client.user = "acme"
+    body = client.get("/api/v1/ai/mcp/servers").json()
+    assert all(server["command"] == sys.executable for server in body["servers"])
+    assert all(server["pids"] == [] for server in body["servers"])
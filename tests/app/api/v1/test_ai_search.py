@@ -0,0 +1,62 @@
+"""지식 검색 엔드포인트 테스트"""
+
+from typing import Optional
+
+import pytest
+
+from app.api.v1.endpoints import ai as ai_endpoints
+from core.settings import settings
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(autouse=True)
+def knowledge_base_endpoint(knowledge_base, monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "local")
+    monkeypatch.setattr(ai_endpoints, "get_knowledge_base", lambda: knowledge_base)
+
+
+def search(client, user: Optional[str], **payload) -> tuple:
+    client.user = user
+    response = client.post("/api/v1/ai/search", json={"threshold": 0.0, **payload})
+    return response.status_code, response.json()
+
+
+async def test_search_only_returns_callers_tenant(client, knowledge_base):
+    await knowledge_base.add_texts(
+        ["acme 환불 정책", "globex 환불 정책", "공용 환불 정책"],
+        [{"tenant": "acme"}, {"tenant": "globex"}, {"tenant": None}],
+    )
+
+    status_code, body = search(client, "acme", query="환불 정책")
+    assert status_code == 200
+    assert [result["content"] for result in body["results"]] == ["acme 환불 정책"]
+
+    # 다른 테넌트를 요청 필터로 지정해도 볼 수 없음
+    _, body = search(
+        client, "acme", query="환불", filters=[{"field": "tenant", "value": "globex"}]
+    )
+    assert body["results"] == []
+
+    _, body = search(client, None, query="환불 정책")
+    assert [result["content"] for result in body["results"]] == ["공용 환불 정책"]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [{"field": "tenant", "value": ["acme"]}],
+        [{"field": "date", "op": "between", "value": "2024-01-01"}],
+        [{"field": "owner", "value": "x"}],
+    ],
+)
+async def test_malformed_filters_are_rejected_not_500(client, knowledge_base, filters):
+    await knowledge_base.add_texts(["문서"], [{"tenant": "acme"}])
+    status_code, _ = search(client, "acme", query="문서", filters=filters)
+    assert status_code == 422
+
+
+async def test_unknown_search_mode_is_400(client, knowledge_base):
+    await knowledge_base.add_texts(["문서"], [{"tenant": "acme"}])
+    status_code, _ = search(client, "acme", query="문서", mode="fuzzy")
+    assert status_code == 400
@@ -0,0 +1,38 @@
+"""API 테스트 픽스처"""
+
+from typing import Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import deps
+from app.main import app
+from core.security import create_credentials_exception
+
+
+class APIClient(TestClient):
+    """요청 사용자를 바꿔 가며 호출할 수 있는 테스트 클라이언트 (DB 없이)"""
+
+    user: Optional[str] = None
+
+
+@pytest.fixture
+def client():
+    test_client = APIClient(app)
+
+    async def current_user_optional() -> Optional[str]:
+        return test_client.user
+
+    async def current_user() -> str:
+        if test_client.user is None:
+            raise create_credentials_exception()
+        return test_client.user
+
+    async def no_db():
+        yield None
+
+    app.dependency_overrides[deps.get_current_user_optional] = current_user_optional
+    app.dependency_overrides[deps.get_current_user] = current_user
+    app.dependency_overrides[deps.get_db] = no_db
+    yield test_client
+    app.dependency_overrides.clear()
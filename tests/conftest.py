@@ -0,0 +1,64 @@
+"""공통 테스트 픽스처"""
+
+import hashlib
+from typing import List
+
+import numpy as np
+import pytest
+
+from ai.providers.base import BaseEmbeddingProvider
+from ai.retrieval.tokenizer import tokenize
+
+
+class FakeEmbeddingProvider(BaseEmbeddingProvider):
+    """토큰 해시 기반의 결정적 임베딩 (네트워크/모델 없이 검색 테스트용)"""
+
+    def __init__(self, dimension: int = 64):
+        super().__init__(api_key="test")
+        self._dimension = dimension
+        self.calls = 0
+
+    def embed(self, text: str) -> List[float]:
+        vector = np.zeros(self._dimension, dtype=np.float32)
+        for token in tokenize(text) or [text]:
+            digest = hashlib.md5(token.encode()).digest()
+            vector[int.from_bytes(digest[:4], "little") % self._dimension] += 1.0
+        vector[0] += 1e-3
+        return vector.tolist()
+
+    def get_embeddings(self, **kwargs):
+        raise NotImplementedError
+
+    async def embed_text(self, text: str, **kwargs) -> List[float]:
+        self.calls += 1
+        return self.embed(text)
+
+    async def embed_documents(self, texts: List[str], **kwargs) -> List[List[float]]:
+        self.calls += 1
+        return [self.embed(text) for text in texts]
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+    @property
+    def available_models(self) -> List[str]:
+        return ["fake"]
+
+    @property
+    def embedding_dimension(self) -> int:
+        return self._dimension
+
+
+@pytest.fixture
+def embedding_provider() -> FakeEmbeddingProvider:
+    return FakeEmbeddingProvider()
+
+
+@pytest.fixture
+def knowledge_base(embedding_provider):
+    from ai.embeddings import VectorStore
+    from ai.retrieval import KnowledgeBase
+
+    store = VectorStore(embedding_provider.embedding_dimension, "none")
+    return KnowledgeBase(embedding_provider, vector_store=store)
@@ -0,0 +1,36 @@
+"""데이터베이스 엔진 초기화 테스트"""
+
+import pytest
+from sqlalchemy import text
+
+from core import database
+from core.database import build_database_url
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    ("is_async", "expected"),
+    [(False, "sqlite:///./app.db"), (True, "sqlite+aiosqlite:///./app.db")],
+)
+def test_sqlite_url(is_async, expected):
+    url = build_database_url("sqlite", None, None, None, None, None, is_async=is_async, sqlite_path="./app.db")
+    assert url == expected
+
+
+async def test_engine_is_created_lazily_and_disposed(tmp_path, monkeypatch):
+    monkeypatch.setattr(database.settings, "DB_TYPE", "sqlite")
+    monkeypatch.setattr(database.settings, "SQLITE_DATABASE_PATH", str(tmp_path / "lazy.db"))
+    monkeypatch.setattr(database.settings, "DB_REPLICA_HOSTS", "")
+    await database.dispose_db()
+
+    assert database.async_engine is None
+    engine = database.init_db()
+    assert database.init_db() is engine
+
+    async for session in database.get_async_db():
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+    assert await database.check_db_connection()
+
+    await database.dispose_db()
+    assert database.async_engine is None and database.AsyncSessionLocal is None
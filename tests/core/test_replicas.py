@@ -0,0 +1,114 @@
+"""읽기 복제본 라우팅 테스트"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core import replicas as replicas_module
+from core.replicas import LEAST_CONNECTIONS, Replica, ReplicaRouter, RoutingSession
+
+pytestmark = pytest.mark.unit
+
+
+def fake_replica(name, connections=0, healthy=True):
+    return SimpleNamespace(name=name, connections=connections, healthy=healthy, last_error=None)
+
+
+class HangingEngine:
+    """연결 수립이 끝나지 않는 엔진"""
+
+    @asynccontextmanager
+    async def connect(self):
+        await asyncio.Event().wait()
+        yield
+
+    async def dispose(self):
+        pass
+
+
+@pytest.fixture
+async def engines(tmp_path):
+    """주 DB와 복제본 sqlite 엔진 (복제본마다 다른 값을 저장)"""
+    created = {}
+    for name in ("primary", "replica"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE source (name TEXT)"))
+            await conn.execute(text("INSERT INTO source VALUES (:name)"), {"name": name})
+        created[name] = engine
+    yield created
+    for engine in created.values():
+        await engine.dispose()
+
+
+def test_round_robin_skips_unhealthy_replicas():
+    a, b, c = fake_replica("a"), fake_replica("b", healthy=False), fake_replica("c")
+    router = ReplicaRouter([a, b, c])
+    assert [router.choose().name for _ in range(4)] == ["a", "c", "a", "c"]
+
+
+def test_least_connections():
+    router = ReplicaRouter(
+        [fake_replica("a", 3), fake_replica("b", 1), fake_replica("c", 2)], strategy=LEAST_CONNECTIONS
+    )
+    assert router.choose().name == "b"
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        ReplicaRouter([], strategy="random")
+
+
+def test_sticky_window_reads_own_writes_from_primary(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(replicas_module.time, "monotonic", lambda: now[0])
+    router = ReplicaRouter([fake_replica("a")], sticky_window=5.0)
+
+    router.mark_write("client")
+    assert router.choose("client") is None
+    assert router.choose("other").name == "a"
+
+    now[0] += 6
+    assert router.choose("client").name == "a"
+    assert router.status()["sticky_clients"] == 0
+
+
+async def test_hung_replica_is_removed_and_reads_fall_back_to_primary(engines):
+    healthy = Replica("replica", engines["replica"])
+    hung = Replica("hung", HangingEngine())
+    router = ReplicaRouter([hung, healthy], health_timeout=0.05)
+
+    await asyncio.wait_for(router.check_health(), 1)
+    assert healthy.healthy and not hung.healthy
+    assert hung.last_error == "TimeoutError"
+    assert {router.choose() for _ in range(3)} == {healthy}
+
+    healthy.healthy = False
+    assert router.choose() is None
+
+
+async def test_routing_session_reads_replica_until_it_writes(engines):
+    replica = Replica("replica", engines["replica"])
+    router = ReplicaRouter([replica])
+    sessions = async_sessionmaker(
+        engines["primary"], sync_session_class=RoutingSession, info={"router": router}
+    )
+    read_source = text("SELECT name FROM source ORDER BY rowid LIMIT 1")
+
+    async with sessions(info={"replica": router.choose("client"), "sticky_key": "client"}) as session:
+        assert (await session.execute(read_source)).scalar() == "replica"
+
+        await session.execute(text("INSERT INTO source VALUES ('written')"))
+        # 쓰기 이후의 읽기는 주 DB에서
+        assert (await session.execute(read_source)).scalar() == "primary"
+        await session.commit()
+
+    assert router.choose("client") is None
+
+    # 복제본이 없으면(None) 주 DB에서 읽음
+    async with sessions(info={"replica": None}) as session:
+        assert (await session.execute(read_source)).scalar() == "primary"